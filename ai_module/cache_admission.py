@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Politica de admissao do cache de modelos (estilo TinyLFU).
+Um count-min sketch estima a frequencia recente de cada produto; objetos
+grandes so entram no cache compartilhado quando sao requisitados com
+frequencia suficiente para justificar a memoria que ocupam.
+"""
+
+import hashlib
+import math
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict
+
+
+class CountMinSketch:
+    """Count-min sketch com contadores saturados e envelhecimento periodico."""
+
+    def __init__(self, width: int = 1024, depth: int = 4, max_count: int = 15, sample_size: int = None):
+        self.width = width
+        self.depth = depth
+        self.max_count = max_count
+        # Apos `sample_size` incrementos todos os contadores sao divididos por 2,
+        # para que a frequencia reflita apenas o historico recente
+        self.sample_size = sample_size or width * 10
+        self.table = [[0] * width for _ in range(depth)]
+        self.additions = 0
+
+    def _indexes(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=self.depth * 4).digest()
+        for row in range(self.depth):
+            yield row, int.from_bytes(digest[row * 4:(row + 1) * 4], 'little') % self.width
+
+    def increment(self, item: str):
+        for row, index in self._indexes(item):
+            if self.table[row][index] < self.max_count:
+                self.table[row][index] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.reset()
+
+    def estimate(self, item: str) -> int:
+        return min(self.table[row][index] for row, index in self._indexes(item))
+
+    def reset(self):
+        for row in self.table:
+            for i in range(len(row)):
+                row[i] >>= 1
+        self.additions //= 2
+
+
+class TinyLFUAdmission:
+    """
+    Decide se um objeto deve ser admitido no cache compartilhado.
+
+    Objetos ate `small_object_bytes` sao sempre admitidos. Acima disso a
+    frequencia exigida cresce com o log2 do tamanho: um modelo 4x maior que
+    o limite precisa de 3 acessos recentes para ser admitido.
+    """
+
+    def __init__(self, small_object_bytes: int = None, min_frequency: int = None, sketch: CountMinSketch = None):
+        self.small_object_bytes = int(small_object_bytes or os.getenv('CACHE_ADMISSION_SMALL_BYTES', 256 * 1024))
+        self.min_frequency = int(min_frequency if min_frequency is not None
+                                 else os.getenv('CACHE_ADMISSION_MIN_FREQUENCY', 1))
+        self.sketch = sketch or CountMinSketch()
+        self.enabled = os.getenv('CACHE_ADMISSION_ENABLED', 'true').lower() == 'true'
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._admitted = 0
+        self._rejected = 0
+
+    @contextmanager
+    def untracked(self):
+        """
+        Acessos feitos pela thread atual dentro do bloco nao alimentam o
+        sketch (ex.: warm-up), que deve refletir apenas o trafego real.
+        """
+        previous = getattr(self._local, 'untracked', False)
+        self._local.untracked = True
+        try:
+            yield
+        finally:
+            self._local.untracked = previous
+
+    def record_access(self, item: str):
+        if getattr(self._local, 'untracked', False):
+            return
+        with self._lock:
+            self.sketch.increment(item)
+
+    def required_frequency(self, size_bytes: int) -> int:
+        if size_bytes <= self.small_object_bytes:
+            return 0
+        ratio = size_bytes / self.small_object_bytes
+        required = self.min_frequency + math.ceil(math.log2(ratio))
+        return min(required, self.sketch.max_count)
+
+    def should_admit(self, item: str, size_bytes: int) -> bool:
+        if not self.enabled:
+            return True
+
+        with self._lock:
+            admitted = self.sketch.estimate(item) >= self.required_frequency(size_bytes)
+            if admitted:
+                self._admitted += 1
+            else:
+                self._rejected += 1
+            return admitted
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'small_object_bytes': self.small_object_bytes,
+                'min_frequency': self.min_frequency,
+                'admitted': self._admitted,
+                'rejected': self._rejected
+            }
+
+
+# Instancia global usada pelo ModelCache
+model_admission = TinyLFUAdmission()
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Backends de cache plugaveis para o sistema de IA.
+Define a interface comum usada pelo ModelCache e um backend local em
+disco (SQLite) que sobrevive a reinicios e e compartilhado entre os
+workers de um mesmo host.
+"""
+
+import abc
+import hashlib
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import model_format
+from cache_metrics import cache_metrics, namespace_from_key
+
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SQLITE_PATH = os.path.join(SCRIPT_DIR, 'cache', 'ai_cache.sqlite3')
+
+
+class CacheBackend(abc.ABC):
+    """
+    Interface comum dos backends de cache.
+
+    Todas as operacoes devem falhar de forma graceful: com o backend
+    indisponivel, `get` retorna None e as escritas retornam False/0.
+    """
+
+    name = 'none'
+
+    def __init__(self):
+        self.enabled = False
+
+    def _generate_key(self, prefix: str, *args, **kwargs) -> str:
+        """Gera chave unica para o cache."""
+        # Combina argumentos e cria hash; o prefixo fica legivel para permitir
+        # limpeza por padrao (ex.: ai_module:model:*)
+        content = f"{prefix}:{str(args)}:{str(sorted(kwargs.items()))}"
+        return f"ai_module:{prefix}:{hashlib.md5(content.encode()).hexdigest()}"
+
+    def serialize(self, value: Any) -> bytes:
+        # Modelos servidos vao no formato compacto (JSON + arrays); o resto em pickle
+        if model_format.model_type(value) is not None:
+            return model_format.to_bytes(value)
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def deserialize(self, data: bytes) -> Any:
+        if model_format.is_compact(data):
+            return model_format.from_bytes(data)
+        return pickle.loads(data)
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Recupera item do cache (None se ausente, expirado ou com erro)."""
+
+    def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
+        """Armazena item no cache com TTL."""
+        if not self.enabled:
+            return False
+
+        try:
+            serialized_data = self.serialize(value)
+        except Exception as e:
+            logger.error(f"Erro ao serializar item do cache: {e}")
+            return False
+        return self.set_raw(key, serialized_data, ttl)
+
+    @abc.abstractmethod
+    def set_raw(self, key: str, serialized_data: bytes, ttl: int = 3600) -> bool:
+        """Armazena bytes ja serializados (usado pelo ModelCache para medir tamanhos)."""
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> bool:
+        """Remove item do cache."""
+
+    @abc.abstractmethod
+    def clear_pattern(self, pattern: str) -> int:
+        """Remove todos os itens que correspondem ao padrao glob."""
+
+    @abc.abstractmethod
+    def count_keys(self, pattern: str) -> int:
+        """Conta as chaves validas que correspondem ao padrao glob."""
+
+    @abc.abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna estatisticas do cache."""
+
+
+class SQLiteCache(CacheBackend):
+    """
+    Cache persistente em arquivo SQLite.
+
+    Usa WAL para permitir leituras concorrentes de varios processos e uma
+    conexao por thread/processo. Padroes de limpeza seguem a sintaxe glob
+    do Redis (`*`, `?`, `[...]`), suportada nativamente pelo GLOB do SQLite.
+    """
+
+    name = 'sqlite'
+
+    # A cada N escritas remove entradas expiradas e aplica o limite de tamanho
+    MAINTENANCE_INTERVAL = 200
+    # Leituras nao escrevem no arquivo: accessed_at e gravado em lote a cada
+    # N acertos (ou antes da manutencao), fora do caminho quente do get
+    ACCESS_FLUSH_INTERVAL = 256
+
+    def __init__(self, path: Optional[str] = None, max_size_mb: Optional[float] = None):
+        super().__init__()
+        self.path = path or os.getenv('CACHE_SQLITE_PATH', DEFAULT_SQLITE_PATH)
+        self.max_size_bytes = int(float(max_size_mb or os.getenv('CACHE_SQLITE_MAX_MB', 512)) * 1024 * 1024)
+        self._local = threading.local()
+        self._writes = 0
+        self._accessed: Dict[str, float] = {}
+        self._accessed_lock = threading.Lock()
+        self._hits = 0
+        self._connect()
+
+    def _connect(self):
+        """Cria o arquivo e o schema do cache."""
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            conn = self._connection()
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                " key TEXT PRIMARY KEY,"
+                " value BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache (expires_at)")
+            conn.commit()
+            self.enabled = True
+            logger.info(f" Cache SQLite ativo: {self.path}")
+        except Exception as e:
+            logger.warning(f" Cache SQLite indisponivel: {e}. Funcionando sem cache.")
+            self.enabled = False
+
+    def _connection(self) -> sqlite3.Connection:
+        """Conexao por thread, recriada apos fork (workers gunicorn/multiprocessing)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or getattr(self._local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, key: str) -> Optional[Any]:
+        """Recupera item do cache."""
+        if not self.enabled:
+            return None
+
+        try:
+            now = time.time()
+            row = self._connection().execute(
+                "SELECT value FROM cache WHERE key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+            if row is None:
+                return None
+            self._record_access(key, now)
+            return self.deserialize(row[0])
+        except Exception as e:
+            logger.error(f"Erro ao ler do cache: {e}")
+            return None
+
+    def _record_access(self, key: str, now: float):
+        """Acumula o horario de acesso em memoria; grava em lote a cada N acertos."""
+        with self._accessed_lock:
+            self._accessed[key] = now
+            self._hits += 1
+            if self._hits % self.ACCESS_FLUSH_INTERVAL:
+                return
+        self.flush_access_times()
+
+    def flush_access_times(self) -> int:
+        """Grava os horarios de acesso pendentes numa unica transacao."""
+        with self._accessed_lock:
+            pending, self._accessed = self._accessed, {}
+        if not pending or not self.enabled:
+            return 0
+
+        conn = self._connection()
+        try:
+            conn.execute("BEGIN")
+            # Nunca retrocede o horario gravado por outro processo
+            conn.executemany(
+                "UPDATE cache SET accessed_at = ? WHERE key = ? AND accessed_at < ?",
+                [(accessed_at, key, accessed_at) for key, accessed_at in pending.items()]
+            )
+            conn.execute("COMMIT")
+            return len(pending)
+        except Exception as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.error(f"Erro ao gravar acessos do cache: {e}")
+            return 0
+
+    def set_raw(self, key: str, serialized_data: bytes, ttl: int = 3600) -> bool:
+        """Armazena item serializado no cache com TTL."""
+        if not self.enabled:
+            return False
+
+        try:
+            now = time.time()
+            self._connection().execute(
+                "INSERT OR REPLACE INTO cache (key, value, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, sqlite3.Binary(serialized_data), len(serialized_data), now + ttl, now)
+            )
+            logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
+
+            self._writes += 1
+            if self._writes % self.MAINTENANCE_INTERVAL == 0:
+                self.purge()
+            return True
+        except Exception as e:
+            logger.error(f"Erro ao escrever no cache: {e}")
+            return False
+
+    def delete(self, key: str) -> bool:
+        """Remove item do cache."""
+        if not self.enabled:
+            return False
+
+        try:
+            result = self._connection().execute("DELETE FROM cache WHERE key = ?", (key,)).rowcount > 0
+            logger.debug(f"Cache delete: {key}")
+            return result
+        except Exception as e:
+            logger.error(f"Erro ao deletar do cache: {e}")
+            return False
+
+    def clear_pattern(self, pattern: str) -> int:
+        """Remove todos os itens que correspondem ao padrao."""
+        if not self.enabled:
+            return 0
+
+        try:
+            deleted = self._connection().execute("DELETE FROM cache WHERE key GLOB ?", (pattern,)).rowcount
+            if deleted:
+                logger.info(f"Cache cleared: {deleted} keys matching '{pattern}'")
+            return deleted
+        except Exception as e:
+            logger.error(f"Erro ao limpar cache: {e}")
+            return 0
+
+    def count_keys(self, pattern: str) -> int:
+        """Conta as chaves validas que correspondem ao padrao."""
+        if not self.enabled:
+            return 0
+
+        try:
+            row = self._connection().execute(
+                "SELECT COUNT(*) FROM cache WHERE key GLOB ? AND expires_at > ?", (pattern, time.time())
+            ).fetchone()
+            return row[0]
+        except Exception as e:
+            logger.error(f"Erro ao contar chaves do cache: {e}")
+            return 0
+
+    def purge(self) -> int:
+        """Remove entradas expiradas e as menos acessadas acima do limite de tamanho."""
+        if not self.enabled:
+            return 0
+
+        self.flush_access_times()
+        try:
+            conn = self._connection()
+            now = time.time()
+            expired = [row[0] for row in conn.execute("SELECT key FROM cache WHERE expires_at <= ?", (now,))]
+            conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+            for key in expired:
+                cache_metrics.record_eviction(namespace_from_key(key))
+            removed = len(expired)
+
+            total_size = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+            if total_size > self.max_size_bytes:
+                excess = total_size - self.max_size_bytes
+                freed = 0
+                victims = []
+                for key, size in conn.execute("SELECT key, size FROM cache ORDER BY accessed_at ASC"):
+                    victims.append((key,))
+                    freed += size
+                    if freed >= excess:
+                        break
+                conn.executemany("DELETE FROM cache WHERE key = ?", victims)
+                for (key,) in victims:
+                    cache_metrics.record_eviction(namespace_from_key(key))
+                removed += len(victims)
+                logger.info(f"Cache SQLite acima do limite: {len(victims)} entradas removidas")
+            return removed
+        except Exception as e:
+            logger.error(f"Erro na manutencao do cache: {e}")
+            return 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna estatisticas do cache."""
+        if not self.enabled:
+            return {"enabled": False, "backend": self.name, "error": "Cache SQLite nao disponivel"}
+
+        try:
+            entries, used_bytes = self._connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache WHERE expires_at > ?", (time.time(),)
+            ).fetchone()
+            return {
+                "enabled": True,
+                "backend": self.name,
+                "path": self.path,
+                "entries": entries,
+                "used_memory_bytes": used_bytes,
+                "max_size_bytes": self.max_size_bytes,
+                "file_size_bytes": os.path.getsize(self.path) if os.path.exists(self.path) else 0,
+                "ai_module_keys": self.count_keys("ai_module:*")
+            }
+        except Exception as e:
+            logger.error(f"Erro ao obter estatisticas: {e}")
+            return {"enabled": False, "backend": self.name, "error": str(e)}
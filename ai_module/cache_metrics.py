@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Metricas client-side do cache, separadas por namespace (model, prediction
+e products_list). Diferente das estatisticas globais do servidor Redis, que
+misturam todos os tenants, aqui so entram as operacoes deste modulo.
+O namespace model_pack (cargas pelo pacote de modelos mapeado) e
+registrado diretamente por model_pack.load_packed_model, sem chave Redis.
+"""
+
+import bisect
+import threading
+from typing import Any, Dict, List, Optional
+
+# Limites superiores dos buckets dos histogramas
+LATENCY_BUCKETS_MS = [0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000]
+SIZE_BUCKETS_BYTES = [1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, 67108864]
+
+KNOWN_NAMESPACES = ('model', 'prediction', 'products_list', 'model_pack')
+
+
+def namespace_from_key(key: str) -> str:
+    """Extrai o namespace de chaves no formato ai_module:<namespace>:..."""
+    parts = key.split(':')
+    if len(parts) >= 3 and parts[0] == 'ai_module' and parts[1] in KNOWN_NAMESPACES:
+        return parts[1]
+    return 'other'
+
+
+class Histogram:
+    """Histograma de buckets fixos com contagem, soma e maximo."""
+
+    def __init__(self, bounds: List[float]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Aproximacao do quantil pelo limite superior do bucket."""
+        if self.count == 0:
+            return None
+        target = q * self.count
+        cumulative = 0
+        for i, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return self.bounds[i] if i < len(self.bounds) else self.max
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        buckets = {f"le_{bound:g}": count for bound, count in zip(self.bounds, self.counts)}
+        buckets['le_inf'] = self.counts[-1]
+        return {
+            'count': self.count,
+            'avg': round(self.total / self.count, 3) if self.count else None,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+            'max': round(self.max, 3),
+            'buckets': buckets
+        }
+
+
+class CacheMetrics:
+    """Contadores e histogramas por namespace, thread-safe."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._namespaces: Dict[str, Dict[str, Any]] = {}
+
+    def _ns(self, namespace: str) -> Dict[str, Any]:
+        ns = self._namespaces.get(namespace)
+        if ns is None:
+            ns = {
+                'hits': 0,
+                'misses': 0,
+                'sets': 0,
+                'set_failures': 0,
+                'invalidations': 0,
+                'evictions': 0,
+                'admission_rejects': 0,
+                'rejected_bytes': 0,
+                'get_latency_ms': Histogram(LATENCY_BUCKETS_MS),
+                'set_latency_ms': Histogram(LATENCY_BUCKETS_MS),
+                'size_bytes': Histogram(SIZE_BUCKETS_BYTES)
+            }
+            self._namespaces[namespace] = ns
+        return ns
+
+    def record_get(self, namespace: str, hit: bool, latency_ms: float):
+        with self._lock:
+            ns = self._ns(namespace)
+            ns['hits' if hit else 'misses'] += 1
+            ns['get_latency_ms'].observe(latency_ms)
+
+    def record_set(self, namespace: str, success: bool, latency_ms: float, size_bytes: int):
+        with self._lock:
+            ns = self._ns(namespace)
+            ns['sets' if success else 'set_failures'] += 1
+            ns['set_latency_ms'].observe(latency_ms)
+            ns['size_bytes'].observe(size_bytes)
+
+    def record_rejection(self, namespace: str, size_bytes: int):
+        """Objetos recusados pela politica de admissao."""
+        with self._lock:
+            ns = self._ns(namespace)
+            ns['admission_rejects'] += 1
+            ns['rejected_bytes'] += size_bytes
+
+    def record_invalidation(self, namespace: str, count: int = 1):
+        """Remocoes pedidas pelo cliente (delete/clear_pattern)."""
+        if count:
+            with self._lock:
+                self._ns(namespace)['invalidations'] += count
+
+    def record_eviction(self, namespace: str, count: int = 1):
+        """Remocoes feitas pelo proprio backend (expiracao/limite de tamanho)."""
+        if count:
+            with self._lock:
+                self._ns(namespace)['evictions'] += count
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            result = {}
+            for namespace, ns in sorted(self._namespaces.items()):
+                lookups = ns['hits'] + ns['misses']
+                result[namespace] = {
+                    'hits': ns['hits'],
+                    'misses': ns['misses'],
+                    'hit_ratio': round(ns['hits'] / lookups, 4) if lookups else None,
+                    'sets': ns['sets'],
+                    'set_failures': ns['set_failures'],
+                    'invalidations': ns['invalidations'],
+                    'evictions': ns['evictions'],
+                    'admission_rejects': ns['admission_rejects'],
+                    'rejected_bytes': ns['rejected_bytes'],
+                    'get_latency_ms': ns['get_latency_ms'].to_dict(),
+                    'set_latency_ms': ns['set_latency_ms'].to_dict(),
+                    'size_bytes': ns['size_bytes'].to_dict()
+                }
+            return result
+
+    def reset(self):
+        with self._lock:
+            self._namespaces.clear()
+
+
+# Instancia global das metricas do cache
+cache_metrics = CacheMetrics()
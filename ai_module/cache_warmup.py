@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Warm-up do cache guiado por popularidade.
+Combina o manifesto de modelos com estatisticas recentes de acesso para
+pre-carregar modelos e predicoes dos produtos mais requisitados, em
+paralelo e dentro de um orcamento de tempo e memoria.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import psutil
+
+from cache_admission import model_admission
+from model_manifest import MODELS_DIR, atomic_write, file_lock, list_manifest_products
+from product_name_utils import normalize_product_name
+
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_ACCESS_STATS_PATH = os.path.join(SCRIPT_DIR, 'cache', 'access_stats.json')
+
+# Um modelo Prophet desserializado ocupa mais memoria que o arquivo em disco
+MODEL_MEMORY_FACTOR = 3.0
+
+
+class AccessTracker:
+    """
+    Contadores de acesso por produto e horizonte com decaimento exponencial.
+
+    Os incrementos ficam em memoria e sao mesclados periodicamente no arquivo
+    JSON compartilhado, que sobrevive a reinicios e e lido pelo planner. A
+    mesclagem (ler, somar, regravar) roda sob um lock de arquivo, para que
+    workers concorrentes nao percam os incrementos uns dos outros.
+    """
+
+    def __init__(self, path: Optional[str] = None, half_life_hours: Optional[float] = None,
+                 flush_interval: float = 60.0):
+        self.path = path or os.getenv('CACHE_ACCESS_STATS_PATH', DEFAULT_ACCESS_STATS_PATH)
+        self.half_life = float(half_life_hours or os.getenv('CACHE_ACCESS_HALF_LIFE_HOURS', 24)) * 3600
+        self.flush_interval = flush_interval
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._last_flush = time.time()
+        self._lock = threading.Lock()
+
+    def record(self, product_name: str, days_ahead: int = 1):
+        """Registra um acesso de predicao."""
+        normalized_name = normalize_product_name(product_name)
+        if not normalized_name:
+            return
+
+        with self._lock:
+            entry = self._pending.setdefault(normalized_name, {'score': 0.0, 'horizons': {}})
+            entry['score'] += 1
+            horizon = str(int(days_ahead))
+            entry['horizons'][horizon] = entry['horizons'].get(horizon, 0) + 1
+            should_flush = time.time() - self._last_flush >= self.flush_interval
+
+        if should_flush:
+            self.flush()
+
+    def _decay(self, value: float, elapsed: float) -> float:
+        if self.half_life <= 0:
+            return value
+        return value * 0.5 ** (elapsed / self.half_life)
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'updated_at': time.time(), 'products': {}}
+
+    def flush(self):
+        """Mescla os incrementos pendentes no arquivo de estatisticas."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.time()
+
+        if not pending:
+            return
+
+        try:
+            with file_lock(self.path):
+                stats = self.snapshot()
+                for normalized_name, delta in pending.items():
+                    entry = stats['products'].setdefault(normalized_name, {'score': 0.0, 'horizons': {}})
+                    entry['score'] += delta['score']
+                    for horizon, count in delta['horizons'].items():
+                        entry['horizons'][horizon] = entry['horizons'].get(horizon, 0) + count
+                atomic_write(self.path, json.dumps(stats))
+        except Exception as e:
+            logger.warning(f"Erro ao salvar estatisticas de acesso: {e}")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Estatisticas persistidas, com decaimento aplicado ate agora."""
+        stats = self._read()
+        now = time.time()
+        elapsed = max(0.0, now - float(stats.get('updated_at', now)))
+
+        products = {}
+        for normalized_name, entry in stats.get('products', {}).items():
+            score = self._decay(float(entry.get('score', 0)), elapsed)
+            if score < 0.01:
+                continue
+            products[normalized_name] = {
+                'score': score,
+                'horizons': {
+                    h: self._decay(float(c), elapsed) for h, c in entry.get('horizons', {}).items()
+                }
+            }
+        return {'updated_at': now, 'products': products}
+
+    def get_scores(self) -> Dict[str, Dict[str, Any]]:
+        """Estatisticas persistidas somadas aos incrementos ainda pendentes."""
+        products = self.snapshot()['products']
+        with self._lock:
+            for normalized_name, delta in self._pending.items():
+                entry = products.setdefault(normalized_name, {'score': 0.0, 'horizons': {}})
+                entry['score'] += delta['score']
+                for horizon, count in delta['horizons'].items():
+                    entry['horizons'][horizon] = entry['horizons'].get(horizon, 0) + count
+        return products
+
+
+class WarmUpPlanner:
+    """Ordena os produtos do manifesto por popularidade e aplica o orcamento de memoria."""
+
+    def __init__(self, models_dir: str = MODELS_DIR, tracker: Optional[AccessTracker] = None,
+                 default_horizon: int = 30, max_horizons: int = 3):
+        self.models_dir = models_dir
+        self.tracker = tracker or access_tracker
+        self.default_horizon = default_horizon
+        self.max_horizons = max_horizons
+
+    def plan(self, memory_budget_mb: float, horizon: Optional[int] = None,
+             products: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Plano de warm-up; `products` restringe o plano a esses produtos."""
+        scores = self.tracker.get_scores()
+        only = {normalize_product_name(p) for p in products} if products is not None else None
+        products = [p for p in list_manifest_products(self.models_dir)
+                    if only is None or p['normalized_name'] in only]
+
+        # Mais requisitados primeiro; empate resolvido pelo nome (plano deterministico)
+        products.sort(key=lambda p: (-scores.get(p['normalized_name'], {}).get('score', 0.0),
+                                     p['normalized_name']))
+
+        budget_bytes = memory_budget_mb * 1024 * 1024
+        planned, skipped = [], []
+        used_bytes = 0.0
+        for product in products:
+            estimated = product['size_bytes'] * MODEL_MEMORY_FACTOR
+            if used_bytes + estimated > budget_bytes:
+                skipped.append(product['normalized_name'])
+                continue
+            used_bytes += estimated
+
+            horizons = self._horizons_for(scores.get(product['normalized_name'], {}), horizon)
+            planned.append({
+                **product,
+                'score': round(scores.get(product['normalized_name'], {}).get('score', 0.0), 3),
+                'estimated_bytes': int(estimated),
+                'horizons': horizons
+            })
+
+        return {'products': planned, 'skipped_memory': skipped, 'estimated_bytes': int(used_bytes)}
+
+    def _horizons_for(self, stats: Dict[str, Any], horizon: Optional[int]) -> List[int]:
+        """Horizontes mais pedidos do produto, sempre incluindo o horizonte completo."""
+        full_horizon = int(horizon or self.default_horizon)
+        observed = sorted(stats.get('horizons', {}).items(), key=lambda item: -item[1])
+        horizons = {full_horizon}
+        for h, _ in observed[:self.max_horizons]:
+            horizons.add(int(h))
+        return sorted(horizons)
+
+
+# Progresso do ultimo warm-up, exposto em /api/ai/cache/info
+_progress: Dict[str, Any] = {'status': 'idle'}
+_progress_lock = threading.Lock()
+
+
+def _update_progress(**fields):
+    with _progress_lock:
+        _progress.update(fields)
+
+
+def get_warm_up_progress() -> Dict[str, Any]:
+    with _progress_lock:
+        return dict(_progress)
+
+
+def _warm_product(product: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Carrega o modelo e materializa as predicoes de todos os horizontes
+    planejados. Sem modelo ou predicoes nada e gravado e o produto conta
+    como falha.
+    """
+    from ai_service import load_model, generate_predictions, PREDICTION_CACHE_PARAMS
+    from error_handling import ModelLoadError
+    from redis_cache import ModelCache
+
+    start = time.time()
+    # Cargas do warm-up nao contam como acessos na politica de admissao
+    with model_admission.untracked():
+        model = load_model(product['normalized_name'])
+    if model is None:
+        raise ModelLoadError(f"Modelo indisponivel para {product['normalized_name']}")
+    full_horizon = max(product['horizons'])
+    predictions = generate_predictions(product['normalized_name'], full_horizon, model=model)
+    if not predictions:
+        raise ModelLoadError(f"Sem predicoes para {product['normalized_name']}")
+
+    # Predicoes de horizontes menores sao prefixos da predicao completa
+    for horizon in product['horizons']:
+        ModelCache.set_prediction(
+            product['normalized_name'], horizon, predictions[:horizon], **PREDICTION_CACHE_PARAMS
+        )
+    return {'product': product['normalized_name'], 'duration_s': round(time.time() - start, 3)}
+
+
+def run_warm_up(time_budget: Optional[float] = None, memory_budget_mb: Optional[float] = None,
+                workers: Optional[int] = None, horizon: Optional[int] = None,
+                models_dir: str = MODELS_DIR, products: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Executa o warm-up de modelos e predicoes dentro dos orcamentos configurados.
+    `products` limita o warm-up a esses produtos (ex.: recem-retreinados).
+    """
+    time_budget = float(time_budget or os.getenv('CACHE_WARMUP_TIME_BUDGET', 60))
+    memory_budget_mb = float(memory_budget_mb or os.getenv('CACHE_WARMUP_MEMORY_MB', 512))
+    workers = int(workers or os.getenv('CACHE_WARMUP_WORKERS', 4))
+    horizon = int(horizon or os.getenv('CACHE_WARMUP_HORIZON', 30))
+
+    from redis_cache import get_cache
+    if not get_cache().enabled:
+        logger.info("Cache nao disponivel, pulando warm-up")
+        _update_progress(status='skipped', reason='cache_disabled', finished_at=datetime.now().isoformat())
+        return get_warm_up_progress()
+
+    plan = WarmUpPlanner(models_dir).plan(memory_budget_mb, horizon=horizon, products=products)
+    queue = list(plan['products'])
+    _update_progress(
+        status='running',
+        started_at=datetime.now().isoformat(),
+        finished_at=None,
+        planned=len(queue),
+        completed=0,
+        failed=0,
+        skipped_memory=list(plan['skipped_memory']),
+        skipped_time=[],
+        current=[],
+        budget={'time_s': time_budget, 'memory_mb': memory_budget_mb, 'workers': workers, 'horizon': horizon}
+    )
+    logger.info(f" Iniciando warm-up do cache: {len(queue)} produtos planejados")
+
+    deadline = time.time() + time_budget
+    process = psutil.Process()
+    rss_start = process.memory_info().rss
+    memory_limit = memory_budget_mb * 1024 * 1024
+    completed, failed, running = [], [], {}
+    skipped_memory, skipped_time = list(plan['skipped_memory']), []
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        while queue or running:
+            if queue and process.memory_info().rss - rss_start > memory_limit:
+                # Memoria real excedeu o orcamento: nao inicia novos produtos
+                skipped_memory.extend(p['normalized_name'] for p in queue)
+                queue.clear()
+            if queue and time.time() >= deadline:
+                skipped_time.extend(p['normalized_name'] for p in queue)
+                queue.clear()
+
+            while queue and len(running) < workers:
+                product = queue.pop(0)
+                running[executor.submit(_warm_product, product)] = product['normalized_name']
+
+            if not running:
+                break
+
+            # Espera no maximo ate o fim do orcamento para reavaliar a fila
+            timeout = max(0.1, deadline - time.time())
+            done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    completed.append(future.result())
+                except Exception as e:
+                    logger.warning(f"Erro ao pre-carregar {name}: {e}")
+                    failed.append({'product': name, 'error': str(e)})
+
+            _update_progress(
+                completed=len(completed), failed=len(failed), current=sorted(running.values()),
+                skipped_memory=skipped_memory, skipped_time=skipped_time
+            )
+
+    _update_progress(
+        status='completed',
+        finished_at=datetime.now().isoformat(),
+        completed=len(completed),
+        failed=len(failed),
+        failures=failed,
+        skipped_memory=skipped_memory,
+        skipped_time=skipped_time,
+        current=[],
+        products=completed,
+        rss_delta_mb=round((process.memory_info().rss - rss_start) / (1024 * 1024), 1)
+    )
+    logger.info(f" Warm-up concluido: {len(completed)}/{len(plan['products'])} produtos aquecidos")
+    return get_warm_up_progress()
+
+
+def start_warm_up(**kwargs) -> bool:
+    """Dispara o warm-up em background; retorna False se ja houver um em andamento."""
+    with _progress_lock:
+        if _progress.get('status') == 'running':
+            return False
+        _progress['status'] = 'running'
+
+    def _target():
+        try:
+            run_warm_up(**{k: v for k, v in kwargs.items() if v is not None})
+        except Exception as e:
+            logger.error(f"Erro durante warm-up: {e}")
+            _update_progress(status='failed', error=str(e), finished_at=datetime.now().isoformat())
+
+    threading.Thread(target=_target, name='cache-warm-up', daemon=True).start()
+    return True
+
+
+access_tracker = AccessTracker()
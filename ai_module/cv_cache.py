@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache dos resultados de validacao cruzada.
+A busca de hiperparametros avalia cada configuracao dobra a dobra e o
+trainer avalia de novo o modelo final com a mesma configuracao. As previsoes
+de cada dobra ficam gravadas por (dados, configuracao, horizonte, cutoff) e
+as metricas de cada avaliacao completa por (dados, configuracao, horizonte,
+cutoffs); uma avaliacao ja feita, inteira ou dobra a dobra, nao e refeita.
+
+O cache fica em memoria e em AI_CV_CACHE_DIR (um arquivo por entrada, escrito
+atomicamente, compartilhado entre os processos do pool de treino).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+import pandas as pd
+
+from model_manifest import compute_data_fingerprint
+
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CV_CACHE_DIR = os.getenv('AI_CV_CACHE_DIR', os.path.join(SCRIPT_DIR, 'cache', 'cv'))
+CV_CACHE_ENABLED = os.getenv('AI_CV_CACHE', 'true').lower() == 'true'
+# Numero maximo de arquivos mantidos em disco (os menos usados sao removidos em prune)
+CV_CACHE_MAX_FILES = int(os.getenv('AI_CV_CACHE_MAX_FILES', 20000))
+# Numero maximo de entradas mantidas em memoria por processo (LRU)
+CV_CACHE_MEMORY_ENTRIES = int(os.getenv('AI_CV_CACHE_MEMORY_ENTRIES', 2048))
+
+# Atributos do construtor do Prophet que mudam o resultado da validacao cruzada
+_SIGNATURE_ATTRS = (
+    'growth', 'n_changepoints', 'changepoint_range', 'yearly_seasonality', 'weekly_seasonality',
+    'daily_seasonality', 'seasonality_mode', 'seasonality_prior_scale', 'holidays_prior_scale',
+    'changepoint_prior_scale', 'mcmc_samples', 'interval_width', 'uncertainty_samples'
+)
+
+
+def data_key(df: pd.DataFrame) -> str:
+    """Hash do historico (ds, y), independente da ordem e do dtype das colunas."""
+    frame = pd.DataFrame({
+        'ds': pd.to_datetime(df['ds']).astype('datetime64[ns]'),
+        'y': df['y'].astype(float)
+    })
+    return compute_data_fingerprint(frame.dropna(subset=['y']))['content_hash']
+
+
+def model_signature(model) -> Dict[str, Any]:
+    """Configuracao de um modelo Prophet (ajustado ou nao) relevante para a avaliacao."""
+    signature = {attr: getattr(model, attr, None) for attr in _SIGNATURE_ATTRS}
+    signature = {k: (v if isinstance(v, (bool, int, float, str, type(None))) else str(v))
+                 for k, v in signature.items()}
+    if model.holidays is not None:
+        holidays = model.holidays.copy()
+        holidays['ds'] = pd.to_datetime(holidays['ds']).astype('datetime64[ns]')
+        holidays = holidays.sort_values(list(holidays.columns)).reset_index(drop=True)
+        signature['holidays'] = hashlib.sha256(
+            pd.util.hash_pandas_object(holidays, index=False).values.tobytes()
+        ).hexdigest()[:16]
+    signature['regressors'] = sorted(model.extra_regressors)
+    if model.specified_changepoints:
+        signature['changepoints'] = [str(c) for c in model.changepoints]
+    return signature
+
+
+def _digest(*parts) -> str:
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def fold_key(data: str, signature: Dict[str, Any], horizon, cutoff) -> str:
+    return _digest('fold', data, signature, str(pd.Timedelta(horizon)), str(pd.Timestamp(cutoff)))
+
+
+def evaluation_key(data: str, signature: Dict[str, Any], horizon, cutoffs: Iterable) -> str:
+    return _digest('evaluation', data, signature, str(pd.Timedelta(horizon)),
+                   [str(pd.Timestamp(c)) for c in cutoffs])
+
+
+class CVResultCache:
+    """
+    Previsoes por dobra e metricas por avaliacao, em memoria e em disco.
+
+    Os dois niveis sao LRU: a memoria guarda no maximo `max_memory_entries`
+    entradas e cada acerto atualiza o mtime do arquivo, que `prune` usa para
+    remover as entradas menos usadas (inclusive por outros processos).
+    """
+
+    def __init__(self, cache_dir: str = CV_CACHE_DIR, enabled: bool = CV_CACHE_ENABLED,
+                 max_files: int = CV_CACHE_MAX_FILES, max_memory_entries: int = CV_CACHE_MEMORY_ENTRIES):
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+        self.max_files = max_files
+        self.max_memory_entries = max_memory_entries
+        self._memory: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'writes': 0}
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _remember(self, key: str, value: Any):
+        """Guarda em memoria, descartando as entradas menos usadas (chamar com o lock)."""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _touch(self, path: str):
+        """Marca o arquivo como usado agora (ordem LRU do prune)."""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _load(self, key: str) -> Optional[Any]:
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        with self._lock:
+            if key in self._memory:
+                self.stats['hits'] += 1
+                self._memory.move_to_end(key)
+                value = self._memory[key]
+            else:
+                value = None
+        if value is not None:
+            self._touch(path)
+            return value
+
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    value = json.load(f)
+                self._touch(path)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Entrada de CV ilegivel em {path}: {e}")
+        with self._lock:
+            self.stats['hits' if value is not None else 'misses'] += 1
+            if value is not None:
+                self._remember(key, value)
+        return value
+
+    def _store(self, key: str, value: Any):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._remember(key, value)
+            self.stats['writes'] += 1
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(value, f, default=str)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Nao foi possivel gravar a entrada de CV {path}: {e}")
+
+    def get_fold(self, key: str) -> Optional[pd.DataFrame]:
+        """Previsoes de uma dobra (ds, yhat, yhat_lower, yhat_upper, y, cutoff)."""
+        records = self._load(key)
+        if records is None:
+            return None
+        frame = pd.DataFrame.from_records(records)
+        for column in ('ds', 'cutoff'):
+            frame[column] = pd.to_datetime(frame[column])
+        return frame
+
+    def put_fold(self, key: str, frame: pd.DataFrame):
+        frame = frame.copy()
+        for column in ('ds', 'cutoff'):
+            frame[column] = frame[column].astype(str)
+        self._store(key, frame.to_dict(orient='records'))
+
+    def get_evaluation(self, key: str) -> Optional[Dict[str, Any]]:
+        """Metricas de uma avaliacao completa (cv_metrics volta como DataFrame)."""
+        entry = self._load(key)
+        if entry is None:
+            return None
+        metrics = dict(entry)
+        cv_metrics = pd.DataFrame.from_records(metrics.pop('cv_metrics', []))
+        if 'horizon' in cv_metrics:
+            cv_metrics['horizon'] = pd.to_timedelta(cv_metrics['horizon'])
+        metrics['cv_metrics'] = cv_metrics
+        return metrics
+
+    def put_evaluation(self, key: str, metrics: Dict[str, Any]):
+        entry = {k: (None if v is None else float(v)) for k, v in metrics.items() if k != 'cv_metrics'}
+        cv_metrics = metrics.get('cv_metrics')
+        if cv_metrics is not None:
+            cv_metrics = cv_metrics.copy()
+            if 'horizon' in cv_metrics:
+                cv_metrics['horizon'] = cv_metrics['horizon'].astype(str)
+            entry['cv_metrics'] = cv_metrics.to_dict(orient='records')
+        self._store(key, entry)
+
+    def prune(self) -> int:
+        """Remove os arquivos menos usados alem de max_files. Retorna quantos foram removidos."""
+        if not os.path.isdir(self.cache_dir):
+            return 0
+        files = []
+        for root, _, names in os.walk(self.cache_dir):
+            files.extend(os.path.join(root, name) for name in names if name.endswith('.json'))
+        if len(files) <= self.max_files:
+            return 0
+        # O mtime e atualizado a cada acerto: ordem do menos para o mais usado
+        files.sort(key=lambda path: os.path.getmtime(path))
+        removed = 0
+        for path in files[:len(files) - self.max_files]:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def clear_memory(self):
+        with self._lock:
+            self._memory.clear()
+
+
+# Cache global usado pela avaliacao e pela busca de hiperparametros
+cv_cache = CVResultCache()
@@ -1,453 +1,466 @@
-﻿#!/usr/bin/env python3
-"""
-Sistema de Fallbacks Graceful
-Implementa fallbacks robustos para quando servios esto indisponveis
-"""
-
-import os
-import json
-import pickle
-import pandas as pd
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
-import random
-
-from error_handling import (
-    error_handler, ErrorSeverity, ErrorCategory, 
-    AIAPIError, DatabaseError, NetworkError, ModelLoadError
-)
-
-# Importar logger se disponvel
-try:
-    from monitoring_system import logger
-except ImportError:
-    import logging
-
-class FallbackService:
-    """Servio central de fallbacks graceful."""
-    
-    def __init__(self):
-        self.fallback_cache = {}
-        self.offline_data_path = "fallback_data"
-        self.ensure_fallback_directories()
-    
-    def ensure_fallback_directories(self):
-        """Garante que diretrios de fallback existam."""
-        os.makedirs(self.offline_data_path, exist_ok=True)
-        os.makedirs(os.path.join(self.offline_data_path, "predictions"), exist_ok=True)
-        os.makedirs(os.path.join(self.offline_data_path, "insights"), exist_ok=True)
-        os.makedirs(os.path.join(self.offline_data_path, "models"), exist_ok=True)
-
-class DatabaseFallback:
-    """Fallback para banco de dados."""
-    
-    def __init__(self):
-        self.cache_file = "fallback_data/database_cache.json"
-        self.offline_data = self._load_offline_data()
-    
-    def _load_offline_data(self) -> Dict[str, Any]:
-        """Carrega dados offline do cache."""
-        if os.path.exists(self.cache_file):
-            try:
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.warning(f"Erro ao carregar cache de database: {e}")
-        
-        # Dados padro se cache no existir
-        return {
-            "sales_data": self._generate_mock_sales_data(),
-            "products": [
-                "Bolo_de_Chocolate", "Brigadeiro_Gourmet", "Cafe_Expresso",
-                "Cappuccino", "Croissant", "Pao_de_Acucar", "Pao_Frances",
-                "Pao_Integral", "Suco_Natural", "Torta_de_Morango"
-            ],
-            "last_updated": datetime.now().isoformat()
-        }
-    
-    def _generate_mock_sales_data(self) -> List[Dict[str, Any]]:
-        """Gera dados de vendas mock para fallback."""
-        products = [
-            "Bolo_de_Chocolate", "Brigadeiro_Gourmet", "Cafe_Expresso",
-            "Cappuccino", "Croissant", "Pao_de_Acucar", "Pao_Frances",
-            "Pao_Integral", "Suco_Natural", "Torta_de_Morango"
-        ]
-        
-        data = []
-        base_date = datetime.now() - timedelta(days=30)
-        
-        for i in range(30):
-            date = base_date + timedelta(days=i)
-            for product in products:
-                # Simula padres de venda realistas
-                base_qty = random.randint(20, 100)
-                weekend_multiplier = 1.5 if date.weekday() >= 5 else 1.0
-                
-                data.append({
-                    "data": date.strftime("%Y-%m-%d"),
-                    "produto": product,
-                    "quantidade": int(base_qty * weekend_multiplier),
-                    "temperatura_media": random.uniform(15, 35),
-                    "promocao": random.choice([0, 1]) if random.random() < 0.2 else 0
-                })
-        
-        return data
-    
-    def save_cache(self, data: Dict[str, Any]):
-        """Salva dados no cache offline."""
-        try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            logger.info("Cache de database atualizado")
-        except Exception as e:
-            logger.error(f"Erro ao salvar cache de database: {e}")
-    
-    def get_sales_data_fallback(self) -> pd.DataFrame:
-        """Retorna dados de vendas do cache offline."""
-        logger.warning("Usando dados de vendas do cache offline (database indisponvel)")
-        
-        try:
-            sales_data = self.offline_data.get("sales_data", [])
-            df = pd.DataFrame(sales_data)
-            
-            if not df.empty and 'data' in df.columns:
-                df['data'] = pd.to_datetime(df['data'])
-            
-            return df
-        except Exception as e:
-            logger.error(f"Erro ao processar dados de fallback: {e}")
-            return pd.DataFrame()  # DataFrame vazio como ltimo recurso
-    
-    def get_products_fallback(self) -> List[str]:
-        """Retorna lista de produtos do cache offline."""
-        logger.warning("Usando lista de produtos do cache offline (database indisponvel)")
-        return self.offline_data.get("products", [])
-
-class AIAPIFallback:
-    """Fallback para APIs de IA (OpenAI, Gemini)."""
-    
-    def __init__(self):
-        self.insights_cache_file = "fallback_data/insights_cache.json"
-        self.cached_insights = self._load_cached_insights()
-        self.template_insights = self._load_template_insights()
-    
-    def _load_cached_insights(self) -> Dict[str, Any]:
-        """Carrega insights em cache."""
-        if os.path.exists(self.insights_cache_file):
-            try:
-                with open(self.insights_cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.warning(f"Erro ao carregar cache de insights: {e}")
-        return {}
-    
-    def _load_template_insights(self) -> Dict[str, List[str]]:
-        """Templates de insights para fallback."""
-        return {
-            "general": [
-                "Baseado nos dados histricos, recomendamos manter o estoque adequado.",
-                "Considere ajustar a produo conforme a sazonalidade observada.",
-                "Monitore a demanda durante eventos especiais e feriados.",
-                "A qualidade dos produtos mantm-se como fator crucial para as vendas."
-            ],
-            "high_demand": [
-                "Produto com alta demanda identificada. Considere aumentar a produo.",
-                "Recomendamos manter estoque extra para este produto popular.",
-                "Produto em tendncia de crescimento nas vendas."
-            ],
-            "low_demand": [
-                "Demanda menor observada. Avalie estratgias de marketing.",
-                "Considere promoes ou ajustes na receita deste produto.",
-                "Monitore feedback dos clientes para melhorias."
-            ],
-            "seasonal": [
-                "Produto com variao sazonal. Ajuste produo conforme poca.",
-                "Padro sazonal identificado. Planeje estoque antecipadamente.",
-                "Considere campanhas promocionais em perodos de menor demanda."
-            ]
-        }
-    
-    def save_insight_cache(self, prompt: str, insight: str):
-        """Salva insight no cache para uso futuro."""
-        try:
-            cache_key = self._generate_cache_key(prompt)
-            self.cached_insights[cache_key] = {
-                "insight": insight,
-                "timestamp": datetime.now().isoformat(),
-                "prompt": prompt[:200]  # Salva parte do prompt para referncia
-            }
-            
-            with open(self.insights_cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.cached_insights, f, ensure_ascii=False, indent=2)
-                
-        except Exception as e:
-            logger.error(f"Erro ao salvar cache de insight: {e}")
-    
-    def _generate_cache_key(self, prompt: str) -> str:
-        """Gera chave de cache para prompt."""
-        import hashlib
-        return hashlib.md5(prompt.encode()).hexdigest()[:16]
-    
-    def get_cached_insight(self, prompt: str) -> Optional[str]:
-        """Busca insight em cache."""
-        cache_key = self._generate_cache_key(prompt)
-        cached = self.cached_insights.get(cache_key)
-        
-        if cached:
-            # Verifica se cache no est muito antigo (7 dias)
-            cache_time = datetime.fromisoformat(cached["timestamp"])
-            if datetime.now() - cache_time < timedelta(days=7):
-                logger.info("Usando insight do cache")
-                return cached["insight"]
-        
-        return None
-    
-    def generate_fallback_insight(self, 
-                                 prediction_data: Dict[str, Any] = None,
-                                 context: str = "general") -> str:
-        """Gera insight de fallback baseado em templates."""
-        logger.warning("Gerando insight de fallback (API de IA indisponvel)")
-        
-        try:
-            # Seleciona template baseado no contexto
-            if prediction_data:
-                avg_prediction = sum(prediction_data.get("prediction", [0])) / max(len(prediction_data.get("prediction", [1])), 1)
-                if avg_prediction > 80:
-                    context = "high_demand"
-                elif avg_prediction < 30:
-                    context = "low_demand"
-                else:
-                    context = "general"
-            
-            templates = self.template_insights.get(context, self.template_insights["general"])
-            base_insight = random.choice(templates)
-            
-            # Adiciona informaes especficas se disponvel
-            if prediction_data:
-                product_name = prediction_data.get("product_name", "produto")
-                days = len(prediction_data.get("prediction", []))
-                
-                insight = f"**Anlise para {product_name}:**\n\n{base_insight}\n\n"
-                insight += " Previso para {} dias analisada.\n".format(days)
-                insight += " Recomendaes baseadas em dados histricos e padres sazonais.\n"
-                insight += " *Insight gerado offline - para anlise completa, aguarde reconexo com IA.*"
-            else:
-                insight = "{}\n\n *Insight gerado offline - dados limitados disponveis.*".format(base_insight)
-            
-            return insight
-            
-        except Exception as e:
-            logger.error(f"Erro ao gerar insight de fallback: {e}")
-            return "Anlise temporariamente indisponvel. Tente novamente mais tarde."
-
-class ModelFallback:
-    """Fallback para modelos de ML."""
-    
-    def __init__(self):
-        self.simple_predictions_cache = "fallback_data/simple_predictions.json"
-        self.cached_predictions = self._load_prediction_cache()
-    
-    def _load_prediction_cache(self) -> Dict[str, Any]:
-        """Carrega cache de predies simples."""
-        if os.path.exists(self.simple_predictions_cache):
-            try:
-                with open(self.simple_predictions_cache, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.warning(f"Erro ao carregar cache de predies: {e}")
-        return {}
-    
-    def save_prediction_cache(self, product: str, prediction: List[float]):
-        """Salva predio no cache."""
-        try:
-            self.cached_predictions[product] = {
-                "prediction": prediction,
-                "timestamp": datetime.now().isoformat()
-            }
-            
-            with open(self.simple_predictions_cache, 'w', encoding='utf-8') as f:
-                json.dump(self.cached_predictions, f, ensure_ascii=False, indent=2)
-                
-        except Exception as e:
-            logger.error(f"Erro ao salvar cache de predio: {e}")
-    
-    def generate_simple_prediction(self, 
-                                  product_name: str, 
-                                  days: int = 7,
-                                  historical_data: pd.DataFrame = None) -> List[float]:
-        """Gera predio simples baseada em heursticas."""
-        logger.warning(f"Gerando predio simples para {product_name} (modelo ML indisponvel)")
-        
-        try:
-            # Verifica cache primeiro
-            cached = self.cached_predictions.get(product_name)
-            if cached:
-                cache_time = datetime.fromisoformat(cached["timestamp"])
-                if datetime.now() - cache_time < timedelta(hours=6):
-                    logger.info("Usando predio do cache")
-                    cached_pred = cached["prediction"]
-                    if len(cached_pred) >= days:
-                        return cached_pred[:days]
-            
-            # Gera predio baseada em dados histricos se disponvel
-            if historical_data is not None and not historical_data.empty:
-                return self._predict_from_historical(product_name, days, historical_data)
-            else:
-                return self._predict_simple_heuristic(product_name, days)
-                
-        except Exception as e:
-            logger.error(f"Erro ao gerar predio simples: {e}")
-            return self._predict_simple_heuristic(product_name, days)
-    
-    def _predict_from_historical(self, 
-                                product_name: str, 
-                                days: int, 
-                                historical_data: pd.DataFrame) -> List[float]:
-        """Predio baseada em mdia mvel dos dados histricos."""
-        try:
-            # Filtra dados do produto
-            product_data = historical_data[
-                historical_data['produto'] == product_name
-            ]['quantidade']
-            
-            if len(product_data) > 0:
-                # Calcula mdia mvel simples
-                if len(product_data) >= 7:
-                    recent_avg = product_data.tail(7).mean()
-                else:
-                    recent_avg = product_data.mean()
-                
-                # Adiciona variao sazonal simples
-                base_prediction = []
-                for day in range(days):
-                    # Simula padro semanal (fins de semana +20%)
-                    day_of_week = (datetime.now().weekday() + day) % 7
-                    weekend_factor = 1.2 if day_of_week >= 5 else 1.0
-                    
-                    # Adiciona pequena variao aleatria
-                    random_factor = random.uniform(0.9, 1.1)
-                    
-                    prediction = recent_avg * weekend_factor * random_factor
-                    base_prediction.append(max(1.0, round(prediction, 1)))
-                
-                # Salva no cache
-                self.save_prediction_cache(product_name, base_prediction)
-                return base_prediction
-            
-        except Exception as e:
-            logger.error(f"Erro na predio histrica: {e}")
-        
-        # Fallback para heurstica simples
-        return self._predict_simple_heuristic(product_name, days)
-    
-    def _predict_simple_heuristic(self, product_name: str, days: int) -> List[float]:
-        """Predio baseada em heursticas simples por tipo de produto."""
-        
-        # Padres base por tipo de produto
-        product_patterns = {
-            "pao": {"base": 80, "weekend_factor": 0.8, "variation": 0.15},
-            "bolo": {"base": 45, "weekend_factor": 1.3, "variation": 0.25},
-            "cafe": {"base": 120, "weekend_factor": 1.1, "variation": 0.20},
-            "suco": {"base": 60, "weekend_factor": 1.2, "variation": 0.18},
-            "doce": {"base": 35, "weekend_factor": 1.4, "variation": 0.30},
-            "default": {"base": 50, "weekend_factor": 1.0, "variation": 0.20}
-        }
-        
-        # Identifica tipo de produto
-        product_lower = product_name.lower()
-        if "pao" in product_lower:
-            pattern = product_patterns["pao"]
-        elif "bolo" in product_lower or "torta" in product_lower:
-            pattern = product_patterns["bolo"]
-        elif "cafe" in product_lower or "cappuccino" in product_lower:
-            pattern = product_patterns["cafe"]
-        elif "suco" in product_lower:
-            pattern = product_patterns["suco"]
-        elif "brigadeiro" in product_lower or "doce" in product_lower:
-            pattern = product_patterns["doce"]
-        else:
-            pattern = product_patterns["default"]
-        
-        # Gera predio
-        prediction = []
-        for day in range(days):
-            day_of_week = (datetime.now().weekday() + day) % 7
-            weekend_factor = pattern["weekend_factor"] if day_of_week >= 5 else 1.0
-            
-            # Variao aleatria
-            variation = random.uniform(1 - pattern["variation"], 1 + pattern["variation"])
-            
-            value = pattern["base"] * weekend_factor * variation
-            prediction.append(max(1.0, round(value, 1)))
-        
-        # Salva no cache
-        self.save_prediction_cache(product_name, prediction)
-        return prediction
-
-# Instncias globais dos servios de fallback
-fallback_service = FallbackService()
-database_fallback = DatabaseFallback()
-ai_api_fallback = AIAPIFallback()
-model_fallback = ModelFallback()
-
-# Funes de convenincia
-def get_sales_data_with_fallback() -> pd.DataFrame:
-    """Obtm dados de vendas com fallback automtico."""
-    try:
-        # Tenta obter do banco primeiro
-        # IMPLEMENTADO: Integrao com sistema de banco disponvel via fallback
-        # Esta implementao usa dados simulados como fallback primrio
-        return database_fallback.get_sales_data_fallback()
-        
-    except Exception as e:
-        error_handler.handle_error(e, context={"operation": "get_sales_data"})
-        return database_fallback.get_sales_data_fallback()
-
-def get_products_with_fallback() -> List[str]:
-    """Obtm lista de produtos com fallback automtico."""
-    try:
-        # Tenta obter do banco primeiro
-        # IMPLEMENTADO: Integrao com sistema de produtos disponvel via fallback
-        # Esta implementao usa dados simulados como fallback primrio
-        return database_fallback.get_products_fallback()
-        
-    except Exception as e:
-        error_handler.handle_error(e, context={"operation": "get_products"})
-        return database_fallback.get_products_fallback()
-
-def generate_insight_with_fallback(prompt: str, prediction_data: Dict[str, Any] = None) -> str:
-    """Gera insight com fallback automtico."""
-    try:
-        # Verifica cache primeiro
-        cached = ai_api_fallback.get_cached_insight(prompt)
-        if cached:
-            return cached
-        
-        # Tenta APIs de IA
-        # IMPLEMENTADO: Integrao com APIs de IA disponvel via fallback
-        # Esta implementao usa insights pr-processados como fallback primrio
-        return ai_api_fallback.generate_fallback_insight(prompt, prediction_data)
-        
-    except Exception as e:
-        error_handler.handle_error(e, context={"operation": "generate_insight", "prompt": prompt[:100]})
-        return ai_api_fallback.generate_fallback_insight(prediction_data)
-
-def predict_with_fallback(product_name: str, days: int = 7) -> List[float]:
-    """Faz predio com fallback automtico."""
-    try:
-        # Tenta carregar modelo ML primeiro
-        # IMPLEMENTADO: Integrao com sistema de modelos disponvel via fallback
-        # Esta implementao usa predies baseadas em dados histricos como fallback
-        historical_data = get_sales_data_with_fallback()
-        return model_fallback.generate_simple_prediction(product_name, days, historical_data)
-        
-    except Exception as e:
-        error_handler.handle_error(e, context={"operation": "predict", "product": product_name})
-        
-        # Tenta obter dados histricos para melhor predio
-        try:
-            historical_data = get_sales_data_with_fallback()
-        except Exception:
-            historical_data = None
-        
-        return model_fallback.generate_simple_prediction(product_name, days, historical_data)
\ No newline at end of file
+#!/usr/bin/env python3
+"""
+Sistema de Fallbacks Graceful
+Implementa fallbacks robustos para quando servios esto indisponveis
+"""
+
+import os
+import json
+import pickle
+import numpy as np
+import pandas as pd
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Union
+import random
+
+from baseline_engine import BaselineEngine
+from error_handling import (
+    error_handler, ErrorSeverity, ErrorCategory, 
+    AIAPIError, DatabaseError, NetworkError, ModelLoadError
+)
+
+# Importar logger se disponvel
+try:
+    from monitoring_system import logger
+except ImportError:
+    import logging
+
+class FallbackService:
+    """Servio central de fallbacks graceful."""
+    
+    def __init__(self):
+        self.fallback_cache = {}
+        self.offline_data_path = "fallback_data"
+        self.ensure_fallback_directories()
+    
+    def ensure_fallback_directories(self):
+        """Garante que diretrios de fallback existam."""
+        os.makedirs(self.offline_data_path, exist_ok=True)
+        os.makedirs(os.path.join(self.offline_data_path, "predictions"), exist_ok=True)
+        os.makedirs(os.path.join(self.offline_data_path, "insights"), exist_ok=True)
+        os.makedirs(os.path.join(self.offline_data_path, "models"), exist_ok=True)
+
+class DatabaseFallback:
+    """Fallback para banco de dados."""
+    
+    def __init__(self):
+        self.cache_file = "fallback_data/database_cache.json"
+        self.offline_data = self._load_offline_data()
+    
+    def _load_offline_data(self) -> Dict[str, Any]:
+        """Carrega dados offline do cache."""
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.warning(f"Erro ao carregar cache de database: {e}")
+        
+        # Dados padro se cache no existir
+        return {
+            "sales_data": self._generate_mock_sales_data(),
+            "products": [
+                "Bolo_de_Chocolate", "Brigadeiro_Gourmet", "Cafe_Expresso",
+                "Cappuccino", "Croissant", "Pao_de_Acucar", "Pao_Frances",
+                "Pao_Integral", "Suco_Natural", "Torta_de_Morango"
+            ],
+            "last_updated": datetime.now().isoformat()
+        }
+    
+    def _generate_mock_sales_data(self) -> List[Dict[str, Any]]:
+        """Gera dados de vendas mock para fallback."""
+        products = [
+            "Bolo_de_Chocolate", "Brigadeiro_Gourmet", "Cafe_Expresso",
+            "Cappuccino", "Croissant", "Pao_de_Acucar", "Pao_Frances",
+            "Pao_Integral", "Suco_Natural", "Torta_de_Morango"
+        ]
+        
+        data = []
+        base_date = datetime.now() - timedelta(days=30)
+        
+        for i in range(30):
+            date = base_date + timedelta(days=i)
+            for product in products:
+                # Simula padres de venda realistas
+                base_qty = random.randint(20, 100)
+                weekend_multiplier = 1.5 if date.weekday() >= 5 else 1.0
+                
+                data.append({
+                    "data": date.strftime("%Y-%m-%d"),
+                    "produto": product,
+                    "quantidade": int(base_qty * weekend_multiplier),
+                    "temperatura_media": random.uniform(15, 35),
+                    "promocao": random.choice([0, 1]) if random.random() < 0.2 else 0
+                })
+        
+        return data
+    
+    def save_cache(self, data: Dict[str, Any]):
+        """Salva dados no cache offline."""
+        try:
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            logger.info("Cache de database atualizado")
+        except Exception as e:
+            logger.error(f"Erro ao salvar cache de database: {e}")
+    
+    def get_sales_data_fallback(self) -> pd.DataFrame:
+        """Retorna dados de vendas do cache offline."""
+        logger.warning("Usando dados de vendas do cache offline (database indisponvel)")
+        
+        try:
+            sales_data = self.offline_data.get("sales_data", [])
+            df = pd.DataFrame(sales_data)
+            
+            if not df.empty and 'data' in df.columns:
+                df['data'] = pd.to_datetime(df['data'])
+            
+            return df
+        except Exception as e:
+            logger.error(f"Erro ao processar dados de fallback: {e}")
+            return pd.DataFrame()  # DataFrame vazio como ltimo recurso
+    
+    def get_products_fallback(self) -> List[str]:
+        """Retorna lista de produtos do cache offline."""
+        logger.warning("Usando lista de produtos do cache offline (database indisponvel)")
+        return self.offline_data.get("products", [])
+
+class AIAPIFallback:
+    """Fallback para APIs de IA (OpenAI, Gemini)."""
+    
+    def __init__(self):
+        self.insights_cache_file = "fallback_data/insights_cache.json"
+        self.cached_insights = self._load_cached_insights()
+        self.template_insights = self._load_template_insights()
+    
+    def _load_cached_insights(self) -> Dict[str, Any]:
+        """Carrega insights em cache."""
+        if os.path.exists(self.insights_cache_file):
+            try:
+                with open(self.insights_cache_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.warning(f"Erro ao carregar cache de insights: {e}")
+        return {}
+    
+    def _load_template_insights(self) -> Dict[str, List[str]]:
+        """Templates de insights para fallback."""
+        return {
+            "general": [
+                "Baseado nos dados histricos, recomendamos manter o estoque adequado.",
+                "Considere ajustar a produo conforme a sazonalidade observada.",
+                "Monitore a demanda durante eventos especiais e feriados.",
+                "A qualidade dos produtos mantm-se como fator crucial para as vendas."
+            ],
+            "high_demand": [
+                "Produto com alta demanda identificada. Considere aumentar a produo.",
+                "Recomendamos manter estoque extra para este produto popular.",
+                "Produto em tendncia de crescimento nas vendas."
+            ],
+            "low_demand": [
+                "Demanda menor observada. Avalie estratgias de marketing.",
+                "Considere promoes ou ajustes na receita deste produto.",
+                "Monitore feedback dos clientes para melhorias."
+            ],
+            "seasonal": [
+                "Produto com variao sazonal. Ajuste produo conforme poca.",
+                "Padro sazonal identificado. Planeje estoque antecipadamente.",
+                "Considere campanhas promocionais em perodos de menor demanda."
+            ]
+        }
+    
+    def save_insight_cache(self, prompt: str, insight: str):
+        """Salva insight no cache para uso futuro."""
+        try:
+            cache_key = self._generate_cache_key(prompt)
+            self.cached_insights[cache_key] = {
+                "insight": insight,
+                "timestamp": datetime.now().isoformat(),
+                "prompt": prompt[:200]  # Salva parte do prompt para referncia
+            }
+            
+            with open(self.insights_cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self.cached_insights, f, ensure_ascii=False, indent=2)
+                
+        except Exception as e:
+            logger.error(f"Erro ao salvar cache de insight: {e}")
+    
+    def _generate_cache_key(self, prompt: str) -> str:
+        """Gera chave de cache para prompt."""
+        import hashlib
+        return hashlib.md5(prompt.encode()).hexdigest()[:16]
+    
+    def get_cached_insight(self, prompt: str) -> Optional[str]:
+        """Busca insight em cache."""
+        cache_key = self._generate_cache_key(prompt)
+        cached = self.cached_insights.get(cache_key)
+        
+        if cached:
+            # Verifica se cache no est muito antigo (7 dias)
+            cache_time = datetime.fromisoformat(cached["timestamp"])
+            if datetime.now() - cache_time < timedelta(days=7):
+                logger.info("Usando insight do cache")
+                return cached["insight"]
+        
+        return None
+    
+    def generate_fallback_insight(self, 
+                                 prediction_data: Dict[str, Any] = None,
+                                 context: str = "general") -> str:
+        """Gera insight de fallback baseado em templates."""
+        logger.warning("Gerando insight de fallback (API de IA indisponvel)")
+        
+        try:
+            # Seleciona template baseado no contexto
+            if prediction_data:
+                avg_prediction = sum(prediction_data.get("prediction", [0])) / max(len(prediction_data.get("prediction", [1])), 1)
+                if avg_prediction > 80:
+                    context = "high_demand"
+                elif avg_prediction < 30:
+                    context = "low_demand"
+                else:
+                    context = "general"
+            
+            templates = self.template_insights.get(context, self.template_insights["general"])
+            base_insight = random.choice(templates)
+            
+            # Adiciona informaes especficas se disponvel
+            if prediction_data:
+                product_name = prediction_data.get("product_name", "produto")
+                days = len(prediction_data.get("prediction", []))
+                
+                insight = f"**Anlise para {product_name}:**\n\n{base_insight}\n\n"
+                insight += " Previso para {} dias analisada.\n".format(days)
+                insight += " Recomendaes baseadas em dados histricos e padres sazonais.\n"
+                insight += " *Insight gerado offline - para anlise completa, aguarde reconexo com IA.*"
+            else:
+                insight = "{}\n\n *Insight gerado offline - dados limitados disponveis.*".format(base_insight)
+            
+            return insight
+            
+        except Exception as e:
+            logger.error(f"Erro ao gerar insight de fallback: {e}")
+            return "Anlise temporariamente indisponvel. Tente novamente mais tarde."
+
+class ModelFallback:
+    """Fallback para modelos de ML."""
+    
+    def __init__(self):
+        self.simple_predictions_cache = "fallback_data/simple_predictions.json"
+        self.cached_predictions = self._load_prediction_cache()
+        self._baseline = (None, None)
+    
+    def _load_prediction_cache(self) -> Dict[str, Any]:
+        """Carrega cache de predies simples."""
+        if os.path.exists(self.simple_predictions_cache):
+            try:
+                with open(self.simple_predictions_cache, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.warning(f"Erro ao carregar cache de predies: {e}")
+        return {}
+    
+    def save_prediction_cache(self, product: str, prediction: List[float]):
+        """Salva predio no cache."""
+        self.save_predictions_cache({product: prediction})
+
+    def save_predictions_cache(self, predictions: Dict[str, List[float]]):
+        """Salva as predicoes de varios produtos com uma unica escrita do arquivo."""
+        try:
+            timestamp = datetime.now().isoformat()
+            for product, prediction in predictions.items():
+                self.cached_predictions[product] = {
+                    "prediction": prediction,
+                    "timestamp": timestamp
+                }
+            
+            with open(self.simple_predictions_cache, 'w', encoding='utf-8') as f:
+                json.dump(self.cached_predictions, f, ensure_ascii=False, indent=2)
+                
+        except Exception as e:
+            logger.error(f"Erro ao salvar cache de predio: {e}")
+    
+    def generate_simple_prediction(self, 
+                                  product_name: str, 
+                                  days: int = 7,
+                                  historical_data: pd.DataFrame = None) -> List[float]:
+        """Gera predio simples baseada em heursticas."""
+        logger.warning(f"Gerando predio simples para {product_name} (modelo ML indisponvel)")
+        
+        try:
+            # Verifica cache primeiro
+            cached = self.cached_predictions.get(product_name)
+            if cached:
+                cache_time = datetime.fromisoformat(cached["timestamp"])
+                if datetime.now() - cache_time < timedelta(hours=6):
+                    logger.info("Usando predio do cache")
+                    cached_pred = cached["prediction"]
+                    if len(cached_pred) >= days:
+                        return cached_pred[:days]
+            
+            # Gera predio baseada em dados histricos se disponvel
+            if historical_data is not None and not historical_data.empty:
+                return self._predict_from_historical(product_name, days, historical_data)
+            else:
+                return self._predict_simple_heuristic(product_name, days)
+                
+        except Exception as e:
+            logger.error(f"Erro ao gerar predio simples: {e}")
+            return self._predict_simple_heuristic(product_name, days)
+    
+    def _baseline_forecasts(self, days: int, historical_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Previsao de base de todos os produtos (BaselineEngine, metodo escolhido
+        por backtest) para os `days` dias a partir de amanha, como as predicoes
+        dos modelos. Um snapshot com dias de atraso e previsto ate hoje e os
+        dias ja passados sao descartados. Recalculada apenas quando os dados,
+        o horizonte ou o dia corrente mudam; a cada recalculo as predicoes de
+        todos os produtos vao para o cache de predicoes numa unica escrita.
+        """
+        last_date = pd.to_datetime(historical_data['data']).max().normalize()
+        today = pd.Timestamp(datetime.now().date())
+        gap = max(0, (today - last_date).days)
+        key = (len(historical_data), str(last_date), float(historical_data['quantidade'].sum()), days, gap)
+        cached_key, forecasts = self._baseline
+        if cached_key != key:
+            engine = BaselineEngine().fit(historical_data, item_col='produto', date_col='data',
+                                          value_col='quantidade')
+            forecasts = engine.forecast(gap + days).iloc[:, gap:]
+            self._baseline = (key, forecasts)
+            self.save_predictions_cache({
+                product: self._format_predictions(values)
+                for product, values in zip(forecasts.index, forecasts.to_numpy())
+            })
+        return forecasts
+
+    @staticmethod
+    def _format_predictions(values) -> List[float]:
+        return np.maximum(np.round(values, 1), 1.0).tolist()
+
+    def _predict_from_historical(self, 
+                                product_name: str, 
+                                days: int, 
+                                historical_data: pd.DataFrame) -> List[float]:
+        """Predicao baseada nos baselines vetorizados dos dados historicos."""
+        try:
+            forecasts = self._baseline_forecasts(days, historical_data)
+            if product_name in forecasts.index:
+                return self._format_predictions(forecasts.loc[product_name].to_numpy())
+            
+        except Exception as e:
+            logger.error(f"Erro na predio histrica: {e}")
+        
+        # Fallback para heurstica simples
+        return self._predict_simple_heuristic(product_name, days)
+
+    def _predict_simple_heuristic(self, product_name: str, days: int) -> List[float]:
+        """Predio baseada em heursticas simples por tipo de produto."""
+        
+        # Padres base por tipo de produto
+        product_patterns = {
+            "pao": {"base": 80, "weekend_factor": 0.8, "variation": 0.15},
+            "bolo": {"base": 45, "weekend_factor": 1.3, "variation": 0.25},
+            "cafe": {"base": 120, "weekend_factor": 1.1, "variation": 0.20},
+            "suco": {"base": 60, "weekend_factor": 1.2, "variation": 0.18},
+            "doce": {"base": 35, "weekend_factor": 1.4, "variation": 0.30},
+            "default": {"base": 50, "weekend_factor": 1.0, "variation": 0.20}
+        }
+        
+        # Identifica tipo de produto
+        product_lower = product_name.lower()
+        if "pao" in product_lower:
+            pattern = product_patterns["pao"]
+        elif "bolo" in product_lower or "torta" in product_lower:
+            pattern = product_patterns["bolo"]
+        elif "cafe" in product_lower or "cappuccino" in product_lower:
+            pattern = product_patterns["cafe"]
+        elif "suco" in product_lower:
+            pattern = product_patterns["suco"]
+        elif "brigadeiro" in product_lower or "doce" in product_lower:
+            pattern = product_patterns["doce"]
+        else:
+            pattern = product_patterns["default"]
+        
+        # Gera predio
+        prediction = []
+        for day in range(days):
+            day_of_week = (datetime.now().weekday() + day) % 7
+            weekend_factor = pattern["weekend_factor"] if day_of_week >= 5 else 1.0
+            
+            # Variao aleatria
+            variation = random.uniform(1 - pattern["variation"], 1 + pattern["variation"])
+            
+            value = pattern["base"] * weekend_factor * variation
+            prediction.append(max(1.0, round(value, 1)))
+        
+        # Salva no cache
+        self.save_prediction_cache(product_name, prediction)
+        return prediction
+
+# Instncias globais dos servios de fallback
+fallback_service = FallbackService()
+database_fallback = DatabaseFallback()
+ai_api_fallback = AIAPIFallback()
+model_fallback = ModelFallback()
+
+# Funes de convenincia
+def get_sales_data_with_fallback() -> pd.DataFrame:
+    """Obtm dados de vendas com fallback automtico."""
+    try:
+        # Tenta obter do banco primeiro
+        # IMPLEMENTADO: Integrao com sistema de banco disponvel via fallback
+        # Esta implementao usa dados simulados como fallback primrio
+        return database_fallback.get_sales_data_fallback()
+        
+    except Exception as e:
+        error_handler.handle_error(e, context={"operation": "get_sales_data"})
+        return database_fallback.get_sales_data_fallback()
+
+def get_products_with_fallback() -> List[str]:
+    """Obtm lista de produtos com fallback automtico."""
+    try:
+        # Tenta obter do banco primeiro
+        # IMPLEMENTADO: Integrao com sistema de produtos disponvel via fallback
+        # Esta implementao usa dados simulados como fallback primrio
+        return database_fallback.get_products_fallback()
+        
+    except Exception as e:
+        error_handler.handle_error(e, context={"operation": "get_products"})
+        return database_fallback.get_products_fallback()
+
+def generate_insight_with_fallback(prompt: str, prediction_data: Dict[str, Any] = None) -> str:
+    """Gera insight com fallback automtico."""
+    try:
+        # Verifica cache primeiro
+        cached = ai_api_fallback.get_cached_insight(prompt)
+        if cached:
+            return cached
+        
+        # Tenta APIs de IA
+        # IMPLEMENTADO: Integrao com APIs de IA disponvel via fallback
+        # Esta implementao usa insights pr-processados como fallback primrio
+        return ai_api_fallback.generate_fallback_insight(prompt, prediction_data)
+        
+    except Exception as e:
+        error_handler.handle_error(e, context={"operation": "generate_insight", "prompt": prompt[:100]})
+        return ai_api_fallback.generate_fallback_insight(prediction_data)
+
+def predict_with_fallback(product_name: str, days: int = 7) -> List[float]:
+    """Faz predio com fallback automtico."""
+    try:
+        # Tenta carregar modelo ML primeiro
+        # IMPLEMENTADO: Integrao com sistema de modelos disponvel via fallback
+        # Esta implementao usa predies baseadas em dados histricos como fallback
+        historical_data = get_sales_data_with_fallback()
+        return model_fallback.generate_simple_prediction(product_name, days, historical_data)
+        
+    except Exception as e:
+        error_handler.handle_error(e, context={"operation": "predict", "product": product_name})
+        
+        # Tenta obter dados histricos para melhor predio
+        try:
+            historical_data = get_sales_data_with_fallback()
+        except Exception:
+            historical_data = None
+        
+        return model_fallback.generate_simple_prediction(product_name, days, historical_data)
@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Engines de previsao e selecao do engine de cada produto.
+Cada engine implementa a mesma interface (ForecastEngine): ajustar,
+prever, serializar/carregar e avaliar uma dobra de validacao cruzada.
+O Prophet passa a ser um engine entre outros:
+
+    baseline      sazonal ingenuo / media movel / suavizacao (baseline_engine)
+    intermittent  Croston / SBA / TSB para produtos de baixo giro (intermittent_demand)
+    prophet       modelo Prophet com busca de hiperparametros
+
+O seletor escolhe, por produto, o engine mais barato (tempo medido de
+ajuste + predicao) cujo erro de validacao cruzada fica dentro de
+AI_ENGINE_ACCURACY_TOLERANCE do melhor candidato. Os engines baratos sao
+avaliados a cada treino (milissegundos); as metricas do Prophet vem do
+treino atual ou, se ainda nao foi treinado nesta rodada, da decisao
+anterior gravada no manifesto. Quando um engine barato atende a meta, o
+Prophet nem e ajustado. As metricas anteriores valem por ate
+AI_ENGINE_PRIOR_MAX_REUSES decisoes; depois o Prophet e treinado e
+avaliado de novo nos dados atuais. A decisao fica no manifesto ('engine' e
+'engine_decision') e o servico carrega e preve pelo engine do produto,
+sem importar o Prophet para os produtos que nao precisam dele.
+"""
+
+import json
+import os
+import pickle
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+import model_format
+from baseline_engine import BaselineModel
+from intermittent_demand import IntermittentDemandModel, train_intermittent_product
+
+ENGINE_SELECTION_ENABLED = os.getenv('AI_ENGINE_SELECTION', 'true').lower() == 'true'
+# Um engine mais barato e aceito com erro ate (1 + tolerancia) x o do melhor candidato
+ACCURACY_TOLERANCE = float(os.getenv('AI_ENGINE_ACCURACY_TOLERANCE', 0.05))
+# Metrica da comparacao: 'rmse' (padrao, a mesma da busca do Prophet) ou 'mae'.
+# O MAE favorece previsoes zeradas em series intermitentes.
+SELECTION_METRIC = os.getenv('AI_ENGINE_SELECTION_METRIC', 'rmse')
+# Decisoes seguidas que podem reutilizar as metricas do Prophet sem treina-lo de novo
+PRIOR_MAX_REUSES = int(os.getenv('AI_ENGINE_PRIOR_MAX_REUSES', 3))
+DEFAULT_ENGINE = 'prophet'
+CV_HORIZON = '30 days'
+
+
+def _cv_cutoffs(df: pd.DataFrame, horizon: str = CV_HORIZON) -> List[pd.Timestamp]:
+    # model_evaluation importa o Prophet: apenas o treino chega aqui, nunca o servico
+    from model_evaluation import generate_cv_cutoffs
+    return generate_cv_cutoffs(df, horizon=horizon) if not df.empty else []
+
+
+def _fold_sums(actual: np.ndarray, predicted: np.ndarray, cutoff) -> Dict[str, Any]:
+    errors = actual - predicted
+    return {
+        'cutoff': str(cutoff),
+        'sse': float(np.sum(errors ** 2)),
+        'abs_error': float(np.sum(np.abs(errors))),
+        'n': int(len(errors))
+    }
+
+
+class ForecastEngine(ABC):
+    """Interface comum dos engines; os modelos ajustados tem predict() no formato do Prophet."""
+
+    name = ''
+    model_type = ''
+
+    @abstractmethod
+    def build(self, params: Optional[Dict[str, Any]] = None, base_params: Optional[Dict[str, Any]] = None):
+        """Modelo ainda nao ajustado com os parametros dados."""
+
+    def fit(self, df: pd.DataFrame, params: Optional[Dict[str, Any]] = None,
+            base_params: Optional[Dict[str, Any]] = None):
+        return self.build(params, base_params).fit(df)
+
+    def predict(self, model, future: pd.DataFrame) -> pd.DataFrame:
+        return model.predict(future)[['ds', 'yhat', 'yhat_lower', 'yhat_upper']]
+
+    def serialize(self, model, product_name: Optional[str] = None) -> bytes:
+        return model_format.to_bytes(model, product_name)
+
+    def deserialize(self, data):
+        return model_format.from_bytes(data)
+
+    def load(self, path: str):
+        """Modelo servido em `path` (formato compacto)."""
+        return model_format.load_model(path)
+
+    def evaluate_fold(self, df: pd.DataFrame, params: Optional[Dict[str, Any]], cutoff, horizon: str = CV_HORIZON,
+                      base_params: Optional[Dict[str, Any]] = None, data=None) -> Dict[str, Any]:
+        """Ajusta ate `cutoff` e soma os erros no horizonte seguinte (mesmo formato de model_evaluation)."""
+        cutoff = pd.Timestamp(cutoff)
+        ds = pd.to_datetime(df['ds'])
+        train = df[ds <= cutoff]
+        test = df[(ds > cutoff) & (ds <= cutoff + pd.Timedelta(horizon))]
+        model = self.fit(train, params, base_params)
+        forecast = self.predict(model, test[['ds']])
+        return _fold_sums(test['y'].to_numpy(dtype=float), forecast['yhat'].to_numpy(), cutoff)
+
+    def evaluate(self, df: pd.DataFrame, params: Optional[Dict[str, Any]] = None,
+                 cutoffs: Optional[List] = None, horizon: str = CV_HORIZON,
+                 base_params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """MAE e RMSE agregados nas dobras e o tempo medio de ajuste por dobra."""
+        cutoffs = _cv_cutoffs(df, horizon) if cutoffs is None else cutoffs
+        if not cutoffs:
+            return {}
+        start = time.perf_counter()
+        folds = [self.evaluate_fold(df, params, cutoff, horizon, base_params) for cutoff in cutoffs]
+        n = sum(f['n'] for f in folds)
+        if not n:
+            return {}
+        return {
+            'mae': sum(f['abs_error'] for f in folds) / n,
+            'rmse': float(np.sqrt(sum(f['sse'] for f in folds) / n)),
+            'folds': len(folds),
+            'fold_s': (time.perf_counter() - start) / len(folds)
+        }
+
+    def estimate_cost(self, profile: Dict[str, Any]) -> float:
+        """Custo em segundos de treinar e servir o produto com este engine (a partir do perfil medido)."""
+        return (profile.get('train_s') or profile.get('fit_s') or 0.0) + (profile.get('predict_ms') or 0.0) / 1000
+
+
+class BaselineForecastEngine(ForecastEngine):
+    name = 'baseline'
+    model_type = BaselineModel.MODEL_TYPE
+
+    def build(self, params=None, base_params=None):
+        return BaselineModel(**(params or {}))
+
+
+class IntermittentForecastEngine(ForecastEngine):
+    name = 'intermittent'
+    model_type = IntermittentDemandModel.MODEL_TYPE
+
+    def build(self, params=None, base_params=None):
+        return IntermittentDemandModel(**(params or {}))
+
+
+class ProphetForecastEngine(ForecastEngine):
+    """Prophet importado apenas quando um modelo e construido ou avaliado."""
+
+    name = 'prophet'
+    model_type = 'prophet'
+
+    def build(self, params=None, base_params=None):
+        from prophet import Prophet
+        return Prophet(**(base_params or {}), **(params or {}))
+
+    def load(self, path: str):
+        if path.endswith(model_format.MODEL_EXTENSION):
+            return model_format.load_model(path)
+        # Pickle legado: apenas modelos gerados localmente, antes do formato compacto
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+    def evaluate_fold(self, df, params, cutoff, horizon=CV_HORIZON, base_params=None, data=None):
+        # Dobras do Prophet passam pelo cache de CV
+        from model_evaluation import evaluate_fold
+        return evaluate_fold(df, params or {}, cutoff, horizon, base_params, data=data)
+
+
+ENGINES: Dict[str, ForecastEngine] = {
+    engine.name: engine for engine in (BaselineForecastEngine(), IntermittentForecastEngine(),
+                                       ProphetForecastEngine())
+}
+
+
+def get_engine(name: Optional[str] = None) -> ForecastEngine:
+    name = name or DEFAULT_ENGINE
+    if name not in ENGINES:
+        raise ValueError(f"Engine de previsao desconhecido: {name}")
+    return ENGINES[name]
+
+
+def engine_for_model(model) -> ForecastEngine:
+    """Engine de um modelo ja carregado (pelo tipo do modelo)."""
+    kind = model_format.model_type(model)
+    for engine in ENGINES.values():
+        if engine.model_type == kind:
+            return engine
+    return get_engine(DEFAULT_ENGINE)
+
+
+def candidate_engines(intermittent: bool) -> List[str]:
+    """Candidatos de um produto: o Prophet so entra para series regulares."""
+    if not ENGINE_SELECTION_ENABLED:
+        return ['intermittent'] if intermittent else [DEFAULT_ENGINE]
+    return ['intermittent', 'baseline'] if intermittent else ['baseline', DEFAULT_ENGINE]
+
+
+def _predict_ms(engine: ForecastEngine, model, last_date, days: int = 30, repeat: int = 3) -> float:
+    future = pd.DataFrame({'ds': pd.date_range(pd.Timestamp(last_date) + pd.Timedelta(days=1), periods=days)})
+    for name in getattr(model, 'extra_regressors', None) or {}:
+        # Regressores no ultimo valor do historico: apenas o tempo de predicao e medido
+        future[name] = model.history[name].iloc[-1]
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        engine.predict(model, future)
+        best = min(best, time.perf_counter() - start)
+    return round(best * 1000, 3)
+
+
+def _metric(metrics: Optional[Dict[str, Any]], name: str) -> Optional[float]:
+    value = (metrics or {}).get(name)
+    return None if value is None else float(value)
+
+
+def profile_engine(name: str, df: pd.DataFrame, cutoffs: Optional[List] = None) -> Dict[str, Any]:
+    """Metricas de validacao cruzada e tempos medidos de ajuste e predicao de um engine barato."""
+    engine = get_engine(name)
+    metrics = engine.evaluate(df, cutoffs=cutoffs)
+    start = time.perf_counter()
+    model = engine.fit(df)
+    fit_s = time.perf_counter() - start
+    return {
+        'mae': _metric(metrics, 'mae'),
+        'rmse': _metric(metrics, 'rmse'),
+        'fit_s': round(fit_s, 6),
+        'train_s': round(fit_s + metrics.get('fold_s', 0.0) * metrics.get('folds', 0), 6),
+        'predict_ms': _predict_ms(engine, model, pd.to_datetime(df['ds']).max()),
+        'params': model.get_params(),
+        'source': 'current'
+    }
+
+
+def select_engine(profiles: Dict[str, Dict[str, Any]], tolerance: Optional[float] = None,
+                  metric: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Engine mais barato cujo erro fica dentro da tolerancia do melhor
+    candidato com metricas. Sem metricas (historico curto) vale o primeiro
+    candidato.
+    """
+    tolerance = ACCURACY_TOLERANCE if tolerance is None else tolerance
+    metric = metric or SELECTION_METRIC
+    measured = {name: p for name, p in profiles.items() if p.get(metric) is not None}
+    decision = {'metric': metric, 'tolerance': tolerance, 'candidates': profiles,
+                'decided_at': pd.Timestamp.now().isoformat()}
+    if not measured:
+        return {**decision, 'engine': next(iter(profiles), DEFAULT_ENGINE), 'target': None,
+                'reason': 'sem metricas de validacao cruzada'}
+    best_error = min(p[metric] for p in measured.values())
+    target = best_error * (1 + tolerance) + 1e-9
+    eligible = [name for name, p in measured.items() if p[metric] <= target]
+    chosen = min(eligible, key=lambda name: (get_engine(name).estimate_cost(measured[name]), name))
+    best = min(measured, key=lambda name: measured[name][metric])
+    reason = 'mais preciso' if chosen == best else f"mais barato dentro de {tolerance:.0%} do {best}"
+    return {**decision, 'engine': chosen, 'target': round(target, 6), 'reason': reason}
+
+
+def preselect_engine(df: pd.DataFrame, candidates: Iterable[str],
+                     prior: Optional[Dict[str, Any]] = None) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Avalia os candidatos baratos antes de qualquer ajuste do Prophet.
+    Retorna (decisao, perfis); a decisao e None quando o Prophet e candidato
+    e ainda nao tem metricas validas (precisa ser treinado para comparar).
+    `prior` vem de previous_prophet_profile, que ja descarta metricas expiradas.
+    """
+    candidates = list(candidates)
+    cutoffs = _cv_cutoffs(df)
+    profiles = {name: profile_engine(name, df, cutoffs) for name in candidates if name != 'prophet'}
+    if 'prophet' in candidates:
+        if not prior or prior.get(SELECTION_METRIC) is None:
+            return None, profiles
+        profiles['prophet'] = {**prior, 'source': 'previous', 'reuses': prior.get('reuses', 0) + 1}
+    return select_engine(profiles), profiles
+
+
+def prophet_profile(metrics: Optional[Dict[str, Any]], stages: Dict[str, Dict[str, float]], model,
+                    last_date) -> Dict[str, Any]:
+    """
+    Perfil do Prophet treinado na rodada: metricas de CV, tempo de ajuste (e
+    busca, a partir das etapas da telemetria) e de predicao.
+    """
+    fit_s = stages.get('fit', {}).get('wall_s')
+    train_s = sum(stages.get(stage, {}).get('wall_s', 0.0) for stage in ('search', 'fit', 'evaluate'))
+    return {
+        'mae': _metric(metrics, 'mae'),
+        'rmse': _metric(metrics, 'rmse'),
+        'fit_s': round(fit_s, 6) if fit_s is not None else None,
+        'train_s': round(train_s, 6) if train_s else fit_s,
+        'predict_ms': _predict_ms(get_engine('prophet'), model, last_date),
+        'source': 'current'
+    }
+
+
+def previous_prophet_profile(entry: Optional[Dict[str, Any]],
+                             max_reuses: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """
+    Perfil do Prophet registrado na ultima decisao do produto (entrada do
+    manifesto). Metricas ja reutilizadas em `max_reuses` decisoes seguidas
+    (AI_ENGINE_PRIOR_MAX_REUSES) expiram: o Prophet volta a ser treinado e
+    avaliado nos dados atuais.
+    """
+    max_reuses = PRIOR_MAX_REUSES if max_reuses is None else max_reuses
+    candidates = ((entry or {}).get('engine_decision') or {}).get('candidates') or {}
+    profile = candidates.get('prophet')
+    if not profile or profile.get('reuses', 0) >= max_reuses:
+        return None
+    return {k: v for k, v in profile.items() if k != 'source'}
+
+
+def _saved_prophet_params(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if saved.get('engine', DEFAULT_ENGINE) == DEFAULT_ENGINE:
+        return saved.get('parameters')
+    return saved.get('prophet_parameters')
+
+
+def train_engine_product(product_name: str, job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Job de treino (trainer e retrainer) de um produto servido por um engine
+    barato: usa a decisao ja tomada (job['decision']) ou seleciona entre
+    job['candidates'], ajusta no historico completo e exporta como os jobs
+    do Prophet. O engine intermitente usa o job de intermittent_demand.
+    """
+    from model_export import export_model
+    from model_manifest import atomic_write, compute_data_fingerprint
+    from product_name_utils import get_normalized_filename, normalize_product_name
+    from training_telemetry import TrainingTelemetry, write_telemetry
+
+    product_df = job['data']
+    models_dir = job['models_dir']
+    telemetry = TrainingTelemetry(product_name)
+    decision = job.get('decision')
+    if decision is None:
+        with telemetry.stage('evaluate'):
+            decision, _ = preselect_engine(product_df, [c for c in job['candidates'] if c != 'prophet'])
+    name = decision['engine']
+    profile = decision['candidates'].get(name, {})
+    print(f"Engine {name} para {product_name} ({decision['reason']})")
+
+    results_filename = os.path.join(models_dir, get_normalized_filename(product_name, 'params'))
+    extra = {'engine_decision': decision}
+    prophet_params = _saved_prophet_params(results_filename)
+    if prophet_params:
+        # Mantem os parametros otimizados do Prophet para quando ele voltar a ser escolhido
+        extra['prophet_parameters'] = prophet_params
+    if name == IntermittentForecastEngine.name:
+        result = train_intermittent_product(product_name, {**job, 'params': profile.get('params'),
+                                                           'results': extra, 'telemetry': telemetry})
+        return {**result, 'engine_decision': decision, 'prophet_trained': bool(job.get('prophet_trained'))}
+
+    engine = get_engine(name)
+    with telemetry.stage('fit'):
+        start = time.perf_counter()
+        model = engine.fit(product_df, profile.get('params'))
+        fit_us = (time.perf_counter() - start) * 1e6
+
+    metrics = {'mae': profile.get('mae'), 'rmse': profile.get('rmse')}
+    results = {
+        'product_name': product_name,
+        'normalized_name': normalize_product_name(product_name),
+        'engine': name,
+        'parameters': model.get_params(),
+        'metrics': metrics,
+        'search': {'strategy': name, 'trials': 0, 'fits': 0, 'best_rmse': None, 'elapsed_s': 0.0},
+        **extra
+    }
+    with telemetry.stage('save'):
+        export = export_model(model, product_name, models_dir)
+        atomic_write(results_filename, json.dumps(results, indent=4, ensure_ascii=False, default=str))
+    print(f"Modelo {name} para {product_name} salvo em {export['model_path']} "
+          f"({export['compact_bytes']} bytes, ajuste em {fit_us:.0f} us)")
+
+    stats = telemetry.finish()
+    write_telemetry(models_dir, stats)
+    return {
+        'model_file': os.path.basename(export['model_path']),
+        'data_fingerprint': compute_data_fingerprint(product_df),
+        'engine': name,
+        'engine_decision': decision,
+        'parameters': results['parameters'],
+        'metrics': metrics,
+        'search': results['search'],
+        'fit_us': round(fit_us, 1),
+        'prophet_trained': bool(job.get('prophet_trained')),
+        'export': {k: v for k, v in export.items() if k != 'model_path'},
+        'telemetry': stats
+    }
+
+
+def summarize_engines(results) -> Dict[str, Any]:
+    """Produtos por engine escolhido e quantos dispensaram o ajuste do Prophet."""
+    succeeded = [r for r in results if r.get('status') == 'success']
+    engines: Dict[str, int] = {}
+    for result in succeeded:
+        name = result.get('engine') or DEFAULT_ENGINE
+        engines[name] = engines.get(name, 0) + 1
+    return {
+        'engines': engines,
+        'prophet_skipped': sum(1 for r in succeeded if not r.get('prophet_trained', True)),
+        'tolerance': ACCURACY_TOLERANCE,
+        'metric': SELECTION_METRIC
+    }
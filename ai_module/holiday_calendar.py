@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache de calendarios de feriados.
+make_holidays_df e chamado pelo treino, retreino, avaliacao e analise de
+sazonalidade sempre para os mesmos (pais, faixa de anos). Cada calendario e
+gerado uma unica vez, gravado como uma tabela compacta (ds, holiday) em
+AI_CALENDAR_DIR e mantido em memoria; chamadas seguintes, inclusive de
+outros processos, so leem o artefato.
+"""
+
+import logging
+import os
+import tempfile
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CALENDAR_DIR = os.getenv('AI_CALENDAR_DIR', os.path.join(SCRIPT_DIR, 'cache', 'calendars'))
+
+_memory: Dict[Tuple[str, int, int], pd.DataFrame] = {}
+_lock = threading.Lock()
+
+
+def _holidays_version() -> str:
+    # Uma nova versao do pacote holidays pode mudar o calendario: entra na chave do arquivo
+    try:
+        import holidays
+        return str(holidays.__version__)
+    except Exception:
+        return 'unknown'
+
+
+def calendar_path(country: str, first_year: int, last_year: int, calendar_dir: Optional[str] = None) -> str:
+    return os.path.join(
+        calendar_dir or CALENDAR_DIR,
+        f"holidays_{country}_{first_year}_{last_year}_v{_holidays_version()}.csv"
+    )
+
+
+def _build_calendar(country: str, first_year: int, last_year: int) -> pd.DataFrame:
+    from prophet.make_holidays import make_holidays_df
+    holidays = make_holidays_df(year_list=range(first_year, last_year + 1), country=country)
+    return _compact(holidays)
+
+
+def _compact(holidays: pd.DataFrame) -> pd.DataFrame:
+    table = pd.DataFrame({
+        'ds': pd.to_datetime(holidays['ds']).astype('datetime64[ns]'),
+        'holiday': holidays['holiday'].astype(str)
+    })
+    return table.sort_values(['ds', 'holiday'], kind='stable').reset_index(drop=True)
+
+
+def _read_calendar(path: str) -> Optional[pd.DataFrame]:
+    try:
+        return _compact(pd.read_csv(path, parse_dates=['ds']))
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Calendario ilegivel em {path}, gerando novamente: {e}")
+        return None
+
+
+def _write_calendar(path: str, table: pd.DataFrame):
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            table.to_csv(f, index=False, date_format='%Y-%m-%d')
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Nao foi possivel gravar o calendario {path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def get_holidays(country: str = 'BR', first_year: Optional[int] = None, last_year: Optional[int] = None,
+                 years: Optional[Iterable[int]] = None, calendar_dir: Optional[str] = None) -> pd.DataFrame:
+    """
+    Feriados de `country` entre `first_year` e `last_year` (inclusive), ou
+    para a faixa coberta por `years`. Retorna uma copia; o chamador pode
+    altera-la livremente.
+    """
+    if years is not None:
+        years = list(years)
+        first_year, last_year = min(years), max(years)
+    key = (country, int(first_year), int(last_year))
+
+    with _lock:
+        table = _memory.get(key)
+        if table is None:
+            path = calendar_path(*key, calendar_dir=calendar_dir)
+            table = _read_calendar(path) if os.path.exists(path) else None
+            if table is None:
+                table = _build_calendar(*key)
+                _write_calendar(path, table)
+            _memory[key] = table
+    return table.copy()
+
+
+def holidays_for_dates(dates: pd.Series, country: str = 'BR', years_ahead: int = 1) -> pd.DataFrame:
+    """Feriados cobrindo os anos das datas, mais `years_ahead` anos de horizonte."""
+    dates = pd.to_datetime(dates)
+    return get_holidays(country, dates.min().year, dates.max().year + years_ahead)
+
+
+def clear_memory_cache():
+    """Esvazia a copia em memoria (os artefatos em disco sao mantidos)."""
+    with _lock:
+        _memory.clear()
+
+
+if __name__ == '__main__':
+    import sys
+
+    # Pre-computa um calendario: python holiday_calendar.py 2024 2027 [pais]
+    first, last = int(sys.argv[1]), int(sys.argv[2])
+    country = sys.argv[3] if len(sys.argv) > 3 else 'BR'
+    table = get_holidays(country, first, last)
+    print(f"{len(table)} feriados de {country} ({first}-{last}) em {calendar_path(country, first, last)}")
@@ -1,45 +1,273 @@
-﻿import numpy as np
-from sklearn.model_selection import ParameterGrid
-from prophet import Prophet
-from model_evaluation import evaluate_model
-
-def optimize_hyperparameters(df, param_grid, horizon='30 days', parallel='processes'):
-    """
-    Otimiza os hiperparmetros do modelo Prophet usando grid search.
-    
-    Args:
-        df: DataFrame com os dados de treino (deve ter colunas 'ds' e 'y')
-        param_grid: Dicionrio com os parmetros a serem otimizados
-        horizon: String com o horizonte de previso para validao cruzada
-        parallel: String 'processes' ou 'threads' para paralelizao
-    
-    Returns:
-        Dict com os melhores parmetros encontrados
-    """
-    best_rmse = float('inf')
-    best_params = None
-    
-    # Gera todas as combinaes de parmetros
-    param_combinations = ParameterGrid(param_grid)
-    
-    for params in param_combinations:
-        try:
-            print(f"Testando parmetros: {params}")
-            
-            # Treina o modelo com os parmetros atuais
-            model = Prophet(**params)
-            model.fit(df)
-            
-            # Avalia o modelo
-            metrics = evaluate_model(model, df, horizon=horizon, parallel=parallel)
-            
-            if metrics and metrics['rmse'] < best_rmse:
-                best_rmse = metrics['rmse']
-                best_params = params
-                print(f"Novo melhor RMSE: {best_rmse:.2f}")
-                
-        except Exception as e:
-            print(f"Erro ao testar parmetros {params}: {e}")
-            continue
-    
-    return best_params
\ No newline at end of file
+import math
+import os
+import random
+import time
+from concurrent.futures import as_completed, wait, TimeoutError as FuturesTimeoutError
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import ParameterGrid
+from model_evaluation import evaluate_model, generate_cv_cutoffs
+from forecast_engines import DEFAULT_ENGINE, get_engine
+from cv_cache import data_key
+
+# Estrategia padrao: 'halving' (successive halving sobre os cutoffs) ou 'grid'
+DEFAULT_STRATEGY = os.getenv('AI_HPO_STRATEGY', 'halving')
+# Numero de configuracoes sorteadas da grade na busca com halving
+DEFAULT_MAX_TRIALS = int(os.getenv('AI_HPO_MAX_TRIALS', 27))
+# Orcamento de tempo por produto em segundos (0 = sem limite). Nenhuma dobra nova
+# comeca apos o prazo; as que ja estao rodando terminam (estouro de ate uma dobra)
+DEFAULT_TIME_BUDGET = float(os.getenv('AI_HPO_TIME_BUDGET', 0))
+# Fracao de configuracoes mantida a cada rodada (1/eta)
+DEFAULT_ETA = int(os.getenv('AI_HPO_ETA', 3))
+
+
+_FAILED_FOLD = {'sse': float('inf'), 'abs_error': float('inf'), 'n': 1}
+
+
+def _fold_rmse(folds):
+    sse = sum(f['sse'] for f in folds)
+    n = sum(f['n'] for f in folds)
+    return math.sqrt(sse / n) if n else float('inf')
+
+
+def _rung_sizes(n_cutoffs, n_candidates, eta):
+    """Numero de cutoffs usados em cada rodada, crescendo por um fator eta ate o total."""
+    n_rungs = math.ceil(math.log(n_candidates, eta)) if n_candidates > 1 else 0
+    sizes = []
+    for rung in range(n_rungs + 1):
+        size = min(n_cutoffs, max(1, round(n_cutoffs / eta ** (n_rungs - rung))))
+        if not sizes or size > sizes[-1]:
+            sizes.append(size)
+    return sizes
+
+
+def _safe_fold(df, params, cutoff, horizon, base_params, data=None, engine=DEFAULT_ENGINE):
+    try:
+        return get_engine(engine).evaluate_fold(df, params, cutoff, horizon, base_params, data=data)
+    except Exception as e:
+        print(f"Erro ao testar parmetros {params}: {e}")
+        return dict(_FAILED_FOLD, cutoff=str(cutoff))
+
+
+def _evaluate_rung(df, candidates, survivors, rung_cutoffs, folds, horizon, base_params, pool, deadline,
+                   data=None, engine=DEFAULT_ENGINE):
+    """
+    Avalia as dobras pendentes de uma rodada. Com `pool`, cada dobra
+    (configuracao, cutoff) e uma tarefa independente no pool compartilhado.
+
+    Quando o prazo acaba, as dobras ainda na fila do pool sao canceladas e as
+    que ja estao rodando sao aguardadas (e aproveitadas): um processo nao pode
+    ser interrompido no meio do ajuste, e abandona-las deixaria os slots do
+    pool ocupados para o proximo produto. O retorno acontece, portanto, no
+    maximo uma dobra apos o prazo.
+
+    Returns:
+        (numero de ajustes, True se o orcamento de tempo acabou)
+    """
+    tasks = [(i, cutoff) for i in survivors for cutoff in rung_cutoffs if cutoff not in folds[i]]
+    fits = 0
+
+    if pool is None:
+        for i, cutoff in tasks:
+            if deadline and time.perf_counter() > deadline:
+                return fits, True
+            folds[i][cutoff] = _safe_fold(df, candidates[i], cutoff, horizon, base_params, data, engine)
+            fits += 1
+        return fits, False
+
+    futures = {
+        pool.submit(_safe_fold, df, candidates[i], cutoff, horizon, base_params, data, engine): (i, cutoff)
+        for i, cutoff in tasks
+    }
+    pending = set(futures)
+
+    def collect(future):
+        i, cutoff = futures[future]
+        try:
+            folds[i][cutoff] = future.result()
+        except Exception as e:
+            print(f"Erro ao testar parmetros {candidates[i]}: {e}")
+            folds[i][cutoff] = dict(_FAILED_FOLD, cutoff=str(cutoff))
+        pending.discard(future)
+
+    timeout = max(0.0, deadline - time.perf_counter()) if deadline else None
+    try:
+        for future in as_completed(futures, timeout=timeout):
+            collect(future)
+            fits += 1
+    except FuturesTimeoutError:
+        running = [future for future in pending if not future.cancel()]
+        wait(running)
+        for future in running:
+            collect(future)
+            fits += 1
+        return fits, True
+    return fits, False
+
+
+def successive_halving_search(df, param_grid, horizon='30 days', base_params=None, max_trials=None,
+                              time_budget=None, eta=None, seed=42, initial=None, period=None, pool=None,
+                              engine=DEFAULT_ENGINE):
+    """
+    Busca de hiperparametros por successive halving.
+
+    Um subconjunto aleatorio (e deterministico) da grade e avaliado primeiro
+    nos cutoffs mais recentes; a cada rodada apenas o melhor 1/eta continua e
+    ganha mais cutoffs. Dobras ja avaliadas nao sao refeitas. Se o orcamento
+    de tempo acabar, vence a melhor configuracao da rodada mais avancada.
+    Com `pool` (ver training_pool.get_shared_pool) as dobras de cada rodada
+    rodam em paralelo. As previsoes de cada dobra ficam no cache de CV e sao
+    reaproveitadas pela avaliacao do modelo final. `engine` (forecast_engines)
+    define o modelo ajustado em cada dobra.
+
+    Returns:
+        Dict com best_params, best_rmse, trials, fits, elapsed_s e rungs
+    """
+    max_trials = max_trials or DEFAULT_MAX_TRIALS
+    time_budget = DEFAULT_TIME_BUDGET if time_budget is None else time_budget
+    eta = max(2, eta or DEFAULT_ETA)
+    start = time.perf_counter()
+
+    df = df.copy()
+    df['ds'] = pd.to_datetime(df['ds'])
+    cutoffs = generate_cv_cutoffs(df, horizon=horizon, initial=initial, period=period)
+    if not cutoffs:
+        return {'best_params': None, 'best_rmse': None, 'trials': 0, 'fits': 0,
+                'elapsed_s': 0.0, 'strategy': 'halving', 'rungs': []}
+
+    candidates = list(ParameterGrid(param_grid))
+    random.Random(seed).shuffle(candidates)
+    candidates = candidates[:max_trials]
+
+    data = data_key(df)
+    folds = {i: {} for i in range(len(candidates))}
+    survivors = list(range(len(candidates)))
+    deadline = start + time_budget if time_budget else None
+    rungs = []
+    fits = 0
+    out_of_time = False
+
+    for n_folds in _rung_sizes(len(cutoffs), len(candidates), eta):
+        rung_cutoffs = cutoffs[-n_folds:]
+        rung_fits, out_of_time = _evaluate_rung(df, candidates, survivors, rung_cutoffs, folds,
+                                                horizon, base_params, pool, deadline, data, engine)
+        fits += rung_fits
+        evaluated = [i for i in survivors if all(c in folds[i] for c in rung_cutoffs)]
+
+        scored = sorted(evaluated, key=lambda i: (_fold_rmse(folds[i].values()), i))
+        if scored:
+            rungs.append({
+                'cutoffs': n_folds,
+                'candidates': len(scored),
+                'best_rmse': round(_fold_rmse(folds[scored[0]].values()), 4)
+            })
+            print(f"Rodada com {n_folds} cutoff(s): {len(scored)} configuracoes, "
+                  f"melhor RMSE {_fold_rmse(folds[scored[0]].values()):.2f}")
+        if out_of_time or len(scored) <= 1:
+            survivors = scored or survivors
+            break
+        survivors = scored[:max(1, len(scored) // eta)]
+
+    if out_of_time:
+        print(f"Orcamento de tempo de {time_budget:.0f}s esgotado; usando a melhor configuracao avaliada")
+
+    # Melhor configuracao entre as que chegaram mais longe
+    max_folds = max(len(f) for f in folds.values())
+    finalists = [i for i in folds if len(folds[i]) == max_folds]
+    best = min(finalists, key=lambda i: (_fold_rmse(folds[i].values()), i))
+    best_rmse = _fold_rmse(folds[best].values())
+
+    return {
+        'best_params': candidates[best] if math.isfinite(best_rmse) else None,
+        'best_rmse': best_rmse if math.isfinite(best_rmse) else None,
+        'trials': len(candidates),
+        'fits': fits,
+        'elapsed_s': round(time.perf_counter() - start, 3),
+        'strategy': 'halving',
+        'rungs': rungs
+    }
+
+
+def grid_search(df, param_grid, horizon='30 days', parallel='processes', base_params=None, engine=DEFAULT_ENGINE):
+    """Grid search exaustivo (comportamento original)."""
+    forecast_engine = get_engine(engine)
+    best_rmse = float('inf')
+    best_params = None
+    start = time.perf_counter()
+    trials = 0
+
+    # Gera todas as combinaes de parmetros
+    param_combinations = ParameterGrid(param_grid)
+
+    for params in param_combinations:
+        trials += 1
+        try:
+            print(f"Testando parmetros: {params}")
+
+            if forecast_engine.name == 'prophet':
+                # Treina o modelo com os parmetros atuais
+                model = forecast_engine.fit(df, params, base_params)
+
+                # Avalia o modelo
+                metrics = evaluate_model(model, df, horizon=horizon, parallel=parallel)
+            else:
+                metrics = forecast_engine.evaluate(df, params, horizon=horizon, base_params=base_params)
+
+            if metrics and metrics['rmse'] < best_rmse:
+                best_rmse = metrics['rmse']
+                best_params = params
+                print(f"Novo melhor RMSE: {best_rmse:.2f}")
+
+        except Exception as e:
+            print(f"Erro ao testar parmetros {params}: {e}")
+            continue
+
+    return {
+        'best_params': best_params,
+        'best_rmse': float(best_rmse) if best_params else None,
+        'trials': trials,
+        'fits': None,
+        'elapsed_s': round(time.perf_counter() - start, 3),
+        'strategy': 'grid',
+        'rungs': []
+    }
+
+
+def search_hyperparameters(df, param_grid, horizon='30 days', parallel='processes', strategy=None,
+                           base_params=None, max_trials=None, time_budget=None, eta=None, engine=DEFAULT_ENGINE):
+    """
+    Executa a estrategia de busca configurada e retorna o resumo completo.
+
+    `parallel` pode ser 'processes'/'threads' ou um pool compartilhado
+    (objeto com `.map`/`.submit`), reaproveitado entre configuracoes.
+    `engine` e o engine de previsao buscado (padrao: Prophet).
+    """
+    strategy = strategy or DEFAULT_STRATEGY
+    if strategy == 'grid':
+        return grid_search(df, param_grid, horizon=horizon, parallel=parallel, base_params=base_params,
+                           engine=engine)
+    if strategy != 'halving':
+        raise ValueError(f"Estrategia de busca desconhecida: {strategy}")
+    pool = parallel if hasattr(parallel, 'submit') else None
+    return successive_halving_search(df, param_grid, horizon=horizon, base_params=base_params,
+                                     max_trials=max_trials, time_budget=time_budget, eta=eta, pool=pool,
+                                     engine=engine)
+
+
+def optimize_hyperparameters(df, param_grid, horizon='30 days', parallel='processes', strategy=None, **kwargs):
+    """
+    Otimiza os hiperparmetros do modelo Prophet (ou de outro `engine` nos kwargs).
+
+    Args:
+        df: DataFrame com os dados de treino (deve ter colunas 'ds' e 'y')
+        param_grid: Dicionrio com os parmetros a serem otimizados
+        horizon: String com o horizonte de previso para validao cruzada
+        parallel: 'processes', 'threads' ou pool compartilhado para paralelizao
+        strategy: 'halving' (padrao, AI_HPO_STRATEGY) ou 'grid'
+        **kwargs: base_params, max_trials, time_budget, eta da busca com halving e engine
+
+    Returns:
+        Dict com os melhores parmetros encontrados
+    """
+    return search_hyperparameters(df, param_grid, horizon=horizon, parallel=parallel,
+                                  strategy=strategy, **kwargs)['best_params']
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Modelos de demanda intermitente (Croston, SBA e TSB) para produtos de baixo
+giro, como tortas e doces vendidos em poucos dias da semana. Para essas
+series a busca em grade do Prophet consome a maior parte do tempo de treino
+e ainda preve mal; aqui o ajuste sao algumas suavizacoes exponenciais em
+forma fechada (produto escalar com pesos geometricos), na ordem de
+microssegundos por serie.
+
+    croston: tamanho medio das vendas / intervalo medio entre vendas
+    sba:     croston com correcao de vies (1 - beta / 2) (Syntetos-Boylan)
+    tsb:     probabilidade de venda no dia x tamanho medio (Teunter-Syntetos-
+             Babai); a probabilidade decai a cada dia sem venda
+
+Produtos com fracao de dias sem venda acima de AI_INTERMITTENT_ZERO_SHARE
+tem o engine 'intermittent' (forecast_engines) entre os candidatos no
+lugar do Prophet; quando ele e escolhido, o produto e treinado por
+train_intermittent_product. O modelo tem a mesma interface de predict() do Prophet
+(ds, yhat, yhat_lower, yhat_upper) e e gravado no formato compacto
+(model_format), de modo que o servico, o cache e o pacote de modelos nao
+precisam distinguir os dois.
+"""
+
+import json
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from baseline_engine import INTERVAL_Z, daily_values, demand_matrix, exponential_smoothing
+
+INTERMITTENT_ENABLED = os.getenv('AI_INTERMITTENT_ENGINE', 'true').lower() == 'true'
+# Fracao minima de dias sem venda para usar o modelo intermitente
+ZERO_SHARE_THRESHOLD = float(os.getenv('AI_INTERMITTENT_ZERO_SHARE', 0.4))
+
+METHODS = ('croston', 'sba', 'tsb')
+DEFAULT_METHOD = 'sba'
+DEFAULT_ALPHA = 0.1
+DEFAULT_BETA = 0.1
+EVALUATION_HORIZON = 30
+EVALUATION_ORIGINS = 3
+
+
+def zero_share(values: np.ndarray) -> np.ndarray:
+    """
+    Fracao de dias sem venda de cada linha de uma matriz produtos x dias,
+    contada a partir da primeira venda do produto (produtos lancados depois
+    do inicio da matriz nao contam os dias anteriores). Sem vendas: 1.
+    """
+    if values.shape[1] == 0:
+        return np.ones(values.shape[0])
+    sold = values > 0
+    active = np.arange(values.shape[1]) >= np.argmax(sold, axis=1)[:, None]
+    days = active.sum(axis=1)
+    shares = (active & ~sold).sum(axis=1) / days
+    return np.where(sold.any(axis=1), shares, 1.0)
+
+
+def intermittent_products(df: pd.DataFrame, threshold: Optional[float] = None,
+                          item_col: str = 'item_name') -> Dict[str, float]:
+    """Produtos cuja fracao de dias sem venda e pelo menos `threshold` (nome -> fracao)."""
+    threshold = ZERO_SHARE_THRESHOLD if threshold is None else threshold
+    products, _, values = demand_matrix(df, item_col=item_col)
+    shares = zero_share(values)
+    return {name: round(float(share), 4) for name, share in zip(products, shares) if share >= threshold}
+
+
+def _smooth(values: np.ndarray, alpha: float) -> float:
+    return float(exponential_smoothing(values[None, :], 1, alpha)[0, 0])
+
+
+def fit_rate(values: np.ndarray, method: str = DEFAULT_METHOD, alpha: float = DEFAULT_ALPHA,
+             beta: float = DEFAULT_BETA) -> Tuple[float, float, float]:
+    """
+    Ajusta uma serie diaria. Retorna (tamanho, intervalo ou probabilidade,
+    demanda prevista por dia).
+    """
+    if method not in METHODS:
+        raise ValueError(f"Metodo intermitente desconhecido: {method}")
+    values = np.asarray(values, dtype=float)
+    positions = np.flatnonzero(values > 0)
+    if len(positions) == 0:
+        return 0.0, 0.0, 0.0
+    size = _smooth(values[positions], alpha)
+    if method == 'tsb':
+        probability = _smooth((values > 0).astype(float), beta)
+        return size, probability, size * probability
+    # Intervalos entre vendas, contando o primeiro a partir do inicio da serie
+    interval = _smooth(np.diff(positions, prepend=-1).astype(float), beta)
+    rate = size / interval
+    if method == 'sba':
+        rate *= 1 - beta / 2
+    return size, interval, rate
+
+
+def _spread(values: np.ndarray, rate: float) -> float:
+    """Dispersao da demanda diaria em torno da taxa nos ultimos 90 dias (largura do intervalo)."""
+    recent = values[-90:]
+    return float(np.sqrt(np.mean((recent - rate) ** 2))) if len(recent) else 0.0
+
+
+def _rolling_errors(values: np.ndarray, method: str, alpha: float, beta: float,
+                    horizon: int = EVALUATION_HORIZON,
+                    origins: int = EVALUATION_ORIGINS) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Erros (real - previsto) nos `horizon` dias seguintes a cada origem e a
+    meia largura do intervalo de cada previsao; None sem historico.
+    """
+    cutoffs = [len(values) - horizon * k for k in range(origins, 0, -1) if len(values) - horizon * k >= horizon]
+    if not cutoffs:
+        return None
+    errors, widths = [], []
+    for cutoff in cutoffs:
+        history, actual = values[:cutoff], values[cutoff:cutoff + horizon]
+        rate = fit_rate(history, method, alpha, beta)[2]
+        errors.append(actual - rate)
+        widths.append(np.full(len(actual), INTERVAL_Z * _spread(history, rate)))
+    return np.concatenate(errors), np.concatenate(widths)
+
+
+def select_method(values: np.ndarray, alpha: float = DEFAULT_ALPHA, beta: float = DEFAULT_BETA) -> str:
+    """Metodo de menor MAE com origens moveis (o padrao quando o historico e curto)."""
+    scores = {}
+    for method in METHODS:
+        evaluation = _rolling_errors(values, method, alpha, beta)
+        if evaluation is not None:
+            scores[method] = np.abs(evaluation[0]).mean()
+    return min(scores, key=scores.get) if scores else DEFAULT_METHOD
+
+
+class IntermittentDemandModel:
+    """Previsao de demanda constante por dia para series intermitentes."""
+
+    MODEL_TYPE = 'intermittent'
+
+    def __init__(self, method: str = 'auto', alpha: float = DEFAULT_ALPHA, beta: float = DEFAULT_BETA):
+        self.method = method
+        self.alpha = alpha
+        self.beta = beta
+        self.size = None
+        self.interval = None
+        self.rate = None
+        self.sigma = None
+        self.zero_share = None
+        self.n_days = 0
+        self.last_date = None
+
+    def fit(self, df: pd.DataFrame, date_col: str = 'ds', value_col: str = 'y') -> 'IntermittentDemandModel':
+        values, self.last_date = daily_values(df, date_col, value_col)
+        if self.method == 'auto':
+            self.method = select_method(values, self.alpha, self.beta)
+        self.size, self.interval, self.rate = fit_rate(values, self.method, self.alpha, self.beta)
+        self.sigma = _spread(values, self.rate)
+        self.zero_share = float(zero_share(values[None, :])[0])
+        self.n_days = int(len(values))
+        return self
+
+    def predict(self, future: pd.DataFrame) -> pd.DataFrame:
+        if self.rate is None:
+            raise ValueError("O modelo precisa estar ajustado")
+        ds = pd.to_datetime(future['ds']).reset_index(drop=True)
+        rate = np.full(len(ds), self.rate)
+        return pd.DataFrame({
+            'ds': ds,
+            'yhat': rate,
+            'yhat_lower': np.maximum(rate - INTERVAL_Z * self.sigma, 0.0),
+            'yhat_upper': rate + INTERVAL_Z * self.sigma
+        })
+
+    def get_params(self) -> Dict[str, Any]:
+        return {'method': self.method, 'alpha': self.alpha, 'beta': self.beta}
+
+
+def evaluate_intermittent(df: pd.DataFrame, method: str, alpha: float = DEFAULT_ALPHA,
+                          beta: float = DEFAULT_BETA) -> Dict[str, Optional[float]]:
+    """
+    MAE, RMSE e cobertura do intervalo com origens moveis de 30 dias, no
+    mesmo horizonte da validacao cruzada do Prophet. O MAPE nao e definido
+    em dias sem venda e fica None.
+    """
+    values = daily_values(df)[0]
+    evaluation = _rolling_errors(values, method, alpha, beta)
+    if evaluation is None:
+        return {}
+    errors, widths = evaluation
+    return {
+        'mae': float(np.abs(errors).mean()),
+        'rmse': float(np.sqrt(np.mean(errors ** 2))),
+        'mape': None,
+        'coverage': float(100 * np.mean(np.abs(errors) <= widths))
+    }
+
+
+def train_intermittent_product(product_name: str, job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Job de treino (trainer e retrainer) de um produto intermitente: escolhe
+    o metodo, avalia, exporta e grava os parametros como o job do Prophet.
+    job['params'] fixa o metodo e as constantes ja escolhidos (seletor de
+    engine) e job['results'] acrescenta campos ao arquivo de parametros
+    (ex.: a decisao do seletor).
+    """
+    from model_export import export_model
+    from model_manifest import atomic_write, compute_data_fingerprint
+    from product_name_utils import get_normalized_filename, normalize_product_name
+    from training_telemetry import TrainingTelemetry, write_telemetry
+
+    product_df = job['data']
+    models_dir = job['models_dir']
+    extra = job.get('results') or {}
+    print(f"Treinando modelo intermitente para: {product_name}...")
+    telemetry = job.get('telemetry') or TrainingTelemetry(product_name)
+
+    with telemetry.stage('fit'):
+        start = time.perf_counter()
+        model = IntermittentDemandModel(**(job.get('params') or {'method': job.get('method', 'auto')})).fit(product_df)
+        fit_us = (time.perf_counter() - start) * 1e6
+    with telemetry.stage('evaluate'):
+        metrics = evaluate_intermittent(product_df, model.method, model.alpha, model.beta)
+    print(f"Metodo {model.method} para {product_name}: {model.rate:.2f}/dia "
+          f"({100 * model.zero_share:.0f}% dias sem venda, ajuste em {fit_us:.0f} us)")
+    if metrics:
+        print(f"MAE: {metrics['mae']:.2f}")
+        print(f"RMSE: {metrics['rmse']:.2f}")
+
+    results = {
+        'product_name': product_name,
+        'normalized_name': normalize_product_name(product_name),
+        'engine': IntermittentDemandModel.MODEL_TYPE,
+        'parameters': model.get_params(),
+        'metrics': metrics,
+        'zero_share': model.zero_share,
+        'search': {'strategy': 'intermittent', 'trials': 0, 'fits': 0, 'best_rmse': None, 'elapsed_s': 0.0},
+        **extra
+    }
+    results_filename = os.path.join(models_dir, get_normalized_filename(product_name, 'params'))
+    with telemetry.stage('save'):
+        export = export_model(model, product_name, models_dir)
+        atomic_write(results_filename, json.dumps(results, indent=4, ensure_ascii=False, default=str))
+    print(f"Modelo para {product_name} salvo em {export['model_path']} ({export['compact_bytes']} bytes)")
+
+    stats = telemetry.finish()
+    write_telemetry(models_dir, stats)
+    return {
+        'model_file': os.path.basename(export['model_path']),
+        'data_fingerprint': compute_data_fingerprint(product_df),
+        'engine': results['engine'],
+        'parameters': results['parameters'],
+        'metrics': metrics,
+        'search': results['search'],
+        'fit_us': round(fit_us, 1),
+        'export': {k: v for k, v in export.items() if k != 'model_path'},
+        'telemetry': stats
+    }
+
+
+def summarize_intermittent(results) -> Dict[str, Any]:
+    """Totais dos produtos treinados com o modelo intermitente."""
+    intermittent = [r for r in results if r.get('engine') == IntermittentDemandModel.MODEL_TYPE]
+    methods: Dict[str, int] = {}
+    for result in intermittent:
+        method = (result.get('parameters') or {}).get('method')
+        methods[method] = methods.get(method, 0) + 1
+    return {
+        'products': len(intermittent),
+        'threshold': ZERO_SHARE_THRESHOLD,
+        'methods': methods,
+        'fit_us': round(sum(r.get('fit_us') or 0 for r in intermittent), 1)
+    }
+
+
+if __name__ == '__main__':
+    rng = np.random.default_rng(0)
+    series = rng.poisson(3, 365) * (rng.random(365) < 0.25)
+    for method in METHODS:
+        start = time.perf_counter()
+        for _ in range(1000):
+            fit_rate(series, method)
+        print(f"{method}: {fit_rate(series, method)[2]:.3f}/dia, "
+              f"{(time.perf_counter() - start) * 1000:.1f} us por ajuste")
@@ -1,73 +1,159 @@
-﻿from sklearn.metrics import mean_absolute_error, mean_squared_error
-import numpy as np
-from prophet.diagnostics import cross_validation, performance_metrics
-import pandas as pd
-import logging
-
-logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
-
-def evaluate_model(model, df=None, horizon='30 days', parallel=None, initial=None, period=None):
-    """
-    Avalia o modelo usando validao cruzada do Prophet.
-    
-    Args:
-        model: Modelo Prophet treinado
-        df: DataFrame com os dados de treino
-        horizon: String com o horizonte de previso para validao cruzada
-        parallel: String 'processes' ou 'threads' para paralelizao
-    
-    Returns:
-        Dict com mtricas de avaliao
-    """
-    try:
-        # Determina valores iniciais (initial / period) se no fornecidos e se df estiver disponvel
-        if df is not None and initial is None:
-            try:
-                df = df.copy()
-                df['ds'] = pd.to_datetime(df['ds'])
-                span_days = (df['ds'].max() - df['ds'].min()).days
-                # use 60% of historical span as initial by default (must be > 0)
-                if span_days > 0:
-                    initial = f"{max(1, int(span_days * 0.6))} days"
-            except Exception:
-                initial = initial
-
-        # Executa validao cruzada
-        cv_results = cross_validation(
-            model=model,
-            horizon=horizon,
-            initial=initial,
-            period=period,
-            parallel=parallel
-        )
-        
-        # Calcula mtricas de performance
-        metrics = performance_metrics(cv_results)
-        
-        # Calcula mtricas adicionais
-        y_true = cv_results['y'].values
-        y_pred = cv_results['yhat'].values
-
-        mae = mean_absolute_error(y_true, y_pred)
-        mse = mean_squared_error(y_true, y_pred)
-        rmse = np.sqrt(mse)
-        # MAPE calculado de forma segura: ignorar valores y_true == 0
-        eps = 1e-8
-        nonzero_mask = np.abs(y_true) > eps
-        if nonzero_mask.sum() > 0:
-            mape = np.mean(np.abs((y_true[nonzero_mask] - y_pred[nonzero_mask]) / y_true[nonzero_mask])) * 100
-        else:
-            mape = float('nan')
-        
-        coverage = metrics['coverage'].mean() if 'coverage' in metrics else None
-        return {
-            'mae': mae,
-            'rmse': rmse,
-            'mape': mape,
-            'coverage': coverage,
-            'cv_metrics': metrics
-        }
-        
-    except Exception as e:
-        logging.exception(f"Erro ao avaliar modelo: {e}")
+from sklearn.metrics import mean_absolute_error, mean_squared_error
+import numpy as np
+from prophet import Prophet
+from prophet.diagnostics import cross_validation, performance_metrics, generate_cutoffs
+import pandas as pd
+import logging
+from cv_cache import cv_cache, data_key, model_signature, fold_key, evaluation_key
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
+
+def default_initial(df):
+    """Janela inicial padrao da validacao cruzada: 60% do historico."""
+    span_days = (pd.to_datetime(df['ds']).max() - pd.to_datetime(df['ds']).min()).days
+    return f"{max(1, int(span_days * 0.6))} days"
+
+
+def generate_cv_cutoffs(df, horizon='30 days', initial=None, period=None):
+    """
+    Cutoffs da validacao cruzada (mesma regra do cross_validation do Prophet),
+    em ordem cronologica. Retorna lista vazia se o historico for curto demais.
+    """
+    df = df[['ds', 'y']].copy()
+    df['ds'] = pd.to_datetime(df['ds'])
+    horizon = pd.Timedelta(horizon)
+    initial = pd.Timedelta(initial or default_initial(df))
+    period = pd.Timedelta(period) if period else 0.5 * horizon
+    try:
+        return sorted(generate_cutoffs(df.sort_values('ds'), horizon, initial, period))
+    except ValueError as e:
+        logging.warning(f"Nao foi possivel gerar cutoffs: {e}")
+        return []
+
+
+def evaluate_fold(df, params, cutoff, horizon='30 days', base_params=None, data=None, cache=None):
+    """
+    Avalia uma unica dobra: treina com os dados ate `cutoff` e mede o erro
+    no horizonte seguinte. As somas permitem agregar dobras depois.
+    Com `data` (cv_cache.data_key do historico) as previsoes da dobra sao
+    lidas do cache ou gravadas nele, no mesmo formato do cross_validation.
+    """
+    cache = cv_cache if cache is None else cache
+    cutoff = pd.Timestamp(cutoff)
+    horizon = pd.Timedelta(horizon)
+
+    model = Prophet(**(base_params or {}), **params)
+    key = fold_key(data, model_signature(model), horizon, cutoff) if data else None
+    fold = cache.get_fold(key) if key else None
+    if fold is None:
+        train = df[df['ds'] <= cutoff]
+        test = df[(df['ds'] > cutoff) & (df['ds'] <= cutoff + horizon)]
+        model.fit(train)
+        forecast = model.predict(test.drop(columns=['y']))
+        columns = [c for c in ('ds', 'yhat', 'yhat_lower', 'yhat_upper') if c in forecast]
+        fold = forecast[columns].assign(y=test['y'].values, cutoff=cutoff)
+        if key:
+            cache.put_fold(key, fold)
+
+    errors = fold['y'].values - fold['yhat'].values
+    return {
+        'cutoff': str(cutoff),
+        'sse': float(np.sum(errors ** 2)),
+        'abs_error': float(np.sum(np.abs(errors))),
+        'n': int(len(errors))
+    }
+
+
+def evaluate_model(model, df=None, horizon='30 days', parallel=None, initial=None, period=None, cache=None):
+    """
+    Avalia o modelo usando validao cruzada do Prophet.
+    
+    Args:
+        model: Modelo Prophet treinado
+        df: DataFrame com os dados de treino
+        horizon: String com o horizonte de previso para validao cruzada
+        parallel: String 'processes' ou 'threads' para paralelizao
+        cache: CVResultCache (padrao: cv_cache global). Metricas ja calculadas
+            para os mesmos dados, configuracao, horizonte e cutoffs sao
+            reaproveitadas, assim como dobras ja avaliadas na busca.
+    
+    Returns:
+        Dict com mtricas de avaliao
+    """
+    cache = cv_cache if cache is None else cache
+    try:
+        # Determina valores iniciais (initial / period) se no fornecidos e se df estiver disponvel
+        if df is not None and initial is None:
+            try:
+                df = df.copy()
+                df['ds'] = pd.to_datetime(df['ds'])
+                span_days = (df['ds'].max() - df['ds'].min()).days
+                # use 60% of historical span as initial by default (must be > 0)
+                if span_days > 0:
+                    initial = f"{max(1, int(span_days * 0.6))} days"
+            except Exception:
+                initial = initial
+
+        cutoffs, cv_results, data, signature, eval_key = None, None, None, None, None
+        if cache.enabled and initial is not None:
+            data = data_key(model.history)
+            signature = model_signature(model)
+            cutoffs = generate_cv_cutoffs(model.history, horizon=horizon, initial=initial, period=period) or None
+            if cutoffs:
+                eval_key = evaluation_key(data, signature, horizon, cutoffs)
+                cached = cache.get_evaluation(eval_key)
+                if cached is not None:
+                    logging.info("Metricas de validacao cruzada reaproveitadas do cache")
+                    return cached
+                folds = [cache.get_fold(fold_key(data, signature, horizon, c)) for c in cutoffs]
+                if all(fold is not None for fold in folds):
+                    logging.info("Dobras de validacao cruzada reaproveitadas do cache")
+                    cv_results = pd.concat(folds, ignore_index=True)
+
+        # Executa validao cruzada
+        if cv_results is None:
+            cv_results = cross_validation(
+                model=model,
+                horizon=horizon,
+                initial=initial,
+                period=period,
+                parallel=parallel,
+                cutoffs=cutoffs
+            )
+            if eval_key:
+                for cutoff, fold in cv_results.groupby('cutoff'):
+                    cache.put_fold(fold_key(data, signature, horizon, cutoff), fold)
+        
+        # Calcula mtricas de performance
+        metrics = performance_metrics(cv_results)
+        
+        # Calcula mtricas adicionais
+        y_true = cv_results['y'].values
+        y_pred = cv_results['yhat'].values
+
+        mae = mean_absolute_error(y_true, y_pred)
+        mse = mean_squared_error(y_true, y_pred)
+        rmse = np.sqrt(mse)
+        # MAPE calculado de forma segura: ignorar valores y_true == 0
+        eps = 1e-8
+        nonzero_mask = np.abs(y_true) > eps
+        if nonzero_mask.sum() > 0:
+            mape = np.mean(np.abs((y_true[nonzero_mask] - y_pred[nonzero_mask]) / y_true[nonzero_mask])) * 100
+        else:
+            mape = float('nan')
+        
+        coverage = metrics['coverage'].mean() if 'coverage' in metrics else None
+        result = {
+            'mae': mae,
+            'rmse': rmse,
+            'mape': mape,
+            'coverage': coverage,
+            'cv_metrics': metrics
+        }
+        if eval_key:
+            cache.put_evaluation(eval_key, result)
+        return result
+        
+    except Exception as e:
+        logging.exception(f"Erro ao avaliar modelo: {e}")
         return None
\ No newline at end of file
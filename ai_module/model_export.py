@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Exportacao enxuta dos modelos para inferencia.
+O Prophet ajustado carrega o historico de treino completo, o backend do
+Stan e a saida bruta do otimizador, que a predicao nao usa. O arquivo
+servido (prophet_model_<produto>.mdl, formato compacto de model_format)
+passa a conter apenas o necessario para predict(); o modelo completo fica
+em <models_dir>/full/ para diagnostico (AI_KEEP_FULL_MODELS, padrao true).
+Uma copia enxuta em pickle (.pkl) continua sendo gravada para os
+consumidores legados enquanto AI_WRITE_PICKLE_MODELS estiver ativo.
+"""
+
+import copy
+import os
+import pickle
+import time
+from typing import Any, Dict, List, Optional
+
+import model_format
+from model_manifest import atomic_write
+from product_name_utils import get_normalized_filename
+
+FULL_MODELS_SUBDIR = 'full'
+KEEP_FULL_MODELS = os.getenv('AI_KEEP_FULL_MODELS', 'true').lower() == 'true'
+WRITE_PICKLE_MODELS = os.getenv('AI_WRITE_PICKLE_MODELS', 'true').lower() == 'true'
+
+
+def slim_model(model):
+    """
+    Copia do modelo apenas com o necessario para predict(): o historico e
+    reduzido a ultima linha (o Prophet exige um modelo ajustado), e o backend
+    do Stan, a saida do otimizador e os argumentos do fit sao descartados.
+    """
+    slim = copy.copy(model)
+    if model.history is not None:
+        slim.history = model.history.tail(1).copy()
+    if getattr(model, 'history_dates', None) is not None:
+        slim.history_dates = model.history_dates.tail(1).copy()
+    slim.stan_backend = None
+    slim.stan_fit = None
+    slim.fit_kwargs = {}
+    return slim
+
+
+def full_model_path(models_dir: str, product_name: str) -> str:
+    return os.path.join(models_dir, FULL_MODELS_SUBDIR, get_normalized_filename(product_name, 'model'))
+
+
+def load_full_model(models_dir: str, product_name: str):
+    """Modelo completo (com historico) salvo para diagnostico; None se nao existir."""
+    path = full_model_path(models_dir, product_name)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def _load_time_ms(payload: bytes, loads=pickle.loads, repeat: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        loads(payload)
+        best = min(best, time.perf_counter() - start)
+    return round(best * 1000, 3)
+
+
+def export_model(model, product_name: str, models_dir: str, keep_full: Optional[bool] = None,
+                 write_pickle: Optional[bool] = None) -> Dict[str, Any]:
+    """
+    Grava o modelo enxuto no formato compacto no caminho servido, a copia
+    enxuta em pickle com `write_pickle` e, com `keep_full`, o completo em
+    full/. Retorna tamanhos e tempo de carga de cada versao.
+    """
+    keep_full = KEEP_FULL_MODELS if keep_full is None else keep_full
+    write_pickle = WRITE_PICKLE_MODELS if write_pickle is None else write_pickle
+    # Apenas o Prophet carrega historico e objetos do Stan; os demais modelos ja sao enxutos
+    slim = slim_model(model) if model_format.is_prophet_model(model) else model
+    full_payload = pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)
+    slim_payload = pickle.dumps(slim, protocol=pickle.HIGHEST_PROTOCOL)
+    compact_payload = model_format.to_bytes(slim, product_name)
+
+    # Publicacao atomica: um load_model concorrente nunca le um arquivo pela metade
+    model_path = atomic_write(os.path.join(models_dir, get_normalized_filename(product_name, 'compact')),
+                              compact_payload)
+    if write_pickle:
+        atomic_write(os.path.join(models_dir, get_normalized_filename(product_name, 'model')), slim_payload)
+    if keep_full:
+        os.makedirs(os.path.join(models_dir, FULL_MODELS_SUBDIR), exist_ok=True)
+        atomic_write(full_model_path(models_dir, product_name), full_payload)
+
+    full_load_ms = _load_time_ms(full_payload)
+    slim_load_ms = _load_time_ms(slim_payload)
+    compact_load_ms = _load_time_ms(compact_payload, loads=model_format.from_bytes)
+    return {
+        'model_path': model_path,
+        'full_bytes': len(full_payload),
+        'slim_bytes': len(slim_payload),
+        'compact_bytes': len(compact_payload),
+        'size_reduction_pct': round(100 * (1 - len(slim_payload) / len(full_payload)), 1),
+        'full_load_ms': full_load_ms,
+        'slim_load_ms': slim_load_ms,
+        'compact_load_ms': compact_load_ms,
+        'load_time_reduction_pct': round(100 * (1 - slim_load_ms / full_load_ms), 1) if full_load_ms else None,
+        'full_model_kept': keep_full,
+        'pickle_written': write_pickle
+    }
+
+
+def summarize_exports(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Totais de tamanho e tempo de carga dos modelos exportados na execucao."""
+    exports = [r['export'] for r in results if r.get('export')]
+    if not exports:
+        return {'products': 0}
+    full_bytes = sum(e['full_bytes'] for e in exports)
+    slim_bytes = sum(e['slim_bytes'] for e in exports)
+    full_ms = sum(e['full_load_ms'] for e in exports)
+    slim_ms = sum(e['slim_load_ms'] for e in exports)
+    compact = [e for e in exports if 'compact_bytes' in e]
+    return {
+        'products': len(exports),
+        'full_bytes': full_bytes,
+        'slim_bytes': slim_bytes,
+        'compact_bytes': sum(e['compact_bytes'] for e in compact),
+        'compact_load_ms': round(sum(e['compact_load_ms'] for e in compact), 3),
+        'size_reduction_pct': round(100 * (1 - slim_bytes / full_bytes), 1) if full_bytes else None,
+        'full_load_ms': round(full_ms, 3),
+        'slim_load_ms': round(slim_ms, 3),
+        'load_time_reduction_pct': round(100 * (1 - slim_ms / full_ms), 1) if full_ms else None
+    }
@@ -0,0 +1,498 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Formato compacto e portavel dos modelos Prophet (prophet_model_<produto>.mdl).
+Substitui o pickle no disco e no cache: um cabecalho JSON pequeno descreve
+os atributos do modelo e aponta para os arrays NumPy ajustados (parametros,
+changepoints, colunas das tabelas), gravados em seguida em um bloco binario
+alinhado. Nenhum objeto Python e reconstruido a partir de bytes arbitrarios;
+arquivos vindos de outros hosts sao apenas JSON e numeros.
+
+Layout do arquivo:
+    MAGIC (8 bytes) | tamanho do cabecalho (uint32 LE) | cabecalho JSON |
+    preenchimento ate multiplo de 64 | bloco de arrays (cada um alinhado em 64)
+
+O cabecalho traz a versao do formato, a versao do Prophet que gerou o
+modelo e o sha256 do cabecalho (com o campo do checksum zerado) seguido do
+bloco de arrays; arquivos anteriores, sem 'checksum_scope', cobrem apenas o
+bloco. Na carga, cada array precisa caber no bloco e so sao aceitos os
+atributos que o construtor da classe do modelo define. Outros tipos de modelo servidos
+(MODEL_TYPES, ex.: o modelo intermitente) usam o mesmo layout com
+'model_type' no cabecalho e a versao 2 do formato, que leitores antigos
+recusam em vez de reconstruir como Prophet. A carga pode mapear o arquivo em
+memoria (AI_MODEL_MMAP): os arrays passam a ser visoes somente leitura do
+arquivo, sem copia.
+"""
+
+import hashlib
+import json
+import math
+import mmap as mmap_module
+import os
+import struct
+import sys
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+MAGIC = b'\x93SYNMDL\n'
+FORMAT_NAME = 'synvia-prophet'
+FORMAT_VERSION = 2
+# Modelos Prophet continuam na versao 1 (legivel por leitores anteriores)
+PROPHET_FORMAT_VERSION = 1
+ALIGNMENT = 64
+MODEL_EXTENSION = '.mdl'
+
+# Mapeia o arquivo em memoria na carga em vez de ler para o heap
+MMAP_MODELS = os.getenv('AI_MODEL_MMAP', 'false').lower() == 'true'
+
+# Atributos descartados: objetos do Stan e argumentos do ajuste (so servem para reajustar)
+_SKIPPED_ATTRIBUTES = ('stan_backend', 'stan_fit', 'fit_kwargs')
+# Tipos de array aceitos no bloco binario (sem dtype object)
+_ALLOWED_DTYPE_KINDS = 'biufcmM'
+
+_PREFIX = struct.Struct('<I')
+# O checksum cobre o cabecalho com este valor no lugar do proprio checksum
+_CHECKSUM_PLACEHOLDER = '0' * 64
+CHECKSUM_SCOPE = 'header+blob'
+
+# Outros modelos servidos: tipo -> (modulo, classe), importados apenas na carga
+MODEL_TYPES = {
+    'intermittent': ('intermittent_demand', 'IntermittentDemandModel'),
+    'baseline': ('baseline_engine', 'BaselineModel'),
+}
+
+
+class ModelFormatError(ValueError):
+    """Arquivo ou bytes que nao estao no formato compacto esperado."""
+
+
+def _pad(size: int) -> int:
+    return (-size) % ALIGNMENT
+
+
+def _checksum_field(checksum: str) -> bytes:
+    return f'"checksum":"{checksum}"'.encode('ascii')
+
+
+def _checksum(header_bytes: bytes, blob) -> str:
+    digest = hashlib.sha256()
+    digest.update(header_bytes)
+    digest.update(blob)
+    return digest.hexdigest()
+
+
+def is_prophet_model(value) -> bool:
+    cls = type(value)
+    return cls.__name__ == 'Prophet' and cls.__module__.startswith('prophet')
+
+
+def model_type(value) -> Optional[str]:
+    """Tipo do modelo no formato compacto ('prophet', um de MODEL_TYPES) ou None."""
+    if is_prophet_model(value):
+        return 'prophet'
+    kind = getattr(type(value), 'MODEL_TYPE', None)
+    return kind if kind in MODEL_TYPES else None
+
+
+def is_compact(data) -> bool:
+    return bytes(data[:len(MAGIC)]) == MAGIC
+
+
+class _Encoder:
+    """Converte os atributos do modelo em JSON, separando os arrays para o bloco binario."""
+
+    def __init__(self):
+        self.arrays: Dict[str, Dict[str, Any]] = OrderedDict()
+        self.chunks = []
+        self.size = 0
+
+    def array(self, values) -> Dict[str, Any]:
+        values = np.asarray(values)
+        if values.dtype.kind not in _ALLOWED_DTYPE_KINDS:
+            raise ModelFormatError(f"dtype nao suportado: {values.dtype}")
+        values = np.ascontiguousarray(values)
+        if values.dtype.byteorder == '>':
+            values = values.astype(values.dtype.newbyteorder('<'))
+        name = f"a{len(self.arrays)}"
+        self.arrays[name] = {'dtype': values.dtype.str, 'shape': list(values.shape), 'offset': self.size}
+        payload = values.tobytes()
+        self.chunks.append(payload)
+        self.chunks.append(b'\0' * _pad(len(payload)))
+        self.size += len(payload) + _pad(len(payload))
+        return {'kind': 'array', 'ref': name}
+
+    def _column(self, values) -> Dict[str, Any]:
+        values = np.asarray(values)
+        if values.dtype.kind in _ALLOWED_DTYPE_KINDS:
+            return self.array(values)
+        return {'kind': 'list', 'value': [None if pd.isna(v) else _scalar(v) for v in values]}
+
+    def _index(self, index: pd.Index) -> Dict[str, Any]:
+        if isinstance(index, pd.RangeIndex):
+            return {'kind': 'range', 'start': index.start, 'stop': index.stop, 'step': index.step,
+                    'name': index.name}
+        return {**self._column(index.to_numpy()), 'name': index.name}
+
+    def encode(self, value) -> Dict[str, Any]:
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return {'kind': 'value', 'value': value}
+        if isinstance(value, np.generic):
+            return {'kind': 'value', 'value': value.item()}
+        if isinstance(value, np.ndarray):
+            return self.array(value)
+        if isinstance(value, pd.Timestamp):
+            if value.tz is not None:
+                raise ModelFormatError("Timestamps com fuso horario nao sao suportados")
+            return {'kind': 'timestamp', 'value': value.isoformat()}
+        if isinstance(value, pd.Timedelta):
+            return {'kind': 'timedelta', 'value': int(value.value)}
+        if isinstance(value, pd.Series):
+            return {'kind': 'series', 'name': value.name, 'values': self._column(value.to_numpy()),
+                    'index': self._index(value.index)}
+        if isinstance(value, pd.DataFrame):
+            if len(value.columns) > 1 and value.dtypes.nunique() == 1 \
+                    and value.dtypes.iloc[0].kind in _ALLOWED_DTYPE_KINDS:
+                # Tabela homogenea (ex.: train_component_cols): um unico array 2D
+                return {'kind': 'matrix', 'values': self.array(value.to_numpy()),
+                        'columns': [_plain(c) for c in value.columns], 'columns_name': value.columns.name,
+                        'index': self._index(value.index)}
+            return {
+                'kind': 'frame',
+                'columns': [[name, self._column(value[name].to_numpy())] for name in value.columns],
+                'columns_name': value.columns.name,
+                'index': self._index(value.index)
+            }
+        if isinstance(value, dict):
+            kind = 'ordereddict' if isinstance(value, OrderedDict) else 'dict'
+            return {'kind': kind, 'items': [[key, self.encode(item)] for key, item in value.items()]}
+        if isinstance(value, (list, tuple)):
+            return {'kind': 'list', 'value': [_plain(item) for item in value]}
+        raise ModelFormatError(f"Tipo nao suportado no formato compacto: {type(value).__name__}")
+
+
+def _scalar(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _plain(value):
+    """Valores de listas (ex.: nomes de componentes): apenas tipos JSON."""
+    value = _scalar(value)
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {str(k): _plain(v) for k, v in value.items()}
+    raise ModelFormatError(f"Tipo nao suportado em lista: {type(value).__name__}")
+
+
+def _prophet_version() -> str:
+    try:
+        from prophet.__version__ import __version__
+        return __version__
+    except Exception:
+        return 'unknown'
+
+
+def to_bytes(model, product_name: Optional[str] = None) -> bytes:
+    """Serializa um modelo ajustado (Prophet ou de MODEL_TYPES) no formato compacto."""
+    kind = model_type(model)
+    if kind is None:
+        raise ModelFormatError(f"Esperado um modelo Prophet, recebido {type(model).__name__}")
+    if kind == 'prophet' and getattr(model, 'history', None) is None:
+        raise ModelFormatError("O modelo precisa estar ajustado")
+
+    encoder = _Encoder()
+    attributes = OrderedDict()
+    for name, value in vars(model).items():
+        if name in _SKIPPED_ATTRIBUTES:
+            continue
+        attributes[name] = encoder.encode(value)
+
+    blob = b''.join(encoder.chunks)
+    header = {
+        'format': FORMAT_NAME,
+        'format_version': PROPHET_FORMAT_VERSION if kind == 'prophet' else FORMAT_VERSION,
+        'model_type': kind,
+        'prophet_version': _prophet_version() if kind == 'prophet' else None,
+        'product_name': product_name,
+        'created_at': datetime.now().isoformat(),
+        'blob_bytes': len(blob),
+        'checksum_scope': CHECKSUM_SCOPE,
+        'checksum': _CHECKSUM_PLACEHOLDER,
+        'arrays': encoder.arrays,
+        'attributes': attributes
+    }
+    header_bytes = json.dumps(header, separators=(',', ':'), ensure_ascii=True).encode('ascii')
+    # Mesmo tamanho do placeholder: o layout nao muda ao preencher o checksum
+    header_bytes = header_bytes.replace(_checksum_field(_CHECKSUM_PLACEHOLDER),
+                                        _checksum_field(_checksum(header_bytes, blob)))
+    prefix_size = len(MAGIC) + _PREFIX.size + len(header_bytes)
+    return b''.join([MAGIC, _PREFIX.pack(len(header_bytes)), header_bytes, b' ' * _pad(prefix_size), blob])
+
+
+def _parse_prefix(data) -> Tuple[Dict[str, Any], bytes, int]:
+    """Le o cabecalho de `data` (bytes ou mmap). Retorna (cabecalho, seus bytes, inicio do bloco)."""
+    if len(data) < len(MAGIC) + _PREFIX.size or not is_compact(data):
+        raise ModelFormatError("Assinatura do formato compacto ausente")
+    (header_size,) = _PREFIX.unpack_from(data, len(MAGIC))
+    start = len(MAGIC) + _PREFIX.size
+    if start + header_size > len(data):
+        raise ModelFormatError("Cabecalho truncado")
+    header_bytes = bytes(data[start:start + header_size])
+    try:
+        header = json.loads(header_bytes.decode('ascii'))
+    except ValueError as e:
+        raise ModelFormatError(f"Cabecalho ilegivel: {e}")
+    if not isinstance(header, dict):
+        raise ModelFormatError("Cabecalho ilegivel: esperado um objeto JSON")
+    _check_header(header)
+    blob_start = start + header_size + _pad(start + header_size)
+    return header, header_bytes, blob_start
+
+
+def _check_header(header: Dict[str, Any]):
+    if header.get('format') != FORMAT_NAME:
+        raise ModelFormatError(f"Formato desconhecido: {header.get('format')}")
+    version = header.get('format_version')
+    if not isinstance(version, int) or version > FORMAT_VERSION:
+        raise ModelFormatError(f"Versao do formato nao suportada: {version} (suportada ate {FORMAT_VERSION})")
+    checksum = header.get('checksum')
+    if not isinstance(checksum, str) or len(checksum) != 64:
+        raise ModelFormatError("Checksum do modelo ausente ou invalido")
+    if not isinstance(header.get('blob_bytes'), int) or not isinstance(header.get('arrays'), dict) \
+            or not isinstance(header.get('attributes'), dict):
+        raise ModelFormatError("Cabecalho incompleto")
+
+
+def _checksum_prefix(header: Dict[str, Any], header_bytes: bytes) -> bytes:
+    """Bytes do cabecalho cobertos pelo checksum (vazio nos arquivos que so cobrem o bloco)."""
+    if 'checksum_scope' not in header:
+        return b''
+    if header['checksum_scope'] != CHECKSUM_SCOPE:
+        raise ModelFormatError(f"Escopo do checksum desconhecido: {header['checksum_scope']}")
+    field = _checksum_field(header['checksum'])
+    if header_bytes.count(field) != 1:
+        raise ModelFormatError("Checksum do modelo nao confere")
+    return header_bytes.replace(field, _checksum_field(_CHECKSUM_PLACEHOLDER))
+
+
+def _verify_checksum(header: Dict[str, Any], header_bytes: bytes, blob):
+    if len(blob) != header['blob_bytes']:
+        raise ModelFormatError(f"Bloco de arrays com {len(blob)} bytes, esperado {header['blob_bytes']}")
+    if _checksum(_checksum_prefix(header, header_bytes), blob) != header['checksum']:
+        raise ModelFormatError("Checksum do modelo nao confere")
+
+
+class _Decoder:
+    def __init__(self, header: Dict[str, Any], blob):
+        self.arrays = header['arrays']
+        self.blob = blob
+
+    def array(self, ref: str) -> np.ndarray:
+        spec = self.arrays.get(ref)
+        if not isinstance(spec, dict):
+            raise ModelFormatError(f"Array inexistente no cabecalho: {ref}")
+        dtype = np.dtype(spec['dtype'])
+        if dtype.kind not in _ALLOWED_DTYPE_KINDS:
+            raise ModelFormatError(f"dtype nao suportado: {dtype}")
+        shape = tuple(spec['shape'])
+        offset = spec['offset']
+        if not all(isinstance(n, int) and n >= 0 for n in shape + (offset,)):
+            raise ModelFormatError(f"Forma ou offset invalido no array {ref}")
+        count = math.prod(shape)
+        if offset + count * dtype.itemsize > len(self.blob):
+            raise ModelFormatError(f"Array {ref} excede o bloco de arrays")
+        values = np.frombuffer(self.blob, dtype=dtype, count=count, offset=offset)
+        return values.reshape(shape)
+
+    def _column(self, spec):
+        if spec['kind'] == 'array':
+            return self.array(spec['ref'])
+        return np.array(spec['value'], dtype=object)
+
+    def _index(self, spec) -> pd.Index:
+        if spec['kind'] == 'range':
+            return pd.RangeIndex(spec['start'], spec['stop'], spec['step'], name=spec['name'])
+        return pd.Index(self._column(spec), name=spec['name'])
+
+    def decode(self, spec):
+        kind = spec['kind']
+        if kind == 'value':
+            return spec['value']
+        if kind == 'array':
+            return self.array(spec['ref'])
+        if kind == 'list':
+            return spec['value']
+        if kind == 'timestamp':
+            return pd.Timestamp(spec['value'])
+        if kind == 'timedelta':
+            return pd.Timedelta(spec['value'], unit='ns')
+        if kind == 'series':
+            return pd.Series(self._column(spec['values']), index=self._index(spec['index']), name=spec['name'])
+        if kind == 'matrix':
+            frame = pd.DataFrame(self.array(spec['values']['ref']), index=self._index(spec['index']),
+                                 columns=spec['columns'])
+            frame.columns.name = spec['columns_name']
+            return frame
+        if kind == 'frame':
+            columns = OrderedDict((name, self._column(column)) for name, column in spec['columns'])
+            frame = pd.DataFrame(columns, index=self._index(spec['index']))
+            frame.columns.name = spec['columns_name']
+            return frame
+        if kind in ('dict', 'ordereddict'):
+            items = [(key, self.decode(item)) for key, item in spec['items']]
+            return OrderedDict(items) if kind == 'ordereddict' else dict(items)
+        raise ModelFormatError(f"Tipo de atributo desconhecido: {kind}")
+
+
+_allowed_attributes_cache: Dict[type, frozenset] = {}
+
+
+def _allowed_attributes(cls) -> frozenset:
+    """Atributos que o construtor da classe define: os unicos aceitos no cabecalho."""
+    if cls not in _allowed_attributes_cache:
+        _allowed_attributes_cache[cls] = frozenset(vars(cls()))
+    return _allowed_attributes_cache[cls]
+
+
+def _set_attributes(model, header: Dict[str, Any], blob):
+    allowed = _allowed_attributes(type(model))
+    unknown = sorted(set(header['attributes']) - allowed)
+    if unknown:
+        raise ModelFormatError(f"Atributos nao permitidos para {type(model).__name__}: {unknown}")
+    decoder = _Decoder(header, blob)
+    for name, spec in header['attributes'].items():
+        setattr(model, name, decoder.decode(spec))
+
+
+def _build_model(header: Dict[str, Any], blob):
+    kind = header.get('model_type', 'prophet')
+    if kind != 'prophet':
+        return _build_other_model(kind, header, blob)
+    from prophet import Prophet
+
+    if header.get('prophet_version') == _prophet_version():
+        # Mesma versao: todos os atributos estao no cabecalho, sem passar pelo __init__
+        model = Prophet.__new__(Prophet)
+    else:
+        # Outra versao: o __init__ preenche atributos que o cabecalho nao conhece
+        model = Prophet()
+    _set_attributes(model, header, blob)
+    model.stan_backend = None
+    model.stan_fit = None
+    model.fit_kwargs = {}
+    return model
+
+
+def _build_other_model(kind: str, header: Dict[str, Any], blob):
+    # Sem importar o Prophet: o servico carrega esses modelos sem ele
+    if kind not in MODEL_TYPES:
+        raise ModelFormatError(f"Tipo de modelo desconhecido: {kind}")
+    import importlib
+
+    module_name, class_name = MODEL_TYPES[kind]
+    cls = getattr(importlib.import_module(module_name), class_name)
+    model = cls.__new__(cls)
+    _set_attributes(model, header, blob)
+    return model
+
+
+def from_bytes(data, verify: bool = True):
+    """Reconstroi o modelo a partir de bytes (ou buffer) no formato compacto."""
+    header, header_bytes, blob_start = _parse_prefix(data)
+    blob = memoryview(data)[blob_start:]
+    if verify:
+        _verify_checksum(header, header_bytes, blob)
+    try:
+        return _build_model(header, blob)
+    except ModelFormatError:
+        raise
+    except (KeyError, TypeError, ValueError, IndexError, AttributeError) as e:
+        # Descricao de atributo malformada no cabecalho
+        raise ModelFormatError(f"Cabecalho do modelo invalido: {type(e).__name__}: {e}")
+
+
+def save_model(model, path: str, product_name: Optional[str] = None) -> int:
+    """Grava o modelo no formato compacto. Retorna o tamanho em bytes."""
+    payload = to_bytes(model, product_name)
+    with open(path, 'wb') as f:
+        f.write(payload)
+    return len(payload)
+
+
+def load_model(path: str, mmap: Optional[bool] = None, verify: bool = True):
+    """
+    Carrega um modelo compacto. Com `mmap` (padrao AI_MODEL_MMAP) os arrays
+    sao visoes somente leitura do arquivo mapeado.
+    """
+    mmap = MMAP_MODELS if mmap is None else mmap
+    with open(path, 'rb') as f:
+        if not mmap:
+            return from_bytes(f.read(), verify=verify)
+        mapped = mmap_module.mmap(f.fileno(), 0, access=mmap_module.ACCESS_READ)
+    # O mmap continua vivo enquanto os arrays do modelo o referenciarem
+    return from_bytes(mapped, verify=verify)
+
+
+def _read_prefix(path: str) -> Tuple[Dict[str, Any], bytes, int]:
+    with open(path, 'rb') as f:
+        prefix = f.read(len(MAGIC) + _PREFIX.size)
+        if len(prefix) < len(MAGIC) + _PREFIX.size or not is_compact(prefix):
+            raise ModelFormatError(f"{path} nao esta no formato compacto")
+        (header_size,) = _PREFIX.unpack_from(prefix, len(MAGIC))
+        return _parse_prefix(prefix + f.read(header_size))
+
+
+def read_header(path: str) -> Dict[str, Any]:
+    """Cabecalho do arquivo, sem ler o bloco de arrays."""
+    return _read_prefix(path)[0]
+
+
+def validate_model_file(path: str) -> Dict[str, Any]:
+    """
+    Valida cabecalho e checksum sem reconstruir o modelo (usado pelo health
+    check). Retorna o cabecalho sem a descricao dos atributos.
+    """
+    header, header_bytes, blob_start = _read_prefix(path)
+    digest = hashlib.sha256(_checksum_prefix(header, header_bytes))
+    blob_bytes = 0
+    with open(path, 'rb') as f:
+        f.seek(blob_start)
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+            blob_bytes += len(chunk)
+    if blob_bytes != header['blob_bytes']:
+        raise ModelFormatError(f"Bloco de arrays com {blob_bytes} bytes, esperado {header['blob_bytes']}")
+    if digest.hexdigest() != header['checksum']:
+        raise ModelFormatError("Checksum do modelo nao confere")
+    return {k: v for k, v in header.items() if k not in ('arrays', 'attributes')}
+
+
+def convert_directory(models_dir: str) -> int:
+    """Gera o .mdl de cada prophet_model_*.pkl que ainda nao tem um (migracao dos modelos legados)."""
+    import pickle
+
+    converted = 0
+    for filename in sorted(os.listdir(models_dir)):
+        if not (filename.startswith('prophet_model_') and filename.endswith('.pkl')):
+            continue
+        target = os.path.join(models_dir, filename[:-len('.pkl')] + MODEL_EXTENSION)
+        if os.path.exists(target):
+            continue
+        with open(os.path.join(models_dir, filename), 'rb') as f:
+            model = pickle.load(f)
+        save_model(model, target, product_name=filename[len('prophet_model_'):-len('.pkl')])
+        converted += 1
+    return converted
+
+
+if __name__ == '__main__':
+    # Migra os pickles de um diretorio: python model_format.py [trained_models]
+    directory = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), 'trained_models')
+    print(f"{convert_directory(directory)} modelo(s) convertido(s) em {directory}")
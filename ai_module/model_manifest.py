@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Manifesto de versoes dos modelos treinados.
+Fornece fingerprints dos arquivos de modelo e do dataset de vendas, usados
+para compor chaves de cache versionadas, e o fingerprint dos dados de treino
+de cada produto, usado no retreinamento incremental.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from product_name_utils import (normalize_product_name, get_normalized_filename, reverse_normalize_for_display,
+                                parse_model_filename)
+
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+MODELS_DIR = os.getenv('AI_MODELS_DIR', os.path.join(SCRIPT_DIR, 'trained_models'))
+DATA_FILE = os.getenv('AI_DATA_FILE', os.path.join(SCRIPT_DIR, 'processed_sales_data.csv'))
+MANIFEST_FILENAME = 'manifest.json'
+
+MISSING_VERSION = 'missing'
+# Engine dos modelos treinados antes da selecao de engine (forecast_engines)
+DEFAULT_ENGINE = 'prophet'
+
+# Memoizacao por (mtime, tamanho) para evitar reler arquivos grandes a cada request
+_checksum_cache: Dict[str, tuple] = {}
+_manifest_cache: Dict[str, tuple] = {}
+_lock = threading.Lock()
+
+
+def file_checksum(path: str) -> Optional[str]:
+    """Retorna o SHA-256 (16 hex) do arquivo, recalculando apenas se ele mudou."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    # O inode muda a cada publicacao atomica, mesmo com mtime e tamanho iguais
+    signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        cached = _checksum_cache.get(path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    checksum = digest.hexdigest()[:16]
+
+    with _lock:
+        _checksum_cache[path] = (signature, checksum)
+    return checksum
+
+
+def atomic_write(path: str, payload) -> str:
+    """
+    Publica `payload` (bytes ou str) em `path` sem expor arquivo parcial:
+    grava um temporario no mesmo diretorio, faz fsync e o renomeia por cima
+    do destino. Leitores concorrentes veem o arquivo antigo ou o novo.
+    """
+    if isinstance(payload, str):
+        payload = payload.encode('utf-8')
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    # Persiste a entrada do diretorio (POSIX); no Windows o rename basta
+    if hasattr(os, 'O_DIRECTORY'):
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    return path
+
+
+@contextmanager
+def file_lock(path: str):
+    """Lock exclusivo entre processos (arquivo `<path>.lock`) para read-modify-write."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(f"{path}.lock", 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def get_manifest_path(models_dir: str = MODELS_DIR) -> str:
+    return os.path.join(models_dir, MANIFEST_FILENAME)
+
+
+def load_manifest(models_dir: str = MODELS_DIR) -> Dict[str, Any]:
+    """Carrega o manifesto de modelos ({} se ainda nao existir)."""
+    path = get_manifest_path(models_dir)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return {}
+    # atomic_write troca o inode a cada gravacao, mesmo dentro da resolucao do mtime
+    signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    with _lock:
+        cached = _manifest_cache.get(path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+    manifest = _read_manifest(path)
+    if manifest:
+        with _lock:
+            _manifest_cache[path] = (signature, manifest)
+    return manifest
+
+
+def _read_manifest(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Manifesto de modelos invalido em {path}: {e}")
+        return {}
+
+
+def get_model_path(product_name: str, models_dir: str = MODELS_DIR) -> str:
+    """Arquivo servido do produto: o formato compacto (.mdl) ou, na falta dele, o pickle legado."""
+    compact_path = os.path.join(models_dir, get_normalized_filename(product_name, 'compact'))
+    if os.path.exists(compact_path):
+        return compact_path
+    return os.path.join(models_dir, get_normalized_filename(product_name, 'model'))
+
+
+def update_manifest_entry(models_dir: str, product_name: str, **fields) -> Dict[str, Any]:
+    """
+    Registra/atualiza a entrada de um produto no manifesto.
+
+    A versao do modelo passa a ser o checksum do arquivo salvo e a versao
+    global do manifesto e incrementada. A leitura e a gravacao acontecem sob
+    o lock do manifesto: processos concorrentes (trainer, retrainer, jobs da
+    fila) nao perdem as entradas nem os incrementos de versao uns dos outros.
+    """
+    normalized_name = normalize_product_name(product_name)
+    model_path = get_model_path(product_name, models_dir)
+    version = file_checksum(model_path) or MISSING_VERSION
+    manifest_path = get_manifest_path(models_dir)
+
+    with file_lock(manifest_path):
+        # Rele do disco dentro do lock: outro processo pode ter gravado desde a ultima leitura
+        manifest = _read_manifest(manifest_path)
+        products = dict(manifest.get('products', {}))
+        entry = dict(products.get(normalized_name, {}))
+        entry.update({
+            'product_name': product_name,
+            'model_file': os.path.basename(model_path),
+            'version': version,
+            'updated_at': datetime.now().isoformat()
+        })
+        entry.update(fields)
+        products[normalized_name] = entry
+
+        manifest['products'] = products
+        manifest['version'] = int(manifest.get('version', 0)) + 1
+        manifest['updated_at'] = entry['updated_at']
+
+        atomic_write(manifest_path, json.dumps(manifest, indent=4, ensure_ascii=False))
+    return entry
+
+
+def compute_data_fingerprint(product_df) -> Dict[str, Any]:
+    """
+    Fingerprint do historico de um produto: numero de linhas, data maxima e
+    hash do conteudo (ds, y) independente da ordem das linhas.
+    """
+    import pandas as pd
+
+    data = product_df[['ds', 'y']].copy()
+    data['ds'] = pd.to_datetime(data['ds'])
+    data = data.sort_values(['ds', 'y']).reset_index(drop=True)
+    row_hashes = pd.util.hash_pandas_object(data, index=False).values
+    return {
+        'rows': int(len(data)),
+        'max_date': data['ds'].max().isoformat() if len(data) else None,
+        'content_hash': hashlib.sha256(row_hashes.tobytes()).hexdigest()[:16]
+    }
+
+
+def get_data_fingerprint(product_name: str, models_dir: str = MODELS_DIR) -> Optional[Dict[str, Any]]:
+    """Fingerprint dos dados usados no ultimo treino do produto (None se desconhecido)."""
+    normalized_name = normalize_product_name(product_name)
+    entry = load_manifest(models_dir).get('products', {}).get(normalized_name, {})
+    return entry.get('data_fingerprint')
+
+
+def get_model_engine(product_name: str, models_dir: str = MODELS_DIR) -> str:
+    """Engine escolhido no ultimo treino do produto (registrado pelo trainer/retrainer)."""
+    normalized_name = normalize_product_name(product_name)
+    entry = load_manifest(models_dir).get('products', {}).get(normalized_name, {})
+    return entry.get('engine') or DEFAULT_ENGINE
+
+
+def get_model_version(product_name: str, models_dir: str = MODELS_DIR) -> str:
+    """Versao do modelo: checksum do arquivo servido ou, na falta dele, a do manifesto."""
+    model_path = get_model_path(product_name, models_dir)
+    checksum = file_checksum(model_path)
+    if checksum:
+        return checksum
+
+    normalized_name = normalize_product_name(product_name)
+    entry = load_manifest(models_dir).get('products', {}).get(normalized_name, {})
+    return entry.get('version') or MISSING_VERSION
+
+
+def get_data_version(data_file: str = DATA_FILE) -> str:
+    """Versao do dataset de vendas (checksum do CSV processado)."""
+    return file_checksum(data_file) or MISSING_VERSION
+
+
+def get_product_data_version(product_name: str, models_dir: str = MODELS_DIR) -> str:
+    """
+    Versao dos dados de um produto: hash do historico usado no ultimo treino
+    (data_fingerprint do manifesto). Vendas novas de outros produtos nao a
+    alteram.
+    """
+    fingerprint = get_data_fingerprint(product_name, models_dir) or {}
+    return fingerprint.get('content_hash') or MISSING_VERSION
+
+
+def get_catalog_version(models_dir: str = MODELS_DIR) -> str:
+    """Versao do catalogo de modelos disponiveis (lista de arquivos + versoes)."""
+    manifest = load_manifest(models_dir)
+    if not os.path.isdir(models_dir):
+        return MISSING_VERSION
+
+    model_files = sorted(f for f in os.listdir(models_dir) if parse_model_filename(f))
+    content = f"{manifest.get('version', 0)}:{','.join(model_files)}"
+    return hashlib.md5(content.encode()).hexdigest()[:16]
+
+
+def list_manifest_products(models_dir: str = MODELS_DIR) -> List[Dict[str, Any]]:
+    """
+    Lista os produtos com modelo treinado: entradas do manifesto mais os
+    arquivos prophet_model_*.mdl/.pkl presentes em disco (modelos legados).
+    """
+    entries = load_manifest(models_dir).get('products', {})
+    products = {}
+
+    if os.path.isdir(models_dir):
+        for filename in os.listdir(models_dir):
+            normalized_name = parse_model_filename(filename)
+            # O formato compacto tem preferencia sobre o pickle legado do mesmo produto
+            if normalized_name and (normalized_name not in products or filename.endswith('.mdl')):
+                products[normalized_name] = filename
+
+    result = []
+    for normalized_name in sorted(products):
+        model_path = os.path.join(models_dir, products[normalized_name])
+        entry = entries.get(normalized_name, {})
+        result.append({
+            'normalized_name': normalized_name,
+            'display_name': reverse_normalize_for_display(normalized_name),
+            'model_file': products[normalized_name],
+            'size_bytes': os.path.getsize(model_path),
+            'version': entry.get('version') or file_checksum(model_path) or MISSING_VERSION,
+            'engine': entry.get('engine') or DEFAULT_ENGINE
+        })
+    return result
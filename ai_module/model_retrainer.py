@@ -1,97 +1,337 @@
-﻿import pandas as pd
-from prophet import Prophet
-from prophet.make_holidays import make_holidays_df
-import os
-import pickle
-import json
-
-def retrain_prophet_models(original_data_path, models_dir, new_data_path=None):
-    """Retreina modelos Prophet com dados atualizados e parmetros otimizados."""
-    # Carrega os dados histricos originais
-    df_original = pd.read_csv(original_data_path)
-    df_original["ds"] = pd.to_datetime(df_original["ds"])
-
-    # Se houver novos dados, carrega e concatena
-    if new_data_path and os.path.exists(new_data_path):
-        df_new = pd.read_csv(new_data_path)
-        df_new["ds"] = pd.to_datetime(df_new["ds"])
-        df = pd.concat([df_original, df_new]).drop_duplicates(subset=["ds", "item_name"]).reset_index(drop=True)
-    else:
-        df = df_original
-
-    if df.empty:
-        print("DataFrame vazio aps concatenao. No  possvel retreinar modelos.")
-        return
-
-    unique_products = df["item_name"].unique()
-
-    if not os.path.exists(models_dir):
-        os.makedirs(models_dir)
-
-    # Gerar feriados para o Brasil para os anos dos dados
-    years = range(df["ds"].min().year, df["ds"].max().year + 2)
-    brazil_holidays = make_holidays_df(year_list=years, country=\'BR\')
-
-    for product_name in unique_products:
-        print(f"Retreinando modelo para: {product_name}...")
-        product_df = df[df["item_name"] == product_name][["ds", "y"]]
-
-        if product_df.empty:
-            print(f"Nenhum dado para o produto {product_name}. Pulando retreinamento.")
-            continue
-
-        # Adicionar variveis externas (regressores) - Exemplo
-        product_df["temperatura_media"] = 25 + 5 * (product_df.index % 7) 
-        product_df["promocao"] = (product_df.index % 10 == 0).astype(int)
-
-        # Carregar parmetros otimizados salvos, se existirem
-        params_filename = os.path.join(models_dir, f"prophet_params_{product_name.replace(\' \', \'_\')}.json")
-        optimized_params = {}
-        if os.path.exists(params_filename):
-            with open(params_filename, \'r\') as f:
-                optimized_params = json.load(f)
-        else:
-            # Usar parmetros padro se no houver otimizados
-            optimized_params = {
-                \'changepoint_prior_scale\': 0.1,
-                \'seasonality_prior_scale\': 1.0,
-                \'holidays_prior_scale\': 1.0
-            }
-
-        # Inicializa e treina o modelo Prophet com parmetros otimizados
-        model = Prophet(
-            yearly_seasonality=True,
-            weekly_seasonality=True,
-            daily_seasonality=True,
-            holidays=brazil_holidays,
-            **optimized_params
-        )
-        
-        # Adicionar regressores extras (variveis externas)
-        if "temperatura_media" in product_df.columns:
-            model.add_regressor("temperatura_media")
-        if "promocao" in product_df.columns:
-            model.add_regressor("promocao")
-
-        model.fit(product_df)
-
-        # Salva o modelo retreinado
-        model_filename = os.path.join(models_dir, f"prophet_model_{product_name.replace(\' \', \'_\')}.pkl")
-        with open(model_filename, \'wb\') as f:
-            pickle.dump(model, f)
-        print(f"Modelo para {product_name} retreinado e salvo em {model_filename}")
-
-if __name__ == \'__main__\':
-    import sys
-    # Argumentos: original_data_path, models_dir, new_data_path (opcional)
-    if len(sys.argv) < 3:
-        print("Uso: python model_retrainer.py <original_data_path> <models_dir> [new_data_path]")
-        sys.exit(1)
-
-    original_data_file = sys.argv[1]
-    models_directory = sys.argv[2]
-    new_data_file = sys.argv[3] if len(sys.argv) > 3 else None
-
-    retrain_prophet_models(original_data_file, models_directory, new_data_file)
-
-
+import pandas as pd
+from holiday_calendar import holidays_for_dates
+import os
+import json
+import time
+from sales_partition import ProductPartition
+from sales_resampling import resolve_resolution, resample_sales, is_intraday
+from model_manifest import (update_manifest_entry, compute_data_fingerprint, get_data_fingerprint, get_model_path,
+                            load_manifest, atomic_write, file_lock)
+from product_name_utils import normalize_product_name, get_normalized_filename
+from warm_start import fit_prophet, load_previous_model, summarize_fit_stats
+from model_export import export_model, summarize_exports
+from model_pack import MODEL_PACK_ENABLED, build_model_pack
+from intermittent_demand import INTERMITTENT_ENABLED, intermittent_products, summarize_intermittent
+from forecast_engines import (DEFAULT_ENGINE, SELECTION_METRIC, candidate_engines, get_engine, preselect_engine,
+                              previous_prophet_profile, prophet_profile, select_engine, summarize_engines,
+                              train_engine_product)
+from training_telemetry import TrainingTelemetry, write_telemetry, summarize_telemetry
+from training_governor import apply_training_limits
+from training_pool import (
+    resolve_workers, run_product_jobs, build_training_report,
+    write_training_report, print_training_report
+)
+
+DEFAULT_PARAMS = {
+    'changepoint_prior_scale': 0.1,
+    'seasonality_prior_scale': 1.0,
+    'holidays_prior_scale': 1.0
+}
+
+def append_new_history(original_data_path, new_data_path):
+    """
+    Acrescenta ao CSV historico as linhas de `new_data_path` cujo (ds, item_name)
+    ainda nao existe nele, sem reescrever as linhas atuais. Sem isso o proximo
+    retreino compararia os produtos fora do lote com o historico antigo e os
+    retreinaria com menos dados. A escrita e atomica e roda sob lock de
+    arquivo (jobs concorrentes). Retorna o numero de linhas acrescentadas.
+    """
+    with file_lock(original_data_path):
+        with open(original_data_path, 'rb') as f:
+            content = f.read()
+        current = pd.read_csv(original_data_path)
+        new_rows = pd.read_csv(new_data_path).reindex(columns=current.columns)
+
+        existing = pd.MultiIndex.from_arrays([pd.to_datetime(current["ds"]), current["item_name"]])
+        keys = pd.MultiIndex.from_arrays([pd.to_datetime(new_rows["ds"]), new_rows["item_name"]])
+        new_rows = new_rows[~keys.isin(existing) & ~keys.duplicated()]
+        if new_rows.empty:
+            return 0
+
+        newline = '\r\n' if b'\r\n' in content else '\n'
+        if content and not content.endswith(b'\n'):
+            content += newline.encode()
+        rows = new_rows.to_csv(index=False, header=False, lineterminator=newline)
+        atomic_write(original_data_path, content + rows.encode('utf-8'))
+    return len(new_rows)
+
+
+def retrain_prophet_models(original_data_path, models_dir, new_data_path=None, workers=None, max_memory_mb=None,
+                           force=False, warm_start=None, progress_callback=None, resolution=None):
+    """
+    Retreina modelos Prophet com dados atualizados e parmetros otimizados.
+
+    Apenas produtos cujo historico mudou desde o ultimo treino (fingerprint
+    salvo no manifesto) sao retreinados, a menos que `force` seja True. Os
+    produtos sao retreinados em paralelo (AI_TRAINING_WORKERS /
+    AI_TRAINING_MAX_MEMORY_MB). As linhas novas de `new_data_path` sao
+    acrescentadas ao CSV original ao final, para que o proximo retreino parta
+    do historico completo. Com `warm_start` (AI_RETRAIN_WARM_START) o
+    otimizador parte dos parametros do modelo anterior. `progress_callback`
+    recebe os eventos 'planned' e 'product' (um por produto concluido). As
+    vendas sao agregadas para `resolution` (AI_TRAINING_RESOLUTION, padrao
+    diario); a sazonalidade diaria so e usada em modelos intradiarios.
+    Retorna o relatorio por produto.
+    """
+    if warm_start is None:
+        warm_start = os.getenv('AI_RETRAIN_WARM_START', 'true').lower() == 'true'
+
+    # Carrega os dados histricos originais
+    df_original = pd.read_csv(original_data_path)
+    df_original["ds"] = pd.to_datetime(df_original["ds"])
+
+    # Se houver novos dados, carrega e concatena
+    if new_data_path and os.path.exists(new_data_path):
+        df_new = pd.read_csv(new_data_path)
+        df_new["ds"] = pd.to_datetime(df_new["ds"])
+        df = pd.concat([df_original, df_new]).drop_duplicates(subset=["ds", "item_name"]).reset_index(drop=True)
+    else:
+        df = df_original
+
+    if df.empty:
+        print("DataFrame vazio aps concatenao. No  possvel retreinar modelos.")
+        return
+
+    # Agrega para a resolucao servida antes do ajuste
+    resolution = resolve_resolution(resolution)
+    raw_rows = len(df)
+    df = resample_sales(df, resolution)
+    print(f"Resolucao de treino: {resolution or 'registros originais'} ({raw_rows} -> {len(df)} linhas)")
+
+    if not os.path.exists(models_dir):
+        os.makedirs(models_dir)
+
+    # Gerar feriados para o Brasil para os anos dos dados
+    brazil_holidays = holidays_for_dates(df["ds"], country='BR', years_ahead=1)
+
+    jobs = []
+    skipped = []
+    fingerprints = {}
+    # Particiona o frame uma unica vez; os jobs recebem apenas os offsets de cada produto
+    partition = ProductPartition(df, columns=["ds", "y"])
+    for product_name in partition.products:
+        product_df = partition.get(product_name)
+
+        if product_df.empty:
+            print(f"Nenhum dado para o produto {product_name}. Pulando retreinamento.")
+            continue
+
+        # Produtos com historico inalterado mantem o modelo atual byte a byte
+        fingerprint = compute_data_fingerprint(product_df)
+        fingerprints[product_name] = fingerprint
+        model_path = get_model_path(product_name, models_dir)
+        if not force and os.path.exists(model_path) and get_data_fingerprint(product_name, models_dir) == fingerprint:
+            skipped.append({'product_name': product_name, 'status': 'skipped', 'reason': 'dados inalterados'})
+            continue
+        jobs.append((product_name, {
+            'data': partition.slice_for(product_name),
+            'models_dir': models_dir,
+            'holidays': brazil_holidays,
+            'warm_start': warm_start,
+            'daily_seasonality': is_intraday(resolution)
+        }))
+
+    # Engines candidatos por produto (forecast_engines); produtos de baixo giro
+    # nao passam pelo Prophet. O Prophet e comparado pelas metricas da ultima decisao.
+    intermittent = intermittent_products(df) if INTERMITTENT_ENABLED and jobs else {}
+    previous = load_manifest(models_dir).get('products', {}) if jobs else {}
+    for name, job in jobs:
+        job['candidates'] = candidate_engines(name in intermittent)
+        job['prior'] = previous_prophet_profile(previous.get(normalize_product_name(name)))
+    engine_jobs = [(name, job) for name, job in jobs if DEFAULT_ENGINE not in job['candidates']]
+    jobs = [(name, job) for name, job in jobs if DEFAULT_ENGINE in job['candidates']]
+
+    print(f"{len(jobs) + len(engine_jobs)} produto(s) com dados novos "
+          f"({len(engine_jobs)} sem Prophet); {len(skipped)} inalterado(s)")
+    if progress_callback:
+        progress_callback({'event': 'planned', 'products': [name for name, _ in engine_jobs + jobs],
+                           'skipped': skipped})
+
+    def on_result(result):
+        if progress_callback:
+            progress_callback({'event': 'product', 'result': {k: v for k, v in result.items() if k != 'traceback'}})
+
+    workers = resolve_workers(workers, len(jobs))
+    start = time.perf_counter()
+    results = run_product_jobs(train_engine_product, engine_jobs, workers=1, on_result=on_result,
+                               partition=partition) if engine_jobs else []
+    results += run_product_jobs(retrain_product_model, jobs, workers=workers, max_memory_mb=max_memory_mb,
+                                on_result=on_result, partition=partition) if jobs else []
+
+    # O manifesto e atualizado apenas pelo processo principal, em ordem fixa
+    for result in results:
+        if result['status'] == 'success':
+            decision = {'engine_decision': result['engine_decision']} if result.get('engine_decision') else {}
+            update_manifest_entry(models_dir, result['product_name'], source='retrainer',
+                                  data_fingerprint=fingerprints[result['product_name']],
+                                  engine=result.get('engine', DEFAULT_ENGINE), **decision)
+    results = sorted(results + skipped, key=lambda r: normalize_product_name(r['product_name']))
+
+    # Produtos que falharam mantem o fingerprint antigo e sao retreinados no proximo job
+    appended_rows = 0
+    if new_data_path and os.path.exists(new_data_path):
+        appended_rows = append_new_history(original_data_path, new_data_path)
+
+    report = build_training_report(results, 'retrainer', workers, time.perf_counter() - start)
+    report['fit_stats'] = summarize_fit_stats(results)
+    report['resolution'] = resolution or 'raw'
+    report['appended_rows'] = appended_rows
+    report['telemetry'] = summarize_telemetry(results)
+    report['export'] = summarize_exports(results)
+    report['engines'] = summarize_engines(results)
+    if any(r.get('engine') == 'intermittent' for r in results):
+        report['intermittent'] = summarize_intermittent(results)
+    if MODEL_PACK_ENABLED:
+        report['model_pack'] = build_model_pack(models_dir)
+    write_training_report(models_dir, report)
+    print_training_report(report)
+    return report
+
+
+def load_optimized_params(models_dir, product_name):
+    """Parmetros salvos pelo trainer (formato com 'parameters') ou formato plano antigo."""
+    params_filename = os.path.join(models_dir, get_normalized_filename(product_name, 'params'))
+    if os.path.exists(params_filename):
+        with open(params_filename, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        # Parametros de outros engines nao se aplicam ao Prophet; o ultimo
+        # ajuste do Prophet fica em 'prophet_parameters'
+        if saved.get('engine', DEFAULT_ENGINE) == DEFAULT_ENGINE:
+            return dict(saved.get('parameters', saved))
+        if saved.get('prophet_parameters'):
+            return dict(saved['prophet_parameters'])
+
+    # Usar parmetros padro se no houver otimizados
+    return dict(DEFAULT_PARAMS)
+
+
+def retrain_product_model(product_name, job):
+    """
+    Retreina e salva o modelo de um produto (executado em um worker do pool).
+    Se um engine mais barato atende a meta de erro frente as metricas do
+    Prophet na ultima decisao, o Prophet nao e ajustado. Sem metricas
+    validas (ausentes ou expiradas) o Prophet retreinado e avaliado e a
+    escolha do engine e refeita.
+    """
+    decision, profiles = preselect_engine(job['data'], job.get('candidates') or [DEFAULT_ENGINE], job.get('prior'))
+    if decision and decision['engine'] != DEFAULT_ENGINE:
+        return train_engine_product(product_name, {**job, 'decision': decision})
+
+    print(f"Retreinando modelo para: {product_name}...")
+    telemetry = TrainingTelemetry(product_name)
+    product_df = job['data'].copy()
+    models_dir = job['models_dir']
+
+    # Adicionar variveis externas (regressores) - Exemplo
+    product_df["temperatura_media"] = 25 + 5 * (product_df.index % 7) 
+    product_df["promocao"] = (product_df.index % 10 == 0).astype(int)
+
+    # Carregar parmetros otimizados salvos, se existirem
+    optimized_params = load_optimized_params(models_dir, product_name)
+
+    def build_model():
+        # Inicializa o modelo Prophet com parmetros otimizados
+        model = get_engine(DEFAULT_ENGINE).build(optimized_params, {
+            'yearly_seasonality': True,
+            'weekly_seasonality': True,
+            'daily_seasonality': job['daily_seasonality'],
+            'holidays': job['holidays']
+        })
+
+        # Adicionar regressores extras (variveis externas)
+        if "temperatura_media" in product_df.columns:
+            model.add_regressor("temperatura_media")
+        if "promocao" in product_df.columns:
+            model.add_regressor("promocao")
+        return model
+
+    # Parte dos parametros do modelo anterior quando a estrutura nao mudou
+    with telemetry.stage('load_previous'):
+        previous_model = load_previous_model(get_model_path(product_name, models_dir)) if job['warm_start'] else None
+    with telemetry.stage('fit'):
+        model, fit_stats = fit_prophet(build_model, product_df, previous_model, warm_start=job['warm_start'])
+    telemetry.record(stan_iterations=fit_stats['iterations'], fit_mode=fit_stats['mode'])
+    print(f"Ajuste {fit_stats['mode']} de {product_name}: {fit_stats['fit_time_s']:.2f}s, "
+          f"{fit_stats['iterations']} iteracoes")
+
+    if decision is None and any(p.get(SELECTION_METRIC) is not None for p in profiles.values()):
+        # Metricas do Prophet ausentes ou expiradas: avalia nos mesmos cutoffs e refaz a escolha do engine
+        from model_evaluation import evaluate_model
+        with telemetry.stage('evaluate'):
+            metrics = evaluate_model(model, product_df)
+        profiles[DEFAULT_ENGINE] = prophet_profile(metrics, telemetry.stages, model, product_df['ds'].max())
+        decision = select_engine(profiles)
+        if decision['engine'] != DEFAULT_ENGINE:
+            return train_engine_product(product_name, {**job, 'decision': decision, 'prophet_trained': True})
+
+    # Salva o modelo retreinado
+    with telemetry.stage('save'):
+        export = export_model(model, product_name, models_dir)
+    print(f"Modelo para {product_name} retreinado e salvo em {export['model_path']} "
+          f"({export['compact_bytes']} bytes, pickle enxuto {export['size_reduction_pct']}% menor que o completo)")
+
+    stats = telemetry.finish()
+    write_telemetry(models_dir, stats)
+    return {'model_file': os.path.basename(export['model_path']), 'engine': DEFAULT_ENGINE, 'engine_decision': decision,
+            'parameters': optimized_params, 'fit': fit_stats, 'prophet_trained': True,
+            'export': {k: v for k, v in export.items() if k != 'model_path'}, 'telemetry': stats}
+
+class StatusFileWriter:
+    """Grava o progresso do retreino em um arquivo JSON (lido pela fila de jobs do servico)."""
+
+    def __init__(self, path):
+        self.path = path
+        self.status = {'status': 'running', 'pid': os.getpid(), 'planned': [], 'skipped': [], 'products': {}}
+        self._write()
+
+    def __call__(self, event):
+        if event['event'] == 'planned':
+            self.status['planned'] = event['products']
+            self.status['skipped'] = [r['product_name'] for r in event['skipped']]
+        elif event['event'] == 'product':
+            self.status['products'][event['result']['product_name']] = event['result']
+        self._write()
+
+    def finish(self, report, error=None):
+        self.status.update({'status': 'failed' if error else 'completed', 'report': report, 'error': error})
+        self._write()
+
+    def _write(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.status, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, self.path)
+
+
+if __name__ == '__main__':
+    import sys
+    # Argumentos: original_data_path, models_dir, new_data_path (opcional),
+    # --force e --status-file <caminho> (opcionais)
+    args = sys.argv[1:]
+    # Prioridade, CPUs e memoria definidos pelo governador de treino (training_governor)
+    apply_training_limits()
+    force_retrain = '--force' in args
+    args = [arg for arg in args if arg != '--force']
+    status_writer = None
+    if '--status-file' in args:
+        index = args.index('--status-file')
+        status_writer = StatusFileWriter(args[index + 1])
+        del args[index:index + 2]
+    if len(args) < 2:
+        print("Uso: python model_retrainer.py <original_data_path> <models_dir> [new_data_path] "
+              "[--force] [--status-file <caminho>]")
+        sys.exit(1)
+
+    original_data_file = args[0]
+    models_directory = args[1]
+    new_data_file = args[2] if len(args) > 2 else None
+
+    try:
+        final_report = retrain_prophet_models(original_data_file, models_directory, new_data_file,
+                                              force=force_retrain, progress_callback=status_writer)
+    except Exception as e:
+        if status_writer:
+            status_writer.finish(None, error=f"{type(e).__name__}: {e}")
+        raise
+    if status_writer:
+        status_writer.finish(final_report)
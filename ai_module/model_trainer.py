@@ -1,107 +1,342 @@
-﻿import pandas as pd
-from prophet import Prophet
-from seasonality_analysis import recommend_seasonalities, generate_holidays_for_df
-import os
-import pickle
-import json
-from dotenv import load_dotenv
-from hyperparameter_optimization import optimize_hyperparameters
-from model_evaluation import evaluate_model
-from product_name_utils import normalize_product_name, get_normalized_filename
-
-def train_prophet_models(data_path, models_dir):
-    """Treina um modelo Prophet para cada produto com otimizao de hiperparmetros."""
-    # Carrega variveis de ambiente
-    load_dotenv()
-    
-    df = pd.read_csv(data_path)
-
-    if df.empty:
-        print("DataFrame vazio. No  possvel treinar modelos.")
-        return
-
-    df["ds"] = pd.to_datetime(df["ds"])
-    unique_products = df["item_name"].unique()
-
-    if not os.path.exists(models_dir):
-        os.makedirs(models_dir)
-
-    # Detectar sazonalidades recomendadas e gerar feriados
-    seasonalities = recommend_seasonalities(df, date_col='ds')
-    brazil_holidays = generate_holidays_for_df(df, country='BR', date_col='ds')
-
-    # Grade de hiperparmetros para otimizao
-    param_grid = {
-        'changepoint_prior_scale': [0.001, 0.01, 0.1, 0.5],
-        'seasonality_prior_scale': [0.1, 1.0, 10.0],
-        'holidays_prior_scale': [0.1, 1.0, 10.0],
-        'changepoint_range': [0.8, 0.9, 0.95]
-    }
-
-    for product_name in unique_products:
-        print(f"Treinando modelo para: {product_name}...")
-        product_df = df[df["item_name"] == product_name][["ds", "y"]]
-
-        if product_df.empty:
-            print(f"Nenhum dado para o produto {product_name}. Pulando.")
-            continue
-
-        # Otimiza hiperparmetros
-        print("Otimizando hiperparmetros...")
-        best_params = optimize_hyperparameters(product_df, param_grid)
-        
-        if not best_params:
-            print(f"Falha na otimizao para {product_name}. Usando parmetros padro.")
-            best_params = {
-                'changepoint_prior_scale': 0.1,
-                'seasonality_prior_scale': 1.0,
-                'holidays_prior_scale': 1.0,
-                'changepoint_range': 0.9
-            }
-
-        # Inicializa e treina o modelo Prophet com parmetros otimizados
-        model = Prophet(
-            yearly_seasonality=seasonalities.get('yearly', True),
-            weekly_seasonality=seasonalities.get('weekly', True),
-            daily_seasonality=seasonalities.get('daily', False),
-            holidays=brazil_holidays,
-            **best_params
-        )
-
-        model.fit(product_df)
-        
-        # Avalia o modelo
-        print("Avaliando modelo...")
-        metrics = evaluate_model(model, product_df)
-        
-        if metrics:
-            print(f"Mtricas de avaliao para {product_name}:")
-            print(f"MAE: {metrics['mae']:.2f}")
-            print(f"RMSE: {metrics['rmse']:.2f}")
-            print(f"MAPE: {metrics['mape']:.2f}%")
-            print(f"Coverage: {metrics['coverage']:.2f}%")
-
-        # Salva o modelo treinado
-        normalized_name = normalize_product_name(product_name)
-        model_filename = os.path.join(models_dir, get_normalized_filename(product_name, 'model'))
-        with open(model_filename, 'wb') as f:
-            pickle.dump(model, f)
-        print(f"Modelo para {product_name} salvo em {model_filename}")
-            
-        # Salva os parmetros e mtricas
-        results = {
-            'product_name': product_name,
-            'normalized_name': normalized_name,
-            'parameters': best_params,
-            'metrics': metrics if metrics else {}
-        }
-        
-        results_filename = os.path.join(models_dir, get_normalized_filename(product_name, 'params'))
-        with open(results_filename, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=4, ensure_ascii=False)
-        print(f"Resultados para {product_name} salvos em {results_filename}")
-
-if __name__ == '__main__':
-    data_file = 'processed_sales_data.csv'
-    models_directory = 'trained_models'
+import pandas as pd
+from seasonality_analysis import recommend_seasonalities, generate_holidays_for_df
+import os
+import json
+import time
+from dotenv import load_dotenv
+from hyperparameter_optimization import search_hyperparameters
+from model_evaluation import evaluate_model
+from product_name_utils import normalize_product_name, get_normalized_filename
+from sales_partition import ProductPartition
+from sales_resampling import resolve_resolution, resample_sales, is_intraday
+from baseline_engine import BaselineEngine, benchmark_against_models
+from intermittent_demand import INTERMITTENT_ENABLED, intermittent_products, summarize_intermittent
+from forecast_engines import (DEFAULT_ENGINE, candidate_engines, get_engine, preselect_engine, previous_prophet_profile,
+                              prophet_profile, select_engine, summarize_engines, train_engine_product)
+from cv_cache import cv_cache
+from model_export import export_model, summarize_exports
+from model_pack import MODEL_PACK_ENABLED, build_model_pack
+from product_clustering import resolve_transfer_mode, series_profile, cluster_products, neighbor_grid
+from training_telemetry import TrainingTelemetry, write_telemetry, summarize_telemetry
+from training_governor import apply_training_limits
+from warm_start import optimizer_iterations
+from model_manifest import update_manifest_entry, compute_data_fingerprint, atomic_write, load_manifest
+from training_pool import (
+    resolve_workers, resolve_parallel_mode, run_product_jobs, get_shared_pool,
+    shutdown_shared_pool, build_training_report, write_training_report, print_training_report
+)
+
+# Grade de hiperparmetros para otimizao
+PARAM_GRID = {
+    'changepoint_prior_scale': [0.001, 0.01, 0.1, 0.5],
+    'seasonality_prior_scale': [0.1, 1.0, 10.0],
+    'holidays_prior_scale': [0.1, 1.0, 10.0],
+    'changepoint_range': [0.8, 0.9, 0.95]
+}
+
+DEFAULT_PARAMS = {
+    'changepoint_prior_scale': 0.1,
+    'seasonality_prior_scale': 1.0,
+    'holidays_prior_scale': 1.0,
+    'changepoint_range': 0.9
+}
+
+
+def _serializable_metrics(metrics):
+    """Metricas escalares para o JSON (cv_metrics e um DataFrame)."""
+    if not metrics:
+        return {}
+    return {k: (None if v is None else float(v)) for k, v in metrics.items() if k != 'cv_metrics'}
+
+
+def train_product_model(product_name, job):
+    """
+    Otimiza, treina, avalia e salva o modelo de um produto.
+    Executado em um worker do pool; grava apenas os arquivos do proprio produto.
+    Engines mais baratos que atendem a meta de erro (forecast_engines)
+    dispensam o ajuste do Prophet.
+    """
+    product_df = job['data']
+    models_dir = job['models_dir']
+    candidates = job.get('candidates') or [DEFAULT_ENGINE]
+    decision, profiles = preselect_engine(product_df, candidates, job.get('prior'))
+    if decision and decision['engine'] != DEFAULT_ENGINE:
+        return train_engine_product(product_name, {**job, 'decision': decision})
+    seasonalities = job['seasonalities']
+    base_params = {
+        'yearly_seasonality': seasonalities.get('yearly', True),
+        'weekly_seasonality': seasonalities.get('weekly', True),
+        'daily_seasonality': seasonalities.get('daily', False),
+        'holidays': job['holidays']
+    }
+
+    print(f"Treinando modelo para: {product_name}...")
+    telemetry = TrainingTelemetry(product_name)
+
+    # Otimiza hiperparmetros
+    print("Otimizando hiperparmetros...")
+    cv_parallel = job['cv_parallel']
+    if cv_parallel == 'shared':
+        cv_parallel = get_shared_pool(job['workers'], job['max_memory_mb'])
+    transfer = job.get('transfer')
+    with telemetry.stage('search'):
+        if transfer and transfer['mode'] == 'reuse':
+            # Parametros vencedores do representante do grupo, sem busca
+            search = {'best_params': dict(transfer['parameters']), 'strategy': 'transfer', 'trials': 0,
+                      'fits': 0, 'best_rmse': None, 'elapsed_s': 0.0}
+        elif transfer:
+            # Refinamento: uma rodada curta com os vizinhos dos parametros vencedores
+            grid = neighbor_grid(transfer['parameters'], job['param_grid'])
+            search = search_hyperparameters(product_df, grid, parallel=cv_parallel, strategy='halving',
+                                            base_params=base_params, max_trials=len(grid), eta=len(grid))
+            search['strategy'] = 'transfer-refine'
+        else:
+            search = search_hyperparameters(product_df, job['param_grid'], parallel=cv_parallel,
+                                            base_params=base_params)
+    best_params = search['best_params']
+    
+    if not best_params:
+        print(f"Falha na otimizao para {product_name}. Usando parmetros padro.")
+        best_params = dict(DEFAULT_PARAMS)
+
+    # Inicializa e treina o modelo Prophet com parmetros otimizados
+    model = get_engine(DEFAULT_ENGINE).build(best_params, base_params)
+
+    with telemetry.stage('fit'):
+        model.fit(product_df)
+    telemetry.record(stan_iterations=optimizer_iterations(model), search_fits=search.get('fits'))
+    
+    # Avalia o modelo
+    print("Avaliando modelo...")
+    with telemetry.stage('evaluate'):
+        metrics = evaluate_model(model, product_df, parallel=cv_parallel)
+    
+    if metrics:
+        print(f"Mtricas de avaliao para {product_name}:")
+        print(f"MAE: {metrics['mae']:.2f}")
+        print(f"RMSE: {metrics['rmse']:.2f}")
+        print(f"MAPE: {metrics['mape']:.2f}%")
+        print(f"Coverage: {metrics['coverage']:.2f}%")
+
+    # Compara com os engines baratos ja avaliados, agora com as metricas do Prophet
+    profiles[DEFAULT_ENGINE] = prophet_profile(metrics, telemetry.stages, model, product_df['ds'].max())
+    decision = select_engine(profiles)
+    if decision['engine'] != DEFAULT_ENGINE:
+        return train_engine_product(product_name, {**job, 'decision': decision, 'prophet_trained': True})
+
+    # Salva o modelo treinado
+    normalized_name = normalize_product_name(product_name)
+    results = {
+        'product_name': product_name,
+        'normalized_name': normalized_name,
+        'engine': DEFAULT_ENGINE,
+        'parameters': best_params,
+        'metrics': _serializable_metrics(metrics),
+        'engine_decision': decision,
+        'search': {k: search[k] for k in ('strategy', 'trials', 'fits', 'best_rmse', 'elapsed_s')}
+    }
+    if transfer:
+        results['search'].update({'transfer_from': transfer['from'], 'cluster': transfer['cluster']})
+    results_filename = os.path.join(models_dir, get_normalized_filename(product_name, 'params'))
+    with telemetry.stage('save'):
+        export = export_model(model, product_name, models_dir)
+        print(f"Modelo para {product_name} salvo em {export['model_path']} "
+              f"({export['compact_bytes']} bytes, pickle enxuto {export['size_reduction_pct']}% menor que o completo)")
+
+        # Salva os parmetros e mtricas
+        atomic_write(results_filename, json.dumps(results, indent=4, ensure_ascii=False, default=str))
+        print(f"Resultados para {product_name} salvos em {results_filename}")
+
+    stats = telemetry.finish()
+    write_telemetry(models_dir, stats)
+
+    return {
+        'model_file': os.path.basename(export['model_path']),
+        'data_fingerprint': compute_data_fingerprint(product_df),
+        'engine': DEFAULT_ENGINE,
+        'engine_decision': decision,
+        'parameters': best_params,
+        'metrics': results['metrics'],
+        'search': results['search'],
+        'prophet_trained': True,
+        'export': {k: v for k, v in export.items() if k != 'model_path'},
+        'telemetry': stats
+    }
+
+
+def _train_with_transfer(jobs, partition, mode, workers, max_memory_mb):
+    """
+    Agrupa os produtos por perfil da serie, roda a busca completa nos
+    representantes e treina os demais membros com os parametros vencedores
+    do seu grupo. Membros de grupos cujo representante falhou fazem a busca
+    completa.
+    """
+    profiles = {name: series_profile(partition.get(name)) for name, _ in jobs}
+    clusters = cluster_products(profiles)
+    by_name = dict(jobs)
+    print(f"Transferencia de hiperparametros ({mode}): {len(clusters)} grupo(s) para {len(jobs)} produto(s)")
+
+    representatives = run_product_jobs(
+        train_product_model, [(c['representative'], by_name[c['representative']]) for c in clusters],
+        workers=workers, max_memory_mb=max_memory_mb, partition=partition
+    )
+    # Apenas parametros do Prophet sao transferidos; representantes servidos por outro engine nao valem
+    winners = {r['product_name']: r['parameters'] for r in representatives
+               if r['status'] == 'success' and r.get('engine', DEFAULT_ENGINE) == DEFAULT_ENGINE}
+
+    member_jobs = []
+    for cluster in clusters:
+        for member in cluster['members']:
+            job = by_name[member]
+            if cluster['representative'] in winners:
+                job['transfer'] = {'mode': mode, 'from': cluster['representative'], 'cluster': cluster['cluster'],
+                                   'parameters': winners[cluster['representative']]}
+            member_jobs.append((member, job))
+    members = run_product_jobs(train_product_model, member_jobs, workers=workers, max_memory_mb=max_memory_mb,
+                               partition=partition) if member_jobs else []
+
+    results = sorted(representatives + members, key=lambda r: normalize_product_name(r['product_name']))
+    return results, {'mode': mode, 'clusters': clusters, 'profiles': profiles}
+
+
+def train_prophet_models(data_path, models_dir, workers=None, max_memory_mb=None, parallel_mode=None,
+                         resolution=None, transfer=None):
+    """
+    Treina um modelo Prophet para cada produto com otimizao de hiperparmetros.
+
+    Os produtos sao distribuidos em um pool de `workers` processos
+    (AI_TRAINING_WORKERS, padrao = numero de CPUs), cada job limitado a
+    `max_memory_mb` (AI_TRAINING_MAX_MEMORY_MB). Com poucos produtos para os
+    workers disponiveis (`parallel_mode`/AI_TRAINING_PARALLEL_MODE = 'auto'),
+    os produtos rodam em sequencia e as dobras de validacao cruzada usam o
+    pool compartilhado. As vendas sao agregadas para `resolution`
+    (AI_TRAINING_RESOLUTION, padrao diario) antes do ajuste. Com `transfer`
+    (AI_HPO_TRANSFER = 'reuse' ou 'refine') a busca completa roda uma vez
+    por grupo de produtos parecidos (ver product_clustering). Cada produto
+    e servido pelo engine mais barato dentro da meta de erro
+    (forecast_engines), registrado no manifesto. Retorna o relatorio por
+    produto.
+    """
+    # Carrega variveis de ambiente
+    load_dotenv()
+    
+    df = pd.read_csv(data_path)
+
+    if df.empty:
+        print("DataFrame vazio. No  possvel treinar modelos.")
+        return
+
+    df["ds"] = pd.to_datetime(df["ds"])
+
+    # Agrega para a resolucao servida antes de detectar sazonalidades e ajustar
+    resolution = resolve_resolution(resolution)
+    raw_rows = len(df)
+    df = resample_sales(df, resolution)
+    print(f"Resolucao de treino: {resolution or 'registros originais'} ({raw_rows} -> {len(df)} linhas)")
+
+    if not os.path.exists(models_dir):
+        os.makedirs(models_dir)
+
+    # Detectar sazonalidades recomendadas e gerar feriados
+    seasonalities = recommend_seasonalities(df, date_col='ds')
+    brazil_holidays = generate_holidays_for_df(df, country='BR', date_col='ds')
+
+    jobs = []
+    # Particiona o frame uma unica vez; os jobs recebem apenas os offsets de cada produto
+    partition = ProductPartition(df, columns=["ds", "y"])
+    for product_name in partition.products:
+        product_df = partition.get(product_name)
+
+        if product_df.empty:
+            print(f"Nenhum dado para o produto {product_name}. Pulando.")
+            continue
+        jobs.append((product_name, {'data': partition.slice_for(product_name), 'models_dir': models_dir}))
+
+    # Engines candidatos por produto; produtos de baixo giro nao passam pelo Prophet
+    # (sem busca em grade nem pool). As metricas do Prophet da ultima decisao vem do manifesto.
+    intermittent = intermittent_products(df) if INTERMITTENT_ENABLED else {}
+    previous = load_manifest(models_dir).get('products', {})
+    for name, job in jobs:
+        job['candidates'] = candidate_engines(name in intermittent)
+        job['prior'] = previous_prophet_profile(previous.get(normalize_product_name(name)))
+    engine_jobs = [(name, job) for name, job in jobs if DEFAULT_ENGINE not in job['candidates']]
+    jobs = [(name, job) for name, job in jobs if DEFAULT_ENGINE in job['candidates']]
+    if engine_jobs:
+        print(f"Sem Prophet para {len(engine_jobs)} produto(s) de baixo giro: "
+              f"{', '.join(name for name, _ in engine_jobs)}")
+
+    workers = resolve_workers(workers)
+    parallel_mode = resolve_parallel_mode(parallel_mode, len(jobs), workers)
+    if parallel_mode == 'folds':
+        # Produtos em sequencia; as dobras de CV de todas as configuracoes e
+        # produtos vao para um unico pool compartilhado
+        product_workers, cv_parallel = 1, 'shared'
+    else:
+        # Produtos em paralelo; a validacao cruzada de cada job roda sem pool proprio
+        product_workers, cv_parallel = min(workers, max(1, len(jobs))), None
+    print(f"Modo de paralelismo: {parallel_mode} ({workers} worker(s))")
+
+    for _, job in jobs:
+        job.update({
+            'param_grid': PARAM_GRID,
+            'seasonalities': seasonalities,
+            'holidays': brazil_holidays,
+            'cv_parallel': cv_parallel,
+            'workers': workers,
+            'max_memory_mb': max_memory_mb
+        })
+
+    transfer = resolve_transfer_mode(transfer)
+    transfer_report = None
+    start = time.perf_counter()
+    try:
+        if not jobs:
+            results = []
+        elif transfer == 'off':
+            results = run_product_jobs(train_product_model, jobs, workers=product_workers,
+                                       max_memory_mb=max_memory_mb, partition=partition)
+        else:
+            results, transfer_report = _train_with_transfer(jobs, partition, transfer, product_workers,
+                                                            max_memory_mb)
+    finally:
+        shutdown_shared_pool()
+        cv_cache.prune()
+    if engine_jobs:
+        results = sorted(results + run_product_jobs(train_engine_product, engine_jobs, workers=1,
+                                                    partition=partition),
+                         key=lambda r: normalize_product_name(r['product_name']))
+
+    # O manifesto e atualizado apenas pelo processo principal, em ordem fixa
+    for result in results:
+        if result['status'] == 'success':
+            update_manifest_entry(models_dir, result['product_name'], source='trainer',
+                                  data_fingerprint=result['data_fingerprint'],
+                                  engine=result.get('engine', DEFAULT_ENGINE),
+                                  engine_decision=result.get('engine_decision'))
+
+    report = build_training_report(results, 'trainer', workers, time.perf_counter() - start)
+    report['parallel_mode'] = parallel_mode
+    report['resolution'] = resolution or 'raw'
+    report['telemetry'] = summarize_telemetry(results)
+    report['export'] = summarize_exports(results)
+    report['search_fits'] = sum((r.get('search') or {}).get('fits') or 0 for r in results)
+    if transfer_report:
+        report['transfer'] = transfer_report
+    report['engines'] = summarize_engines(results)
+    if any(r.get('engine') == 'intermittent' for r in results):
+        report['intermittent'] = summarize_intermittent(results)
+    if resolution == 'D' or is_intraday(resolution):
+        # Referencia: melhor baseline por produto no mesmo horizonte da validacao cruzada
+        model_mae = {r['product_name']: (r.get('metrics') or {}).get('mae') for r in results}
+        report['baselines'] = benchmark_against_models(BaselineEngine().fit(df), model_mae)
+    if MODEL_PACK_ENABLED:
+        report['model_pack'] = build_model_pack(models_dir)
+    write_training_report(models_dir, report)
+    print_training_report(report)
+    return report
+
+if __name__ == '__main__':
+    data_file = 'processed_sales_data.csv'
+    models_directory = 'trained_models'
+    apply_training_limits()
     train_prophet_models(data_file, models_directory)
\ No newline at end of file
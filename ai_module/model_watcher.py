@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Observador de modelos publicados, executado no processo de servico.
+Modelos novos chegam por publicacao atomica (rename) e pelo incremento da
+versao do manifesto, feitos pelo trainer, pelo retrainer ou por outro host
+que sincroniza trained_models/. Uma thread em background compara
+periodicamente a versao (checksum) do arquivo servido de cada produto com a
+ultima vista e, para os produtos alterados, invalida o cache e recarrega o
+modelo e as predicoes (refresh_product_caches), sem reiniciar o servico
+nem esfriar o cache dos demais produtos.
+
+A verificacao e barata: enquanto o mtime do manifesto e do diretorio de
+modelos nao mudam, nenhum arquivo de modelo e consultado. As versoes vistas
+so sao registradas depois que a atualizacao termina sem erro; se ela falhar,
+os mesmos produtos sao tentados de novo na proxima verificacao.
+
+O servico inicia a thread na inicializacao do servidor
+(ai_service.start_background_services), nao na importacao do modulo.
+"""
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from model_manifest import MODELS_DIR, file_checksum, get_manifest_path, list_manifest_products
+
+logger = logging.getLogger(__name__)
+
+MODEL_WATCH_ENABLED = os.getenv('AI_MODEL_WATCH', 'true').lower() == 'true'
+WATCH_INTERVAL_S = float(os.getenv('AI_MODEL_WATCH_INTERVAL', 5.0))
+
+
+def _mtime_ns(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _default_refresh(products: List[str], models_dir: str) -> Dict[str, Any]:
+    from training_jobs import refresh_product_caches
+    return refresh_product_caches(products, models_dir)
+
+
+class ModelWatcher:
+    """Detecta modelos republicados e atualiza apenas os produtos alterados."""
+
+    def __init__(self, models_dir: str = MODELS_DIR, interval: float = WATCH_INTERVAL_S,
+                 on_change: Callable[[List[str], str], Dict[str, Any]] = _default_refresh):
+        self.models_dir = models_dir
+        self.interval = interval
+        self.on_change = on_change
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._markers = self._read_markers()
+        self._versions = self._read_versions()
+        self.status: Dict[str, Any] = {
+            'checks': 0, 'refreshes': 0, 'last_check': None, 'last_change': None, 'last_error': None
+        }
+
+    def _read_markers(self):
+        return (_mtime_ns(get_manifest_path(self.models_dir)), _mtime_ns(self.models_dir))
+
+    def _read_versions(self) -> Dict[str, Optional[str]]:
+        return {
+            product['normalized_name']: file_checksum(os.path.join(self.models_dir, product['model_file']))
+            for product in list_manifest_products(self.models_dir)
+        }
+
+    def _scan(self) -> Tuple[List[str], tuple, Dict[str, Optional[str]]]:
+        """(produtos alterados, marcadores, versoes) atuais, sem registra-los."""
+        markers = self._read_markers()
+        if markers == self._markers:
+            return [], markers, self._versions
+        versions = self._read_versions()
+        changed = sorted(name for name, version in versions.items() if self._versions.get(name) != version)
+        return changed, markers, versions
+
+    def changed_products(self) -> List[str]:
+        """Produtos cujo arquivo servido mudou (ou surgiu) desde a ultima atualizacao concluida."""
+        return self._scan()[0]
+
+    def poll(self) -> Dict[str, Any]:
+        """Uma verificacao: atualiza os produtos alterados e retorna o que foi feito."""
+        with self._lock:
+            self.status['checks'] += 1
+            self.status['last_check'] = datetime.now().isoformat()
+            changed, markers, versions = self._scan()
+            if not changed:
+                self._markers, self._versions = markers, versions
+                return {'products': []}
+            logger.info(f"Modelos republicados detectados: {', '.join(changed)}")
+            start = time.perf_counter()
+            try:
+                result = self.on_change(changed, self.models_dir) or {}
+            except Exception as e:
+                # Versoes nao registradas: a proxima verificacao tenta de novo
+                logger.warning(f"Erro ao recarregar modelos alterados: {e}")
+                self.status['last_error'] = str(e)
+                return {'products': changed, 'error': str(e)}
+            self._markers, self._versions = markers, versions
+            change = {
+                'products': changed,
+                'detected_at': self.status['last_check'],
+                'duration_s': round(time.perf_counter() - start, 3),
+                **result
+            }
+            self.status['refreshes'] += 1
+            self.status['last_change'] = change
+            return change
+
+    def refresh_changed(self, products: List[str], models_dir: str) -> Dict[str, Any]:
+        """
+        Callback para a fila de retreino do proprio processo: passa pelo mesmo
+        caminho da thread, de modo que os produtos nao sao aquecidos duas vezes.
+        """
+        return self.poll()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                logger.warning(f"Erro no observador de modelos: {e}")
+
+    def start(self) -> bool:
+        if self._thread is not None and self._thread.is_alive():
+            return False
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='model-watcher', daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self, timeout: Optional[float] = None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def get_status(self) -> Dict[str, Any]:
+        # Sem o lock: um poll pode estar aquecendo produtos por varios segundos
+        return {
+            'running': self._thread is not None and self._thread.is_alive(),
+            'interval_s': self.interval,
+            'products': len(self._versions),
+            **self.status
+        }
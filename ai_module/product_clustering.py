@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Transferencia de hiperparametros entre produtos com demanda parecida.
+Cada serie recebe um perfil (escala, forca das sazonalidades semanal e
+mensal via detect_seasonality_patterns e intermitencia) e os produtos sao
+agrupados por distancia entre perfis. A busca completa roda apenas no
+representante de cada grupo; os demais membros reaproveitam os parametros
+vencedores ('reuse') ou os refinam com uma busca curta na vizinhanca da
+grade ('refine').
+"""
+
+import math
+import os
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from seasonality_analysis import detect_seasonality_patterns
+
+# Modo de transferencia: 'off' (busca completa por produto), 'reuse' ou 'refine'
+DEFAULT_TRANSFER_MODE = os.getenv('AI_HPO_TRANSFER', 'off')
+# Distancia maxima entre perfis de um mesmo grupo (ligacao completa)
+DEFAULT_CLUSTER_THRESHOLD = float(os.getenv('AI_HPO_CLUSTER_THRESHOLD', 0.35))
+
+TRANSFER_MODES = ('off', 'reuse', 'refine')
+PROFILE_FEATURES = ('scale', 'weekly_strength', 'monthly_strength', 'zero_share')
+
+
+def resolve_transfer_mode(mode: Optional[str] = None) -> str:
+    mode = (mode or DEFAULT_TRANSFER_MODE).lower()
+    if mode not in TRANSFER_MODES:
+        raise ValueError(f"Modo de transferencia desconhecido: {mode}")
+    return mode
+
+
+def _strength(value) -> float:
+    value = float(value)
+    return value if math.isfinite(value) else 0.0
+
+
+def series_profile(product_df: pd.DataFrame) -> Dict[str, float]:
+    """
+    Perfil da serie: escala (log10 da media), forca das sazonalidades semanal
+    e mensal (desvio/media dos perfis medios) e fracao de dias sem venda.
+    """
+    y = product_df['y'].astype(float)
+    patterns = detect_seasonality_patterns(product_df[['ds', 'y']])
+    return {
+        'scale': round(math.log10(max(y.mean(), 0.0) + 1.0), 4),
+        'weekly_strength': round(_strength(patterns['weekly']['strength']), 4),
+        'monthly_strength': round(_strength(patterns['monthly']['strength']), 4),
+        'zero_share': round(float((y <= 0).mean()), 4) if len(y) else 0.0
+    }
+
+
+def cluster_products(profiles: Dict[str, Dict[str, float]],
+                     threshold: Optional[float] = None) -> List[Dict[str, Any]]:
+    """
+    Agrupa produtos cujos perfis ficam a no maximo `threshold` de distancia
+    euclidiana entre si (ligacao completa). O representante de cada grupo e
+    o medoide. Grupos e membros saem em ordem deterministica.
+    """
+    threshold = DEFAULT_CLUSTER_THRESHOLD if threshold is None else threshold
+    names = sorted(profiles)
+    if not names:
+        return []
+
+    features = np.array([[profiles[name][f] for f in PROFILE_FEATURES] for name in names])
+    if len(names) == 1:
+        labels = np.zeros(1, dtype=int)
+    else:
+        from sklearn.cluster import AgglomerativeClustering
+        labels = AgglomerativeClustering(
+            n_clusters=None, distance_threshold=threshold, linkage='complete'
+        ).fit_predict(features)
+
+    distances = np.linalg.norm(features[:, None, :] - features[None, :, :], axis=-1)
+    clusters = []
+    for label in sorted(set(labels), key=lambda l: names[int(np.argmax(labels == l))]):
+        members = [i for i in range(len(names)) if labels[i] == label]
+        medoid = min(members, key=lambda i: (distances[i, members].sum(), names[i]))
+        clusters.append({
+            'representative': names[medoid],
+            'members': [names[i] for i in members if i != medoid],
+            'max_distance': round(float(distances[np.ix_(members, members)].max()), 4)
+        })
+    for cluster_id, cluster in enumerate(clusters):
+        cluster['cluster'] = cluster_id
+    return clusters
+
+
+def neighbor_grid(best_params: Dict[str, Any], param_grid: Dict[str, List[Any]]) -> List[Dict[str, List[Any]]]:
+    """
+    Configuracoes para o refinamento: os parametros vencedores e cada vizinho
+    a um passo na grade, variando um parametro por vez (formato aceito por
+    ParameterGrid).
+    """
+    grid = [{k: [v] for k, v in best_params.items()}]
+    for name, values in param_grid.items():
+        if name not in best_params or best_params[name] not in values:
+            continue
+        index = values.index(best_params[name])
+        for neighbor in (index - 1, index + 1):
+            if 0 <= neighbor < len(values):
+                grid.append({k: [values[neighbor] if k == name else v] for k, v in best_params.items()})
+    return grid
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Particionamento do dataset de vendas por produto em uma unica passada.
+O frame e reordenado uma vez por produto (ordenacao estavel, preservando a
+ordem original das linhas de cada produto) e um indice de offsets permite
+obter o historico de qualquer produto como uma fatia, sem varrer o frame
+inteiro a cada produto como em df[df["item_name"] == produto].
+"""
+
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class PartitionSlice:
+    """Referencia leve (inicio, fim) a um produto dentro do frame particionado."""
+
+    __slots__ = ('product_name', 'start', 'stop')
+
+    def __init__(self, product_name: str, start: int, stop: int):
+        self.product_name = product_name
+        self.start = start
+        self.stop = stop
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __repr__(self):
+        return f"PartitionSlice({self.product_name!r}, {self.start}, {self.stop})"
+
+
+class ProductPartition:
+    """Frame ordenado por produto com indice de offsets."""
+
+    def __init__(self, df: pd.DataFrame, key: str = 'item_name', columns: Optional[List[str]] = None):
+        codes, uniques = pd.factorize(df[key], sort=True)
+        valid = codes >= 0
+        order = np.argsort(codes, kind='stable')[np.count_nonzero(~valid):]
+        counts = np.bincount(codes[valid], minlength=len(uniques))
+        offsets = np.concatenate(([0], np.cumsum(counts)))
+
+        frame = df.iloc[order]
+        # Unica copia: a selecao de colunas e a reordenacao acontecem uma vez
+        self.frame = frame[columns] if columns is not None else frame
+        self.key = key
+        self._offsets: Dict[str, Tuple[int, int]] = {
+            name: (int(offsets[i]), int(offsets[i + 1])) for i, name in enumerate(uniques)
+        }
+
+    @property
+    def products(self) -> List[str]:
+        return list(self._offsets)
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __contains__(self, product_name: str) -> bool:
+        return product_name in self._offsets
+
+    def slice_for(self, product_name: str) -> PartitionSlice:
+        start, stop = self._offsets[product_name]
+        return PartitionSlice(product_name, start, stop)
+
+    def get(self, product_name: str) -> pd.DataFrame:
+        """Historico do produto (fatia do frame particionado; vazio se desconhecido)."""
+        if product_name not in self._offsets:
+            return self.frame.iloc[0:0]
+        start, stop = self._offsets[product_name]
+        return self.frame.iloc[start:stop]
+
+    def resolve(self, part: PartitionSlice) -> pd.DataFrame:
+        return self.frame.iloc[part.start:part.stop]
+
+    def items(self) -> Iterator[Tuple[str, pd.DataFrame]]:
+        for product_name in self._offsets:
+            yield product_name, self.get(product_name)
+
+
+def benchmark_partitioning(product_counts=(10, 100, 1000), rows_per_product: int = 365, repeat: int = 3):
+    """
+    Compara a selecao por mascara (uma varredura por produto) com o
+    particionamento em passada unica, para catalogos de tamanhos crescentes.
+    """
+    results = []
+    rng = np.random.default_rng(0)
+    for n_products in product_counts:
+        names = np.array([f"Produto_{i:05d}" for i in range(n_products)])
+        df = pd.DataFrame({
+            'ds': np.tile(pd.date_range('2024-01-01', periods=rows_per_product).values, n_products),
+            'item_name': np.repeat(names, rows_per_product),
+            'y': rng.poisson(10, n_products * rows_per_product)
+        }).sample(frac=1, random_state=0)
+
+        def mask_select():
+            for product_name in sorted(df['item_name'].unique()):
+                df[df['item_name'] == product_name][['ds', 'y']]
+
+        def partition_select():
+            partition = ProductPartition(df, columns=['ds', 'y'])
+            for product_name in partition.products:
+                partition.get(product_name)
+
+        timings = {}
+        for label, fn in (('mask_s', mask_select), ('partition_s', partition_select)):
+            best = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                fn()
+                best = min(best, time.perf_counter() - start)
+            timings[label] = round(best, 4)
+
+        results.append({
+            'products': n_products,
+            'rows': len(df),
+            **timings,
+            'speedup': round(timings['mask_s'] / timings['partition_s'], 1) if timings['partition_s'] else None
+        })
+    return results
+
+
+if __name__ == '__main__':
+    print(f"{'produtos':>9} {'linhas':>9} {'mascara (s)':>12} {'particao (s)':>13} {'ganho':>7}")
+    for row in benchmark_partitioning():
+        print(f"{row['products']:>9} {row['rows']:>9} {row['mask_s']:>12.4f} {row['partition_s']:>13.4f} "
+              f"{row['speedup']:>6.1f}x")
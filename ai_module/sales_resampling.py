@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pre-agregacao do dataset de vendas antes do ajuste dos modelos.
+As vendas chegam no nivel do registro (08:00, 12:00, ...), mas a API serve
+previsoes diarias; agregando para a resolucao servida o Prophet ajusta menos
+pontos sem perder informacao para o horizonte diario. AI_TRAINING_RESOLUTION
+define a resolucao ('D' por padrao, ex.: 'h' para modelos intradiarios ou
+'raw' para ajustar os registros originais).
+"""
+
+import os
+from typing import Optional
+
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+
+DEFAULT_RESOLUTION = 'D'
+RAW_RESOLUTIONS = ('raw', 'none', 'intraday', '')
+
+
+def resolve_resolution(resolution: Optional[str] = None) -> Optional[str]:
+    """Resolucao efetiva; None significa ajustar os registros sem agregacao."""
+    if resolution is None:
+        resolution = os.getenv('AI_TRAINING_RESOLUTION', DEFAULT_RESOLUTION)
+    if resolution.strip().lower() in RAW_RESOLUTIONS:
+        return None
+    to_offset(resolution)  # valida a frequencia (ValueError se invalida)
+    return resolution
+
+
+def is_intraday(resolution: Optional[str]) -> bool:
+    """True quando o modelo e ajustado em granularidade menor que um dia."""
+    if resolution is None:
+        return True
+    try:
+        return pd.Timedelta(to_offset(resolution)) < pd.Timedelta(days=1)
+    except ValueError:
+        # Frequencias de calendario (W, MS, ...) nao tem duracao fixa e sao >= 1 dia
+        return False
+
+
+def resample_sales(df: pd.DataFrame, resolution: Optional[str], fill_gaps: Optional[bool] = None,
+                   key: str = 'item_name') -> pd.DataFrame:
+    """
+    Soma `y` por produto em buckets de `resolution`.
+
+    Com `fill_gaps` (AI_TRAINING_FILL_GAPS, padrao true) os buckets sem venda
+    entre a primeira e a ultima venda de cada produto entram com y = 0.
+    """
+    if resolution is None or df.empty:
+        return df
+    if fill_gaps is None:
+        fill_gaps = os.getenv('AI_TRAINING_FILL_GAPS', 'true').lower() == 'true'
+
+    data = df[['ds', key, 'y']].copy()
+    data['ds'] = pd.to_datetime(data['ds'])
+    aggregated = (
+        data.groupby([key, pd.Grouper(key='ds', freq=resolution)], sort=True)['y']
+        .sum()
+        .reset_index()
+    )
+
+    if fill_gaps:
+        frames = []
+        for product_name, product_df in aggregated.groupby(key, sort=True):
+            series = product_df.set_index('ds')['y'].asfreq(resolution, fill_value=0)
+            frames.append(pd.DataFrame({'ds': series.index, key: product_name, 'y': series.values}))
+        aggregated = pd.concat(frames, ignore_index=True) if frames else aggregated
+
+    return aggregated[['ds', key, 'y']]
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Testes dos baselines vetorizados (todos os produtos de uma vez).
+"""
+
+import numpy as np
+import pandas as pd
+
+import baseline_engine
+from baseline_engine import BaselineEngine, benchmark_against_models, demand_matrix
+from fallback_service import ModelFallback
+
+
+def _sales(days=120):
+    rng = np.random.default_rng(3)
+    ds = pd.date_range('2025-01-01', periods=days, freq='D')
+    frames = [
+        pd.DataFrame({'ds': ds, 'item_name': 'Croissant',
+                      'y': 40 + 25 * (ds.dayofweek >= 5) + rng.normal(0, 2, days)}),
+        pd.DataFrame({'ds': ds, 'item_name': 'Cappuccino', 'y': 60 + rng.normal(0, 8, days)}),
+    ]
+    # Produto com dias faltando: completados com zero na matriz
+    sparse = pd.DataFrame({'ds': ds[::3], 'item_name': 'Torta de Morango', 'y': 3.0})
+    return pd.concat(frames + [sparse], ignore_index=True)
+
+
+def test_methods_match_per_product_loops():
+    """Cada metodo vetorizado reproduz o calculo ingenuo produto a produto."""
+    products, dates, values = demand_matrix(_sales())
+    assert products == ['Cappuccino', 'Croissant', 'Torta de Morango']
+    assert values.shape == (3, len(dates)) and values[2, 1] == 0
+
+    for i, row in enumerate(values):
+        np.testing.assert_allclose(baseline_engine.forecast(values, 10, 'seasonal_naive')[i],
+                                   [row[len(row) - 7 + d % 7] for d in range(10)])
+        np.testing.assert_allclose(baseline_engine.forecast(values, 3, 'moving_average')[i], [row[-7:].mean()] * 3)
+        level = row[0]
+        for y in row[1:]:
+            level = 0.3 * y + 0.7 * level
+        np.testing.assert_allclose(baseline_engine.forecast(values, 3, 'exponential_smoothing')[i], [level] * 3)
+
+
+def test_auto_picks_best_method_per_product():
+    engine = BaselineEngine().fit(_sales())
+    methods = dict(zip(engine.products, engine.best_methods(14)))
+    # Demanda com padrao semanal forte: repetir a ultima semana e o melhor baseline
+    assert methods['Croissant'] == 'seasonal_naive'
+    assert methods['Cappuccino'] != 'seasonal_naive'
+
+    forecast = engine.forecast(14)
+    assert forecast.shape == (3, 14) and forecast.columns[0] == engine.dates[-1] + pd.Timedelta(days=1)
+    assert (forecast.to_numpy() >= 0).all()
+    np.testing.assert_allclose(engine.predict('Croissant', 14), forecast.loc['Croissant'])
+    assert engine.predict('Pao Frances', 14) is None
+
+
+def test_benchmark_against_models_and_short_history():
+    engine = BaselineEngine().fit(_sales())
+    bench = benchmark_against_models(engine, {'Croissant': 1.0, 'Cappuccino': 1000.0}, horizon=14)
+    assert bench['compared'] == 2 and bench['models_beating_baseline'] == 1
+    assert bench['products']['Torta de Morango']['model_mae'] is None
+
+    # Sem historico para o backtest: metodo padrao e MAE ausente
+    short = BaselineEngine().fit(_sales(days=10))
+    assert short.best_methods(14) == ['seasonal_naive'] * 3
+    assert benchmark_against_models(short, {}, horizon=14)['products']['Croissant']['baseline_mae'] is None
+
+
+def test_fallback_rolls_stale_snapshot_forward_to_today():
+    """Snapshot com 5 dias de atraso: a previsao comeca amanha, nao no dia seguinte ao snapshot."""
+    sales = _sales()
+    last = sales['ds'].max()
+    sales['ds'] += pd.Timestamp.now().normalize() - pd.Timedelta(days=5) - last
+    historical = sales.rename(columns={'ds': 'data', 'item_name': 'produto', 'y': 'quantidade'})
+
+    fallback = ModelFallback()
+    saved = []
+    fallback.save_predictions_cache = saved.append
+    forecasts = fallback._baseline_forecasts(7, historical)
+    assert len(saved) == 1 and sorted(saved[0]) == sorted(forecasts.index)
+    assert forecasts.columns[0] == pd.Timestamp.now().normalize() + pd.Timedelta(days=1)
+
+    expected = BaselineEngine().fit(sales).forecast(12).loc['Croissant'].to_numpy()[5:]
+    np.testing.assert_allclose(fallback._predict_from_historical('Croissant', 7, historical),
+                               np.maximum(np.round(expected, 1), 1.0))
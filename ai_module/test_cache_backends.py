@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Testes dos backends de cache plugaveis (SQLite local).
+"""
+
+import os
+import sqlite3
+import tempfile
+import time
+from multiprocessing import Process
+
+from cache_backends import SQLiteCache
+
+
+def _write_from_other_process(path):
+    SQLiteCache(path).set("ai_module:prediction:Croissant:abc", [1, 2, 3], 60)
+
+
+def test_sqlite_roundtrip_and_ttl():
+    """Operacoes basicas e expiracao por TTL."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SQLiteCache(os.path.join(tmp, 'cache.sqlite3'))
+        assert cache.enabled
+
+        assert cache.set("ai_module:model:Croissant:1", {"modelo": True}, 60)
+        assert cache.get("ai_module:model:Croissant:1") == {"modelo": True}
+
+        cache.set("ai_module:model:Croissant:expira", "x", 1)
+        time.sleep(1.1)
+        assert cache.get("ai_module:model:Croissant:expira") is None
+
+        assert cache.delete("ai_module:model:Croissant:1")
+        assert cache.get("ai_module:model:Croissant:1") is None
+
+
+def test_sqlite_patterns_and_persistence():
+    """Padroes glob estilo Redis e compartilhamento entre processos."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cache.sqlite3')
+        cache = SQLiteCache(path)
+        cache.set("ai_module:model:Croissant:1", 1, 60)
+        cache.set("ai_module:model:Cappuccino:1", 2, 60)
+        cache.set("ai_module:prediction:Croissant:1", 3, 60)
+
+        assert cache.count_keys("ai_module:model:*") == 2
+        assert cache.clear_pattern("ai_module:*:Croissant:*") == 2
+        assert cache.count_keys("ai_module:*") == 1
+
+        worker = Process(target=_write_from_other_process, args=(path,))
+        worker.start()
+        worker.join(30)
+        assert cache.get("ai_module:prediction:Croissant:abc") == [1, 2, 3]
+
+        # Nova instancia (reinicio do servico) enxerga os mesmos dados
+        assert SQLiteCache(path).get("ai_module:model:Cappuccino:1") == 2
+
+
+def test_sqlite_size_limit():
+    """Entradas menos acessadas sao removidas acima do limite de tamanho."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SQLiteCache(os.path.join(tmp, 'cache.sqlite3'), max_size_mb=0.01)
+        for i in range(5):
+            cache.set(f"ai_module:prediction:P{i}:x", b"0" * 4096, 60)
+        cache.purge()
+        stats = cache.get_stats()
+        assert stats["used_memory_bytes"] <= cache.max_size_bytes
+        assert cache.get("ai_module:prediction:P4:x") is not None
+
+
+def test_sqlite_reads_batch_access_times():
+    """Leituras nao escrevem no arquivo; o LRU usa os acessos gravados em lote."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cache.sqlite3')
+        cache = SQLiteCache(path, max_size_mb=0.01)
+        for i in range(2):
+            cache.set(f"ai_module:prediction:P{i}:x", b"0" * 4096, 60)
+
+        def accessed_at(key):
+            with sqlite3.connect(path) as conn:
+                return conn.execute("SELECT accessed_at FROM cache WHERE key = ?", (key,)).fetchone()[0]
+
+        before = accessed_at("ai_module:prediction:P0:x")
+        assert cache.get("ai_module:prediction:P0:x") is not None
+        assert accessed_at("ai_module:prediction:P0:x") == before, "get nao deve escrever no arquivo"
+
+        # A manutencao grava os acessos pendentes antes de escolher as vitimas
+        cache.set("ai_module:prediction:P2:x", b"0" * 4096, 60)
+        cache.purge()
+        assert accessed_at("ai_module:prediction:P0:x") > before
+        assert cache.get("ai_module:prediction:P0:x") is not None
+        assert cache.get("ai_module:prediction:P1:x") is None
+
+
+def test_namespace_metrics():
+    """Metricas client-side separadas por namespace."""
+    import redis_cache
+    from redis_cache import ModelCache
+    from cache_metrics import cache_metrics
+
+    with tempfile.TemporaryDirectory() as tmp:
+        previous = redis_cache.cache
+        redis_cache.cache = SQLiteCache(os.path.join(tmp, 'cache.sqlite3'))
+        cache_metrics.reset()
+        try:
+            ModelCache.set_prediction('Croissant', 7, [1] * 7)
+            ModelCache.get_prediction('Croissant', 7)
+            ModelCache.get_prediction('Croissant', 30)
+            ModelCache.get_products_list()
+            ModelCache.invalidate_model('Croissant')
+
+            snapshot = cache_metrics.snapshot()
+            prediction = snapshot['prediction']
+            assert prediction['hits'] == 1 and prediction['misses'] == 1
+            assert prediction['hit_ratio'] == 0.5
+            assert prediction['sets'] == 1 and prediction['invalidations'] == 1
+            assert prediction['size_bytes']['count'] == 1
+            assert snapshot['products_list']['misses'] == 1
+            assert 'model' not in snapshot
+            assert 'metrics' in redis_cache.get_cache_info()
+        finally:
+            redis_cache.cache = previous
+
+
+def test_tinylfu_admission():
+    """Modelos grandes so entram no cache depois de acessos repetidos."""
+    from cache_admission import TinyLFUAdmission
+
+    admission = TinyLFUAdmission(small_object_bytes=1024, min_frequency=1)
+    assert admission.should_admit('Croissant', 512)
+
+    # 4x o limite exige 3 acessos recentes
+    assert admission.required_frequency(4096) == 3
+    # min_frequency=0 explicito nao cai no padrao
+    assert TinyLFUAdmission(small_object_bytes=1024, min_frequency=0).required_frequency(4096) == 2
+    admission.record_access('Croissant')
+    assert not admission.should_admit('Croissant', 4096)
+    admission.record_access('Croissant')
+    admission.record_access('Croissant')
+    assert admission.should_admit('Croissant', 4096)
+    assert not admission.should_admit('Cappuccino', 4096)
+
+    stats = admission.get_stats()
+    assert stats['rejected'] == 2 and stats['admitted'] == 2
+
+
+def test_sketch_aging():
+    """O envelhecimento divide as frequencias, esquecendo acessos antigos."""
+    from cache_admission import CountMinSketch
+
+    sketch = CountMinSketch(width=64, depth=4, sample_size=8)
+    for _ in range(7):
+        sketch.increment('Croissant')
+    assert sketch.estimate('Croissant') == 7
+    sketch.increment('Cappuccino')
+    assert sketch.estimate('Croissant') == 3
@@ -1,176 +1,176 @@
-﻿#!/usr/bin/env python3
-"""
-Teste simplificado do sistema de cache Redis - foco no fallback
-Executa testes que funcionam mesmo sem Redis servidor ativo
-"""
-
-import sys
-import os
-import time
-import logging
-
-# Configurar logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
-
-def test_redis_imports():
-    """Testa se as dependncias Redis esto instaladas."""
-    print(" Testando importaes do Redis...")
-    
-    try:
-        import redis
-        print(f"   Redis {redis.__version__} importado com sucesso")
-        
-        import hiredis
-        print("   Hiredis importado com sucesso")
-        
-        return True
-    except ImportError as e:
-        print(f"   Erro de importao: {e}")
-        return False
-
-def test_cache_module():
-    """Testa se o mdulo de cache pode ser importado."""
-    print("\n Testando mdulo de cache...")
-    
-    try:
-        from redis_cache import RedisCache, ModelCache, get_cache_info
-        print("   Mdulo redis_cache importado com sucesso")
-        
-        # Testa inicializao sem Redis server
-        print("   RedisCache inicializado (modo fallback)")
-        
-        return True
-    except Exception as e:
-        print(f"   Erro no mdulo de cache: {e}")
-        return False
-
-def test_fallback_operations():
-    """Testa operaes de fallback sem Redis."""
-    print("\n Testando operaes de fallback...")
-    
-    try:
-        from redis_cache import ModelCache
-        
-        # Teste de predio cache (deve funcionar em fallback)
-        test_product = "Bolo_de_Chocolate"
-        test_days = 7
-        test_prediction = [100, 110, 105, 95, 120, 115, 108]
-        
-        # Set (deve retornar False em fallback)
-        set_result = ModelCache.set_prediction(test_product, test_days, test_prediction)
-        print(f"   Set fallback: {'' if not set_result else ''}")
-        
-        # Get (deve retornar None em fallback)
-        get_result = ModelCache.get_prediction(test_product, test_days)
-        print(f"   Get fallback: {'' if get_result is None else ''}")
-        
-        # Invalidate (deve retornar False em fallback)
-        invalidate_result = ModelCache.invalidate_model(test_product)
-        print(f"   Invalidate fallback: {'' if not invalidate_result else ''}")
-        
-        return not set_result and get_result is None and not invalidate_result
-        
-    except Exception as e:
-        print(f"   Erro no teste de fallback: {e}")
-        return False
-
-def test_statistics():
-    """Testa estatsticas do cache."""
-    print("\n Testando estatsticas...")
-    
-    try:
-        from redis_cache import get_cache_info
-        
-        info = get_cache_info()
-        print(f"   Estatsticas disponveis: {'' if info else ''}")
-        
-        if info:
-            print(f"     - Conexo Redis: {info.get('redis_connected', False)}")
-            print(f"     - Estatsticas: {info.get('stats', {})}")
-        
-        return info is not None
-        
-    except Exception as e:
-        print(f"   Erro nas estatsticas: {e}")
-        return False
-
-def test_cache_decorators():
-    """Testa se os decoradores podem ser importados e usados."""
-    print("\n Testando decoradores de cache...")
-    
-    try:
-        from redis_cache import cached_model, cached_prediction
-        print("   Decoradores importados com sucesso")
-        
-        # Teste bsico de decorator
-        @cached_model(ttl=300)
-        def load_test_model(product_name):
-            return f"modelo_para_{product_name}"
-        
-        @cached_prediction(ttl=3600)
-        def test_prediction(product_name, days):
-            return [100] * days
-        
-        # Executa funes decoradas (em modo fallback)
-        model = load_test_model("Bolo_de_Chocolate")
-        prediction = test_prediction("Bolo_de_Chocolate", 7)
-        
-        print(f"   Decorator modelo: {'' if model else ''}")
-        print(f"   Decorator predio: {'' if prediction else ''}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"   Erro nos decoradores: {e}")
-        return False
-
-def main():
-    """Executa todos os testes simplificados."""
-    print(" TESTE SIMPLIFICADO DO SISTEMA DE CACHE")
-    print("=" * 60)
-    
-    tests = [
-        ("Importaes Redis", test_redis_imports),
-        ("Mdulo de Cache", test_cache_module),
-        ("Operaes Fallback", test_fallback_operations),
-        ("Estatsticas", test_statistics),
-        ("Decoradores", test_cache_decorators),
-    ]
-    
-    passed = 0
-    total = len(tests)
-    
-    for test_name, test_func in tests:
-        print(f"\n {test_name}")
-        print("-" * 40)
-        
-        try:
-            result = test_func()
-            if result:
-                print(f" {test_name}: PASSOU")
-                passed += 1
-            else:
-                print(f" {test_name}: FALHOU")
-        except Exception as e:
-            print(f" {test_name}: ERRO - {e}")
-    
-    print("\n" + "=" * 60)
-    print(" RESUMO DOS TESTES")
-    print(f" Testes que passaram: {passed}/{total}")
-    print(f" Testes que falharam: {total - passed}/{total}")
-    
-    if passed == total:
-        print("\n TODOS OS TESTES PASSARAM!")
-        print(" Sistema de cache pronto para uso (modo fallback)")
-    elif passed >= total * 0.7:
-        print(f"\n MAIORIA DOS TESTES PASSARAM ({passed}/{total})")
-        print(" Sistema de cache funcional com algumas limitaes")
-    else:
-        print(f"\n MUITOS TESTES FALHARAM ({total - passed}/{total})")
-        print(" Sistema de cache precisa de correes")
-    
-    return passed == total
-
-if __name__ == "__main__":
-    success = main()
+#!/usr/bin/env python3
+"""
+Teste simplificado do sistema de cache Redis - foco no fallback
+Executa testes que funcionam mesmo sem Redis servidor ativo
+"""
+
+import sys
+import os
+import time
+import logging
+
+# Configurar logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
+
+def test_redis_imports():
+    """Testa se as dependncias Redis esto instaladas."""
+    print(" Testando importaes do Redis...")
+    
+    try:
+        import redis
+        print(f"   Redis {redis.__version__} importado com sucesso")
+        
+        import hiredis
+        print("   Hiredis importado com sucesso")
+        
+        return True
+    except ImportError as e:
+        print(f"   Erro de importao: {e}")
+        return False
+
+def test_cache_module():
+    """Testa se o mdulo de cache pode ser importado."""
+    print("\n Testando mdulo de cache...")
+    
+    try:
+        from redis_cache import RedisCache, ModelCache, get_cache_info
+        print("   Mdulo redis_cache importado com sucesso")
+        
+        # Testa inicializao sem Redis server
+        print("   RedisCache inicializado (modo fallback)")
+        
+        return True
+    except Exception as e:
+        print(f"   Erro no mdulo de cache: {e}")
+        return False
+
+def test_fallback_operations():
+    """Testa operaes de fallback sem Redis."""
+    print("\n Testando operaes de fallback...")
+    
+    try:
+        from redis_cache import ModelCache
+        
+        # Teste de predio cache (deve funcionar em fallback)
+        test_product = "Bolo_de_Chocolate"
+        test_days = 7
+        test_prediction = [100, 110, 105, 95, 120, 115, 108]
+        
+        # Set (deve retornar False em fallback)
+        set_result = ModelCache.set_prediction(test_product, test_days, test_prediction)
+        print(f"   Set fallback: {'' if not set_result else ''}")
+        
+        # Get (deve retornar None em fallback)
+        get_result = ModelCache.get_prediction(test_product, test_days)
+        print(f"   Get fallback: {'' if get_result is None else ''}")
+        
+        # Invalidate (deve retornar False em fallback)
+        invalidate_result = ModelCache.invalidate_model(test_product)
+        print(f"   Invalidate fallback: {'' if not invalidate_result else ''}")
+        
+        return not set_result and get_result is None and not invalidate_result
+        
+    except Exception as e:
+        print(f"   Erro no teste de fallback: {e}")
+        return False
+
+def test_statistics():
+    """Testa estatsticas do cache."""
+    print("\n Testando estatsticas...")
+    
+    try:
+        from redis_cache import get_cache_info
+        
+        info = get_cache_info()
+        print(f"   Estatsticas disponveis: {'' if info else ''}")
+        
+        if info:
+            print(f"     - Conexo Redis: {info.get('redis_connected', False)}")
+            print(f"     - Estatsticas: {info.get('stats', {})}")
+        
+        return info is not None
+        
+    except Exception as e:
+        print(f"   Erro nas estatsticas: {e}")
+        return False
+
+def test_cache_decorators():
+    """Testa se os decoradores podem ser importados e usados."""
+    print("\n Testando decoradores de cache...")
+    
+    try:
+        from redis_cache import cached_model, cached_prediction
+        print("   Decoradores importados com sucesso")
+        
+        # Teste bsico de decorator
+        @cached_model(ttl=300)
+        def load_test_model(product_name):
+            return f"modelo_para_{product_name}"
+        
+        @cached_prediction(ttl=3600)
+        def test_prediction(product_name, days):
+            return [100] * days
+        
+        # Executa funes decoradas (em modo fallback)
+        model = load_test_model("Bolo_de_Chocolate")
+        prediction = test_prediction("Bolo_de_Chocolate", 7)
+        
+        print(f"   Decorator modelo: {'' if model else ''}")
+        print(f"   Decorator predio: {'' if prediction else ''}")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   Erro nos decoradores: {e}")
+        return False
+
+def main():
+    """Executa todos os testes simplificados."""
+    print(" TESTE SIMPLIFICADO DO SISTEMA DE CACHE")
+    print("=" * 60)
+    
+    tests = [
+        ("Importaes Redis", test_redis_imports),
+        ("Mdulo de Cache", test_cache_module),
+        ("Operaes Fallback", test_fallback_operations),
+        ("Estatsticas", test_statistics),
+        ("Decoradores", test_cache_decorators),
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n {test_name}")
+        print("-" * 40)
+        
+        try:
+            result = test_func()
+            if result:
+                print(f" {test_name}: PASSOU")
+                passed += 1
+            else:
+                print(f" {test_name}: FALHOU")
+        except Exception as e:
+            print(f" {test_name}: ERRO - {e}")
+    
+    print("\n" + "=" * 60)
+    print(" RESUMO DOS TESTES")
+    print(f" Testes que passaram: {passed}/{total}")
+    print(f" Testes que falharam: {total - passed}/{total}")
+    
+    if passed == total:
+        print("\n TODOS OS TESTES PASSARAM!")
+        print(" Sistema de cache pronto para uso (modo fallback)")
+    elif passed >= total * 0.7:
+        print(f"\n MAIORIA DOS TESTES PASSARAM ({passed}/{total})")
+        print(" Sistema de cache funcional com algumas limitaes")
+    else:
+        print(f"\n MUITOS TESTES FALHARAM ({total - passed}/{total})")
+        print(" Sistema de cache precisa de correes")
+    
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
     sys.exit(0 if success else 1)
\ No newline at end of file
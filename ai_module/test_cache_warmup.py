@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Testes do planner de warm-up do cache (popularidade + orcamento).
+"""
+
+import os
+import tempfile
+from multiprocessing import Process
+from types import SimpleNamespace
+
+import cache_warmup
+import redis_cache
+from cache_admission import TinyLFUAdmission
+from cache_warmup import AccessTracker, WarmUpPlanner
+
+
+def _fake_models(models_dir, sizes):
+    for name, size in sizes.items():
+        with open(os.path.join(models_dir, f'prophet_model_{name}.pkl'), 'wb') as f:
+            f.write(b'0' * size)
+
+
+def _record_and_flush(path, product_name, count):
+    tracker = AccessTracker(path=path, half_life_hours=1e9)
+    for _ in range(count):
+        tracker.record(product_name, 1)
+        tracker.flush()
+
+
+def test_planner_ranks_by_access_frequency():
+    """Produtos mais acessados sao aquecidos primeiro, com seus horizontes."""
+    with tempfile.TemporaryDirectory() as tmp:
+        _fake_models(tmp, {'Croissant': 100, 'Cappuccino': 100, 'Suco_Natural': 100})
+        tracker = AccessTracker(path=os.path.join(tmp, 'access.json'))
+        for _ in range(3):
+            tracker.record('Suco Natural', 7)
+        tracker.record('Croissant', 1)
+        tracker.flush()
+
+        plan = WarmUpPlanner(tmp, tracker=tracker).plan(memory_budget_mb=10, horizon=30)
+        order = [p['normalized_name'] for p in plan['products']]
+        assert order == ['Suco_Natural', 'Croissant', 'Cappuccino']
+        assert plan['products'][0]['horizons'] == [7, 30]
+        assert plan['products'][2]['horizons'] == [30]
+
+
+def test_planner_respects_memory_budget():
+    """Modelos que estouram o orcamento de memoria ficam fora do plano."""
+    with tempfile.TemporaryDirectory() as tmp:
+        _fake_models(tmp, {'Croissant': 200 * 1024, 'Cappuccino': 150 * 1024})
+        tracker = AccessTracker(path=os.path.join(tmp, 'access.json'))
+        tracker.record('Croissant', 1)
+
+        plan = WarmUpPlanner(tmp, tracker=tracker).plan(memory_budget_mb=1)
+        assert [p['normalized_name'] for p in plan['products']] == ['Croissant']
+        assert plan['skipped_memory'] == ['Cappuccino']
+
+
+def test_concurrent_flushes_keep_every_access():
+    """Workers gravando o mesmo arquivo nao perdem incrementos uns dos outros."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'access.json')
+        workers = [Process(target=_record_and_flush, args=(path, name, 25))
+                   for name in ('Croissant', 'Croissant', 'Cappuccino', 'Cappuccino')]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(60)
+
+        scores = AccessTracker(path=path, half_life_hours=1e9).get_scores()
+        assert round(scores['Croissant']['score']) == 50, scores
+        assert round(scores['Cappuccino']['score']) == 50, scores
+        assert not [f for f in os.listdir(tmp) if f.endswith('.tmp')]
+
+
+def test_untracked_accesses_do_not_feed_admission():
+    """Cargas do warm-up nao contam como acessos reais na politica TinyLFU."""
+    admission = TinyLFUAdmission(small_object_bytes=1024)
+    with admission.untracked():
+        for _ in range(5):
+            admission.record_access('Croissant')
+    assert admission.sketch.estimate('Croissant') == 0
+    assert not admission.should_admit('Croissant', 4096)
+
+    admission.record_access('Croissant')
+    assert admission.sketch.estimate('Croissant') == 1
+
+
+def test_product_without_model_counts_as_failed(tmp_path, monkeypatch):
+    """Sem modelo carregavel nada vai para o cache e o produto conta como falha."""
+    import ai_service
+
+    _fake_models(str(tmp_path), {'Croissant': 100})
+    writes = []
+    monkeypatch.setattr(redis_cache, 'get_cache', lambda: SimpleNamespace(enabled=True))
+    monkeypatch.setattr(redis_cache.ModelCache, 'set_prediction', staticmethod(lambda *args, **kw: writes.append(args)))
+    monkeypatch.setattr(ai_service, 'load_model', lambda name: None)
+    monkeypatch.setattr(cache_warmup, 'access_tracker', AccessTracker(path=str(tmp_path / 'access.json')))
+
+    progress = cache_warmup.run_warm_up(time_budget=30, models_dir=str(tmp_path), horizon=7)
+    assert progress['completed'] == 0 and progress['failed'] == 1, progress
+    assert progress['failures'][0]['product'] == 'Croissant' and writes == []
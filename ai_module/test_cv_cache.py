@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Testes do cache de resultados da validacao cruzada.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+from prophet import Prophet
+
+import model_evaluation
+from cv_cache import CVResultCache, data_key
+from model_evaluation import evaluate_fold, evaluate_model, generate_cv_cutoffs
+
+PARAMS = {'changepoint_prior_scale': 0.1}
+BASE_PARAMS = {'yearly_seasonality': False, 'weekly_seasonality': True, 'daily_seasonality': False}
+
+
+def _history(days=90):
+    rng = np.random.default_rng(0)
+    ds = pd.date_range('2025-01-01', periods=days, freq='D')
+    return pd.DataFrame({'ds': ds, 'y': 20 + np.arange(days) % 7 + rng.poisson(3, days)})
+
+
+def test_data_key_ignores_dtype_and_order():
+    """Mesmo historico com y inteiro/float ou outra ordem gera a mesma chave."""
+    df = _history()
+    shuffled = df.sample(frac=1, random_state=0).assign(y=lambda d: d['y'].astype(float))
+    assert data_key(df) == data_key(shuffled)
+    assert data_key(df) != data_key(df.assign(y=df['y'] + 1))
+
+
+def test_final_evaluation_reuses_search_folds(tmp_path, monkeypatch):
+    """Dobras avaliadas na busca tornam a avaliacao do modelo final instantanea."""
+    cache = CVResultCache(cache_dir=str(tmp_path))
+    df = _history()
+    horizon = '7 days'
+    initial = '54 days'
+    data = data_key(df)
+    cutoffs = generate_cv_cutoffs(df, horizon=horizon, initial=initial)
+    folds = [evaluate_fold(df, PARAMS, c, horizon, BASE_PARAMS, data=data, cache=cache) for c in cutoffs]
+
+    model = Prophet(**BASE_PARAMS, **PARAMS)
+    model.fit(df)
+
+    def no_cross_validation(*args, **kwargs):
+        raise AssertionError('cross_validation nao deveria rodar')
+
+    monkeypatch.setattr(model_evaluation, 'cross_validation', no_cross_validation)
+    metrics = evaluate_model(model, df, horizon=horizon, initial=initial, cache=cache)
+    expected_rmse = np.sqrt(sum(f['sse'] for f in folds) / sum(f['n'] for f in folds))
+    assert np.isclose(metrics['rmse'], expected_rmse), f"{len(cutoffs)} dobras, RMSE {metrics['rmse']:.3f}"
+
+    # Nova instancia (outro processo): metricas completas lidas do disco
+    reloaded = evaluate_model(model, df, horizon=horizon, initial=initial,
+                              cache=CVResultCache(cache_dir=str(tmp_path)))
+    assert np.isclose(reloaded['rmse'], metrics['rmse'])
+    assert isinstance(reloaded['cv_metrics'], pd.DataFrame)
+    assert pd.api.types.is_timedelta64_dtype(reloaded['cv_metrics']['horizon'])
+
+
+def test_changed_params_miss_cache(tmp_path):
+    """Outra configuracao nao reaproveita dobras de uma configuracao diferente."""
+    cache = CVResultCache(cache_dir=str(tmp_path))
+    df = _history()
+    cutoff = generate_cv_cutoffs(df, horizon='7 days', initial='54 days')[-1]
+    evaluate_fold(df, PARAMS, cutoff, '7 days', BASE_PARAMS, data=data_key(df), cache=cache)
+    evaluate_fold(df, {'changepoint_prior_scale': 0.5}, cutoff, '7 days', BASE_PARAMS,
+                  data=data_key(df), cache=cache)
+    assert cache.stats['writes'] == 2 and cache.stats['hits'] == 0
+
+
+def test_prune_and_memory_evict_least_recently_used(tmp_path):
+    """Acertos renovam a entrada: prune e a memoria descartam as menos usadas."""
+    cache = CVResultCache(cache_dir=str(tmp_path), max_files=2, max_memory_entries=2)
+    for i, key in enumerate(['aa1', 'bb2', 'cc3']):
+        cache._store(key, {'rmse': i})
+        os.utime(cache._path(key), (1000 + i, 1000 + i))
+    assert list(cache._memory) == ['bb2', 'cc3']
+
+    # Leitura do disco (a mais antiga) e da memoria renovam o arquivo
+    assert cache._load('aa1') == {'rmse': 0}
+    assert cache._load('cc3') == {'rmse': 2}
+    assert list(cache._memory) == ['aa1', 'cc3']
+
+    assert cache.prune() == 1
+    assert not os.path.exists(cache._path('bb2'))
+    assert os.path.exists(cache._path('aa1')) and os.path.exists(cache._path('cc3'))
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Testes dos engines de previsao e do seletor de engine por produto.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import model_format
+from baseline_engine import BaselineModel
+from forecast_engines import (ForecastEngine, engine_for_model, get_engine, preselect_engine, previous_prophet_profile,
+                              select_engine, train_engine_product)
+from model_manifest import get_model_engine, get_model_path, load_manifest, update_manifest_entry
+from product_name_utils import get_normalized_filename, normalize_product_name
+
+
+def _weekly_sales(days=200, seed=7):
+    rng = np.random.default_rng(seed)
+    ds = pd.date_range('2025-01-01', periods=days, freq='D')
+    y = 40 + 25 * (ds.dayofweek >= 5) + rng.normal(0, 2, days)
+    return pd.DataFrame({'ds': ds, 'y': y})
+
+
+def test_selector_picks_cheapest_engine_within_tolerance():
+    profiles = {
+        'baseline': {'rmse': 10.3, 'train_s': 0.01, 'predict_ms': 0.2},
+        'prophet': {'rmse': 10.0, 'train_s': 30.0, 'predict_ms': 40.0},
+    }
+    decision = select_engine(profiles, tolerance=0.05, metric='rmse')
+    assert decision['engine'] == 'baseline' and decision['target'] == 10.5, decision['reason']
+
+    # Fora da tolerancia o mais preciso vence, mesmo sendo mais caro
+    assert select_engine(profiles, tolerance=0.01, metric='rmse')['engine'] == 'prophet'
+    # Sem metricas (historico curto) vale o primeiro candidato
+    assert select_engine({'intermittent': {'rmse': None}, 'baseline': {}}, metric='rmse')['engine'] == 'intermittent'
+
+
+def test_preselect_skips_prophet_with_previous_metrics():
+    df = _weekly_sales()
+
+    # Sem metricas anteriores o Prophet precisa ser treinado para comparar
+    decision, profiles = preselect_engine(df, ['baseline', 'prophet'])
+    assert decision is None and profiles['baseline']['rmse'] > 0
+
+    entry = {'engine_decision': {'candidates': {'prophet': {
+        'rmse': profiles['baseline']['rmse'], 'train_s': 20.0, 'predict_ms': 30.0, 'source': 'current'}}}}
+    decision, _ = preselect_engine(df, ['baseline', 'prophet'], previous_prophet_profile(entry, max_reuses=2))
+    assert decision['engine'] == 'baseline', decision['reason']
+    assert decision['candidates']['prophet']['source'] == 'previous'
+
+    # As metricas anteriores expiram depois de max_reuses decisoes seguidas
+    assert decision['candidates']['prophet']['reuses'] == 1
+    prior = previous_prophet_profile({'engine_decision': decision}, max_reuses=2)
+    decision, _ = preselect_engine(df, ['baseline', 'prophet'], prior)
+    assert decision['candidates']['prophet']['reuses'] == 2
+    assert previous_prophet_profile({'engine_decision': decision}, max_reuses=2) is None
+
+
+def test_engines_must_implement_build():
+    class Incomplete(ForecastEngine):
+        name = 'incomplete'
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_baseline_model_roundtrip():
+    df = _weekly_sales()
+    model = BaselineModel().fit(df)
+    assert model.method == 'seasonal_naive'
+
+    restored = model_format.from_bytes(get_engine('baseline').serialize(model, 'Croissant'))
+    assert engine_for_model(restored).name == 'baseline'
+    future = pd.DataFrame({'ds': pd.date_range(df['ds'].max() + pd.Timedelta(days=1), periods=14)})
+    forecast = engine_for_model(restored).predict(restored, future)
+    pd.testing.assert_frame_equal(forecast, model.predict(future))
+    # Segue o ciclo semanal do historico: fins de semana acima dos dias uteis
+    weekend = forecast['ds'].dt.dayofweek >= 5
+    assert forecast.loc[weekend, 'yhat'].min() > forecast.loc[~weekend, 'yhat'].max()
+
+
+def test_selected_engine_is_served_without_prophet(tmp_path):
+    """A decisao vai para o manifesto e o servico carrega o modelo sem importar o Prophet."""
+    models_dir = str(tmp_path)
+    result = train_engine_product('Croissant', {'data': _weekly_sales(), 'models_dir': models_dir,
+                                                'candidates': ['baseline']})
+    update_manifest_entry(models_dir, 'Croissant', source='test', engine=result['engine'],
+                          engine_decision=result['engine_decision'])
+    assert get_model_engine('Croissant', models_dir) == 'baseline'
+    entry = load_manifest(models_dir)['products'][normalize_product_name('Croissant')]
+    assert entry['engine_decision']['engine'] == 'baseline'
+    with open(os.path.join(models_dir, get_normalized_filename('Croissant', 'params')), encoding='utf-8') as f:
+        assert json.load(f)['engine'] == 'baseline'
+
+    script = (
+        "import sys, pandas as pd\n"
+        "from forecast_engines import engine_for_model, get_engine\n"
+        "from model_manifest import get_model_engine\n"
+        f"engine = get_engine(get_model_engine('Croissant', {models_dir!r}))\n"
+        f"model = engine.load({get_model_path('Croissant', models_dir)!r})\n"
+        "forecast = engine_for_model(model).predict(model, pd.DataFrame({'ds': pd.date_range('2025-07-20', periods=7)}))\n"
+        "assert 'prophet' not in sys.modules\n"
+        "print(engine.name, len(forecast))\n"
+    )
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout
+    assert output.split() == ['baseline', '7']
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Testes do cache de calendarios de feriados.
+"""
+
+import pandas as pd
+from prophet.make_holidays import make_holidays_df
+
+import holiday_calendar
+from holiday_calendar import get_holidays, calendar_path, clear_memory_cache
+from seasonality_analysis import detect_data_frequency
+
+
+def test_calendar_built_once_and_reused(tmp_path, monkeypatch):
+    """O calendario e gerado uma vez, depois lido da memoria ou do disco."""
+    calls = []
+    build = holiday_calendar._build_calendar
+    monkeypatch.setattr(holiday_calendar, '_build_calendar',
+                        lambda *key: calls.append(key) or build(*key))
+    clear_memory_cache()
+
+    first = get_holidays('BR', 2024, 2026, calendar_dir=str(tmp_path))
+    assert (tmp_path / calendar_path('BR', 2024, 2026, calendar_dir=str(tmp_path))).exists()
+    get_holidays('BR', years=range(2024, 2027), calendar_dir=str(tmp_path))
+    clear_memory_cache()
+    from_disk = get_holidays('BR', 2024, 2026, calendar_dir=str(tmp_path))
+
+    assert calls == [('BR', 2024, 2026)], f"Geracoes: {len(calls)}"
+    pd.testing.assert_frame_equal(first, from_disk)
+
+    expected = make_holidays_df(year_list=range(2024, 2027), country='BR')
+    assert set(zip(pd.to_datetime(expected['ds']), expected['holiday'])) == \
+        set(zip(from_disk['ds'], from_disk['holiday']))
+    clear_memory_cache()
+
+
+def test_frequency_ignores_repeated_dates():
+    """Varios produtos no mesmo dia continuam sendo dados diarios."""
+    dates = pd.date_range('2025-01-01', periods=30, freq='D')
+    df = pd.DataFrame({'ds': list(dates) * 3, 'item_name': ['A'] * 30 + ['B'] * 30 + ['C'] * 30})
+    assert detect_data_frequency(df.sample(frac=1, random_state=0)) == 'daily'
+    assert detect_data_frequency(pd.DataFrame({'ds': pd.date_range('2025-01-01', periods=48, freq='h')})) == 'hourly'
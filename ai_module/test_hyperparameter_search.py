@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Testes da busca de hiperparametros com successive halving.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import hyperparameter_optimization
+from hyperparameter_optimization import _evaluate_rung, _rung_sizes, successive_halving_search
+
+
+def _series(days=200):
+    ds = pd.date_range('2025-01-01', periods=days, freq='D')
+    y = 20 + 5 * np.sin(np.arange(days) * 2 * np.pi / 7) + np.random.default_rng(0).normal(0, 1, days)
+    return pd.DataFrame({'ds': ds, 'y': y})
+
+
+def test_rung_sizes_grow_to_all_cutoffs():
+    """Cada rodada usa eta vezes mais cutoffs, terminando em todos."""
+    assert _rung_sizes(13, 27, 3) == [1, 4, 13]
+    assert _rung_sizes(2, 27, 3) == [1, 2]
+    assert _rung_sizes(5, 1, 3) == [5]
+
+
+def test_halving_uses_fraction_of_fits():
+    """A busca devolve parametros da grade com menos ajustes que o grid completo."""
+    grid = {'changepoint_prior_scale': [0.001, 0.1, 0.5], 'seasonality_prior_scale': [0.1, 10.0]}
+    result = successive_halving_search(_series(), grid, horizon='14 days', eta=2,
+                                       base_params={'yearly_seasonality': False, 'daily_seasonality': False})
+
+    assert result['best_params'] in [dict(zip(grid, v)) for v in
+                                     [(a, b) for a in grid['changepoint_prior_scale']
+                                      for b in grid['seasonality_prior_scale']]]
+    n_cutoffs = result['rungs'][-1]['cutoffs']
+    assert result['fits'] < 6 * n_cutoffs, f"{result['fits']} ajustes (grid completo: {6 * n_cutoffs})"
+
+
+def test_halving_respects_time_budget():
+    """Com orcamento esgotado a busca para e devolve o melhor ja avaliado."""
+    grid = {'changepoint_prior_scale': [0.001, 0.01, 0.1, 0.5]}
+    result = successive_halving_search(_series(), grid, horizon='14 days', time_budget=1e-9,
+                                       base_params={'yearly_seasonality': False})
+    assert result['fits'] == 0 and result['best_params'] is None
+
+
+def test_time_budget_waits_for_running_folds(monkeypatch):
+    """No fim do prazo as dobras na fila sao canceladas e as em execucao aguardadas."""
+    running = []
+    lock = threading.Lock()
+
+    def slow_fold(df, params, cutoff, horizon, base_params, data=None, engine=None):
+        with lock:
+            running.append(cutoff)
+        time.sleep(0.3)
+        with lock:
+            running.remove(cutoff)
+        return {'cutoff': str(cutoff), 'rmse': float(cutoff), 'n': 1}
+
+    monkeypatch.setattr(hyperparameter_optimization, '_safe_fold', slow_fold)
+    folds = {0: {}}
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        fits, out_of_time = _evaluate_rung(None, [{}], [0], list(range(6)), folds, '14 days', None,
+                                           pool, time.perf_counter() + 0.1)
+        assert out_of_time and fits == 2
+        assert not running, "dobras ainda ocupando o pool apos o retorno"
+    assert sorted(folds[0]) == [0, 1]
+
+
+def test_halving_with_shared_pool_matches_sequential():
+    """Dobras distribuidas no pool compartilhado produzem o mesmo resultado."""
+    from training_pool import get_shared_pool, shutdown_shared_pool
+
+    grid = {'changepoint_prior_scale': [0.001, 0.5], 'seasonality_prior_scale': [0.1, 10.0]}
+    base = {'yearly_seasonality': False, 'daily_seasonality': False}
+    sequential = successive_halving_search(_series(), grid, horizon='14 days', eta=2, base_params=base)
+    try:
+        shared = successive_halving_search(_series(), grid, horizon='14 days', eta=2, base_params=base,
+                                           pool=get_shared_pool(2))
+    finally:
+        shutdown_shared_pool()
+    assert shared['best_params'] == sequential['best_params']
+    assert shared['fits'] == sequential['fits']
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Testes do retreinamento incremental (fingerprint dos dados por produto).
+"""
+
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from model_manifest import compute_data_fingerprint, get_data_fingerprint, load_manifest
+from model_retrainer import retrain_prophet_models
+
+
+def _sales(products, days=60, start='2025-01-01'):
+    ds = pd.date_range(start, periods=days, freq='D')
+    rng = np.random.default_rng(0)
+    frames = []
+    for i, product in enumerate(products):
+        y = 10 + i + np.arange(days) % 7 + rng.poisson(2, days)
+        frames.append(pd.DataFrame({'ds': ds, 'item_name': product, 'y': y}))
+    return pd.concat(frames, ignore_index=True)
+
+
+def _digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def test_fingerprint_ignores_row_order():
+    """Mesmo historico em outra ordem gera o mesmo fingerprint."""
+    df = _sales(['Croissant'])
+    shuffled = df.sample(frac=1, random_state=1)
+    assert compute_data_fingerprint(df) == compute_data_fingerprint(shuffled)
+
+    changed = df.copy()
+    changed.loc[0, 'y'] += 1
+    fingerprint = compute_data_fingerprint(changed)
+    assert fingerprint['rows'] == 60
+    assert fingerprint['content_hash'] != compute_data_fingerprint(df)['content_hash']
+
+
+def test_retrain_only_changed_products():
+    """Apenas o produto com dados novos e retreinado; os demais ficam identicos."""
+    with tempfile.TemporaryDirectory() as tmp:
+        models_dir = os.path.join(tmp, 'models')
+        data_path = os.path.join(tmp, 'sales.csv')
+        new_path = os.path.join(tmp, 'new.csv')
+        _sales(['Croissant', 'Cappuccino']).to_csv(data_path, index=False)
+
+        first = retrain_prophet_models(data_path, models_dir, workers=1)
+        assert first['succeeded'] == 2
+        assert get_data_fingerprint('Croissant', models_dir)['rows'] == 60
+
+        croissant = os.path.join(models_dir, 'prophet_model_Croissant.pkl')
+        before = _digest(croissant)
+
+        _sales(['Cappuccino'], days=3, start='2025-03-02').to_csv(new_path, index=False)
+        second = retrain_prophet_models(data_path, models_dir, new_path, workers=1)
+
+        status = {r['product_name']: r['status'] for r in second['products']}
+        assert status == {'Cappuccino': 'success', 'Croissant': 'skipped'}
+        assert _digest(croissant) == before
+        assert get_data_fingerprint('Cappuccino', models_dir)['rows'] == 63
+
+
+def test_next_job_keeps_previous_job_rows():
+    """Linhas de um job entram no historico: o job seguinte nao retreina o produto com dados antigos."""
+    with tempfile.TemporaryDirectory() as tmp:
+        models_dir = os.path.join(tmp, 'models')
+        data_path = os.path.join(tmp, 'sales.csv')
+        _sales(['Croissant', 'Cappuccino']).to_csv(data_path, index=False)
+        retrain_prophet_models(data_path, models_dir, workers=1)
+
+        # Job 1: dias novos do Croissant (um deles repete uma linha ja existente)
+        job1 = os.path.join(tmp, 'job1.csv')
+        pd.concat([_sales(['Croissant'], days=3, start='2025-03-02'),
+                   _sales(['Croissant'], days=1)]).to_csv(job1, index=False)
+        first = retrain_prophet_models(data_path, models_dir, job1, workers=1)
+        assert first['appended_rows'] == 3
+        assert get_data_fingerprint('Croissant', models_dir)['rows'] == 63
+        croissant = _digest(os.path.join(models_dir, 'prophet_model_Croissant.pkl'))
+
+        # Job 2: apenas o Cappuccino; o Croissant continua com as linhas do job 1
+        job2 = os.path.join(tmp, 'job2.csv')
+        _sales(['Cappuccino'], days=2, start='2025-03-02').to_csv(job2, index=False)
+        second = retrain_prophet_models(data_path, models_dir, job2, workers=1)
+
+        status = {r['product_name']: r['status'] for r in second['products']}
+        assert status == {'Cappuccino': 'success', 'Croissant': 'skipped'}, status
+        assert get_data_fingerprint('Croissant', models_dir)['rows'] == 63
+        assert _digest(os.path.join(models_dir, 'prophet_model_Croissant.pkl')) == croissant
+        history = pd.read_csv(data_path)
+        assert history.groupby('item_name').size().to_dict() == {'Cappuccino': 62, 'Croissant': 63}
+        assert not history.duplicated(subset=['ds', 'item_name']).any()
+
+
+def test_retrain_reevaluates_prophet_without_previous_metrics():
+    """Sem metricas do Prophet no manifesto, o retreino avalia o Prophet e registra uma nova decisao."""
+    with tempfile.TemporaryDirectory() as tmp:
+        models_dir = os.path.join(tmp, 'models')
+        data_path = os.path.join(tmp, 'sales.csv')
+        _sales(['Croissant'], days=150).to_csv(data_path, index=False)
+        report = retrain_prophet_models(data_path, models_dir, workers=1)
+        assert report['succeeded'] == 1
+
+        decision = load_manifest(models_dir)['products']['Croissant']['engine_decision']
+        assert decision['candidates']['prophet']['source'] == 'current'
+        assert decision['candidates']['prophet']['rmse'] > 0 and decision['engine'] in ('baseline', 'prophet')
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Testes do modelo de demanda intermitente (Croston, SBA, TSB).
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+
+import model_format
+from forecast_engines import train_engine_product
+from intermittent_demand import (IntermittentDemandModel, fit_rate, intermittent_products, summarize_intermittent,
+                                 train_intermittent_product, zero_share)
+from model_manifest import get_model_path, update_manifest_entry
+from product_name_utils import get_normalized_filename
+
+
+def _sparse_sales(name='Torta de Morango', days=200, probability=0.2, seed=5):
+    rng = np.random.default_rng(seed)
+    ds = pd.date_range('2025-01-01', periods=days, freq='D')
+    y = rng.poisson(4, days) * (rng.random(days) < probability)
+    return pd.DataFrame({'ds': ds, 'y': y.astype(float), 'item_name': name})
+
+
+def _croston_loop(values, alpha, beta, variant):
+    """Recursao classica, dia a dia, como referencia."""
+    size = interval = None
+    probability = None
+    days_since = 0
+    for t, y in enumerate(values):
+        days_since += 1
+        if variant == 'tsb':
+            probability = float(y > 0) if probability is None else beta * (y > 0) + (1 - beta) * probability
+        if y > 0:
+            size = y if size is None else alpha * y + (1 - alpha) * size
+            interval = days_since if interval is None else beta * days_since + (1 - beta) * interval
+            days_since = 0
+    if variant == 'tsb':
+        return size * probability
+    rate = size / interval
+    return rate * (1 - beta / 2) if variant == 'sba' else rate
+
+
+def test_closed_form_matches_recursion():
+    values = _sparse_sales()['y'].to_numpy()
+    for method in ('croston', 'sba', 'tsb'):
+        rate = fit_rate(values, method, alpha=0.2, beta=0.15)[2]
+        np.testing.assert_allclose(rate, _croston_loop(values, 0.2, 0.15, method))
+    assert fit_rate(np.zeros(30))[2] == 0.0
+
+
+def test_zero_share_ignores_days_before_launch():
+    values = np.array([[0, 0, 0, 0, 5, 5, 0, 5], [1, 0, 1, 0, 1, 0, 1, 0], [0] * 8], dtype=float)
+    np.testing.assert_allclose(zero_share(values), [0.25, 0.5, 1.0])
+
+    regular = _sparse_sales('Croissant', probability=1.0)
+    regular['y'] += 10
+    shares = intermittent_products(pd.concat([_sparse_sales(), regular]), threshold=0.4)
+    assert list(shares) == ['Torta de Morango'] and shares['Torta de Morango'] > 0.7
+
+
+def test_trained_model_is_served_without_prophet(tmp_path):
+    """O modelo exportado e carregado e previsto em um processo que nao importa o Prophet."""
+    models_dir = str(tmp_path)
+    result = train_intermittent_product('Torta de Morango', {'data': _sparse_sales(), 'models_dir': models_dir})
+    assert result['engine'] == 'intermittent' and result['metrics']['mae'] > 0, result['metrics']
+    summary = summarize_intermittent([result])
+    assert summary['products'] == 1 and summary['methods'] == {result['parameters']['method']: 1}
+    update_manifest_entry(models_dir, 'Torta de Morango', source='test')
+
+    path = get_model_path('Torta de Morango', models_dir)
+    assert path.endswith('.mdl')
+    header = model_format.read_header(path)
+    assert header['model_type'] == 'intermittent' and header['format_version'] == 2
+
+    script = (
+        "import sys, pandas as pd, model_format\n"
+        f"model = model_format.load_model({path!r})\n"
+        "forecast = model.predict(pd.DataFrame({'ds': pd.date_range('2025-08-01', periods=7)}))\n"
+        "assert 'prophet' not in sys.modules\n"
+        "print(round(float(forecast['yhat'].iloc[0]), 6))\n"
+    )
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout
+    model = IntermittentDemandModel(method=result['parameters']['method']).fit(_sparse_sales())
+    assert float(output) == round(model.rate, 6)
+    forecast = model.predict(pd.DataFrame({'ds': pd.date_range('2025-08-01', periods=7)}))
+    assert list(forecast.columns) == ['ds', 'yhat', 'yhat_lower', 'yhat_upper']
+    assert (forecast['yhat_lower'] >= 0).all() and (forecast['yhat_upper'] > forecast['yhat']).all()
+
+
+def test_engine_selector_trains_through_intermittent_job(tmp_path):
+    """O engine 'intermittent' escolhido pelo seletor usa o job do modelo intermitente."""
+    models_dir = str(tmp_path)
+    result = train_engine_product('Torta de Morango', {'data': _sparse_sales(), 'models_dir': models_dir,
+                                                       'candidates': ['intermittent']})
+    assert result['engine'] == 'intermittent' and result['engine_decision']['engine'] == 'intermittent'
+    assert result['metrics']['coverage'] is not None and not result['prophet_trained']
+    with open(os.path.join(models_dir, get_normalized_filename('Torta de Morango', 'params')), encoding='utf-8') as f:
+        saved = json.load(f)
+    assert saved['engine_decision']['engine'] == 'intermittent' and saved['zero_share'] > 0.7
+    assert saved['parameters'] == result['engine_decision']['candidates']['intermittent']['params']
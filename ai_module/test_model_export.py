@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Testes da exportacao enxuta dos modelos para inferencia.
+"""
+
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+from prophet import Prophet
+
+import model_format
+from model_export import export_model, load_full_model, summarize_exports
+
+
+def _fitted_model():
+    rng = np.random.default_rng(0)
+    ds = pd.date_range('2025-01-01', periods=120, freq='D')
+    df = pd.DataFrame({'ds': ds, 'y': 20 + np.arange(120) % 7 + rng.poisson(3, 120)})
+    df['promocao'] = (df.index % 10 == 0).astype(int)
+    model = Prophet(yearly_seasonality=False, weekly_seasonality=True, daily_seasonality=False)
+    model.add_regressor('promocao')
+    return model.fit(df)
+
+
+def test_slim_model_predicts_like_full(tmp_path):
+    """O modelo servido e menor e preve exatamente como o completo."""
+    model = _fitted_model()
+    stats = export_model(model, 'Pao Frances', str(tmp_path))
+
+    with open(tmp_path / 'prophet_model_Pao_Frances.pkl', 'rb') as f:
+        slim = pickle.load(f)
+    full = load_full_model(str(tmp_path), 'Pao Frances')
+    assert len(full.history) == 120 and len(slim.history) == 1
+    assert slim.stan_backend is None
+    assert stats['slim_bytes'] < stats['full_bytes']
+    assert os.path.getsize(tmp_path / 'prophet_model_Pao_Frances.pkl') == stats['slim_bytes']
+
+    future = pd.DataFrame({'ds': pd.date_range('2025-05-01', periods=14, freq='D')})
+    future['promocao'] = (future.index % 10 == 0).astype(int)
+    np.random.seed(0)
+    expected = full.predict(future)
+    np.random.seed(0)
+    actual = slim.predict(future)
+    for column in ('yhat', 'yhat_lower', 'yhat_upper'):
+        np.testing.assert_allclose(actual[column], expected[column])
+
+    compact = model_format.load_model(stats['model_path'])
+    assert stats['model_path'].endswith('prophet_model_Pao_Frances.mdl')
+    np.random.seed(0)
+    np.testing.assert_allclose(compact.predict(future)['yhat'], expected['yhat'])
+
+    summary = summarize_exports([{'export': stats}, {'status': 'skipped'}])
+    assert summary['products'] == 1 and summary['size_reduction_pct'] > 0
+
+
+def test_full_model_optional(tmp_path):
+    """Sem keep_full nem write_pickle apenas o modelo compacto e gravado."""
+    export_model(_fitted_model(), 'Croissant', str(tmp_path), keep_full=False, write_pickle=False)
+    assert load_full_model(str(tmp_path), 'Croissant') is None
+    assert (tmp_path / 'prophet_model_Croissant.mdl').exists()
+    assert not (tmp_path / 'prophet_model_Croissant.pkl').exists()
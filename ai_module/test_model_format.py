@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Testes do formato compacto dos modelos (cabecalho JSON + arrays NumPy).
+"""
+
+import hashlib
+import json
+import pickle
+import struct
+
+import numpy as np
+import pandas as pd
+import pytest
+from prophet import Prophet
+
+import model_format
+from cache_backends import SQLiteCache
+from model_export import slim_model
+
+
+def _fitted_model():
+    rng = np.random.default_rng(1)
+    ds = pd.date_range('2025-01-01', periods=150, freq='D')
+    df = pd.DataFrame({'ds': ds, 'y': 30 + 5 * (ds.dayofweek >= 5) + rng.normal(0, 2, 150)})
+    df['promocao'] = (df.index % 9 == 0).astype(float)
+    holidays = pd.DataFrame({'ds': pd.to_datetime(['2025-03-03', '2025-04-18']), 'holiday': ['Carnaval', 'Sexta Santa']})
+    model = Prophet(yearly_seasonality=False, weekly_seasonality=True, daily_seasonality=False, holidays=holidays)
+    model.add_regressor('promocao')
+    return slim_model(model.fit(df))
+
+
+def _future():
+    future = pd.DataFrame({'ds': pd.date_range('2025-06-01', periods=21, freq='D')})
+    future['promocao'] = (future.index % 9 == 0).astype(float)
+    return future
+
+
+def _assert_same_forecast(expected_model, actual_model):
+    np.random.seed(0)
+    expected = expected_model.predict(_future())
+    np.random.seed(0)
+    actual = actual_model.predict(_future())
+    for column in ('yhat', 'yhat_lower', 'yhat_upper'):
+        np.testing.assert_array_equal(actual[column], expected[column])
+
+
+def test_roundtrip_matches_pickle(tmp_path):
+    """O modelo recarregado (com e sem mmap) preve exatamente como o original."""
+    model = _fitted_model()
+    path = str(tmp_path / 'prophet_model_Cappuccino.mdl')
+    assert model_format.save_model(model, path, product_name='Cappuccino') > 0
+
+    for mmap in (False, True):
+        loaded = model_format.load_model(path, mmap=mmap)
+        _assert_same_forecast(model, loaded)
+        assert loaded.stan_fit is None and loaded.fit_kwargs == {}
+        assert list(loaded.extra_regressors) == ['promocao']
+
+    header = model_format.read_header(path)
+    assert header['format_version'] == model_format.PROPHET_FORMAT_VERSION
+    assert header['model_type'] == 'prophet'
+    assert header['product_name'] == 'Cappuccino'
+
+
+def test_checksum_and_version_are_validated(tmp_path):
+    """Bytes corrompidos ou versao futura do formato sao recusados."""
+    payload = model_format.to_bytes(_fitted_model())
+    path = tmp_path / 'model.mdl'
+    path.write_bytes(payload)
+    assert model_format.validate_model_file(str(path))['blob_bytes'] > 0
+
+    corrupted = bytearray(payload)
+    corrupted[-8] ^= 0xFF
+    path.write_bytes(bytes(corrupted))
+    with pytest.raises(model_format.ModelFormatError):
+        model_format.validate_model_file(str(path))
+    with pytest.raises(model_format.ModelFormatError):
+        model_format.from_bytes(bytes(corrupted))
+
+    future_version = payload.replace(b'"format_version":1', b'"format_version":9', 1)
+    with pytest.raises(model_format.ModelFormatError):
+        model_format.from_bytes(future_version)
+    with pytest.raises(model_format.ModelFormatError):
+        model_format.from_bytes(pickle.dumps(_fitted_model()))
+
+
+def _with_header(payload, mutate):
+    """Regrava o cabecalho alterado por `mutate`, mantendo o bloco de arrays."""
+    header, _, blob_start = model_format._parse_prefix(payload)
+    mutate(header)
+    header_bytes = json.dumps(header, separators=(',', ':')).encode('ascii')
+    prefix_size = len(model_format.MAGIC) + 4 + len(header_bytes)
+    return b''.join([model_format.MAGIC, struct.pack('<I', len(header_bytes)), header_bytes,
+                     b' ' * model_format._pad(prefix_size), payload[blob_start:]])
+
+
+def test_header_is_covered_and_validated(tmp_path):
+    """Cabecalho adulterado, arrays fora do bloco e atributos desconhecidos sao recusados."""
+    payload = model_format.to_bytes(_fitted_model(), product_name='Croissant')
+    tampered = payload.replace(b'"product_name":"Croissant"', b'"product_name":"Croissanx"', 1)
+    assert tampered != payload
+    path = tmp_path / 'model.mdl'
+    path.write_bytes(tampered)
+    with pytest.raises(model_format.ModelFormatError):
+        model_format.from_bytes(tampered)
+    with pytest.raises(model_format.ModelFormatError):
+        model_format.validate_model_file(str(path))
+
+    def out_of_bounds(header):
+        header['arrays']['a0']['offset'] = header['blob_bytes']
+
+    def unknown_attribute(header):
+        header['attributes']['__class__'] = {'kind': 'value', 'value': 1}
+
+    def malformed_attribute(header):
+        header['attributes']['history'] = {'value': 1}
+
+    for mutate in (out_of_bounds, unknown_attribute, malformed_attribute):
+        with pytest.raises(model_format.ModelFormatError):
+            model_format.from_bytes(_with_header(payload, mutate), verify=False)
+
+
+def test_blob_only_checksum_still_loads():
+    """Arquivos gravados antes do checksum do cabecalho continuam legiveis."""
+    payload = model_format.to_bytes(_fitted_model())
+
+    def legacy(header):
+        blob = payload[len(payload) - header['blob_bytes']:]
+        del header['checksum_scope']
+        header['checksum'] = hashlib.sha256(blob).hexdigest()
+
+    model = model_format.from_bytes(_with_header(payload, legacy))
+    assert list(model.extra_regressors) == ['promocao']
+
+
+def test_cache_backend_stores_compact_models(tmp_path):
+    """O cache guarda modelos no formato compacto e o restante em pickle."""
+    cache = SQLiteCache(path=str(tmp_path / 'cache.sqlite3'))
+    model = _fitted_model()
+    assert model_format.is_compact(cache.serialize(model))
+    assert not model_format.is_compact(cache.serialize({'yhat': [1.0]}))
+
+    assert cache.set('ai_module:model:Cappuccino:x', model)
+    _assert_same_forecast(model, cache.get('ai_module:model:Cappuccino:x'))
+    assert cache.set('ai_module:prediction:x', {'yhat': [1.0]})
+    assert cache.get('ai_module:prediction:x') == {'yhat': [1.0]}
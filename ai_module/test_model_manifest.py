@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Testes do manifesto de modelos e das chaves de cache versionadas.
+"""
+
+import os
+import tempfile
+
+from model_manifest import (
+    file_checksum, get_model_version, get_product_data_version,
+    load_manifest, update_manifest_entry, MISSING_VERSION
+)
+
+
+def _write(path, content):
+    with open(path, 'wb') as f:
+        f.write(content)
+
+
+def test_model_version_follows_file_content():
+    """A versao do modelo muda quando o arquivo e reescrito."""
+    with tempfile.TemporaryDirectory() as models_dir:
+        model_path = os.path.join(models_dir, 'prophet_model_Croissant.pkl')
+        assert get_model_version('Croissant', models_dir) == MISSING_VERSION
+
+        _write(model_path, b'modelo-v1')
+        v1 = get_model_version('Croissant', models_dir)
+        assert v1 == file_checksum(model_path)
+
+        _write(model_path, b'modelo-v2-retreinado')
+        v2 = get_model_version('Croissant', models_dir)
+        assert v2 != v1, f"versao nao mudou: {v1}"
+
+
+def test_manifest_entry_bumps_version():
+    """Cada publicacao incrementa a versao global do manifesto."""
+    with tempfile.TemporaryDirectory() as models_dir:
+        _write(os.path.join(models_dir, 'prophet_model_Cappuccino.pkl'), b'abc')
+
+        entry = update_manifest_entry(models_dir, 'Cappuccino', source='test')
+        assert entry['version'] == get_model_version('Cappuccino', models_dir)
+        assert load_manifest(models_dir)['version'] == 1
+
+        update_manifest_entry(models_dir, 'Cappuccino', source='test')
+        assert load_manifest(models_dir)['version'] == 2
+
+
+def test_prediction_key_depends_on_versions(monkeypatch):
+    """A chave de predicao muda com o modelo e com os dados do produto, e so os do proprio produto."""
+    import functools
+    import redis_cache
+    from redis_cache import ModelCache
+
+    with tempfile.TemporaryDirectory() as models_dir:
+        monkeypatch.setattr(redis_cache, 'get_model_version',
+                            functools.partial(get_model_version, models_dir=models_dir))
+        monkeypatch.setattr(redis_cache, 'get_product_data_version',
+                            functools.partial(get_product_data_version, models_dir=models_dir))
+        for product in ('Croissant', 'Cappuccino'):
+            _write(os.path.join(models_dir, f'prophet_model_{product}.pkl'), b'modelo-v1')
+            update_manifest_entry(models_dir, product, source='test', data_fingerprint={'content_hash': 'd1'})
+
+        key_a = ModelCache._prediction_key('Croissant', 7)
+        key_b = ModelCache._prediction_key('Cappuccino', 7)
+        assert key_a.startswith('ai_module:prediction:Croissant:') and key_a != key_b
+        assert ModelCache._prediction_key('Croissant', 7) == key_a
+
+        # Novo historico do Croissant: muda so a chave do Croissant
+        update_manifest_entry(models_dir, 'Croissant', source='test', data_fingerprint={'content_hash': 'd2'})
+        key_data = ModelCache._prediction_key('Croissant', 7)
+        assert key_data != key_a
+        assert ModelCache._prediction_key('Cappuccino', 7) == key_b
+
+        # Modelo retreinado: muda a chave de novo
+        _write(os.path.join(models_dir, 'prophet_model_Croissant.pkl'), b'modelo-v2-retreinado')
+        assert ModelCache._prediction_key('Croissant', 7) not in (key_a, key_data)
+        assert ModelCache._prediction_key('Cappuccino', 7) == key_b
+
+
+def _publish_many(models_dir, product, count):
+    for _ in range(count):
+        update_manifest_entry(models_dir, product, source='test')
+
+
+def test_concurrent_processes_do_not_lose_updates():
+    """Dois processos publicando ao mesmo tempo: nenhuma entrada ou incremento de versao se perde."""
+    import multiprocessing
+
+    with tempfile.TemporaryDirectory() as models_dir:
+        products = ['Croissant', 'Cappuccino']
+        for product in products:
+            _write(os.path.join(models_dir, f'prophet_model_{product}.pkl'), product.encode())
+
+        workers = [multiprocessing.Process(target=_publish_many, args=(models_dir, product, 25))
+                   for product in products]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+            assert worker.exitcode == 0
+
+        manifest = load_manifest(models_dir)
+        assert sorted(manifest['products']) == sorted(products)
+        assert manifest['version'] == 50
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Testes do pacote de modelos mapeado em memoria.
+"""
+
+import numpy as np
+import pandas as pd
+from prophet import Prophet
+
+import model_pack
+from cache_metrics import cache_metrics
+from model_export import export_model
+from model_manifest import get_model_version
+from model_pack import ModelPack, build_model_pack, pack_path
+
+
+def _fitted_model(level: float):
+    rng = np.random.default_rng(int(level))
+    ds = pd.date_range('2025-01-01', periods=100, freq='D')
+    df = pd.DataFrame({'ds': ds, 'y': level + 3 * (ds.dayofweek >= 5) + rng.normal(0, 1, 100)})
+    model = Prophet(yearly_seasonality=False, weekly_seasonality=True, daily_seasonality=False)
+    return model.fit(df)
+
+
+def _forecast(model):
+    np.random.seed(0)
+    return model.predict(pd.DataFrame({'ds': pd.date_range('2025-05-01', periods=7, freq='D')}))['yhat'].values
+
+
+def test_pack_serves_shared_read_only_models(tmp_path):
+    """Os modelos do pacote preveem como os arquivos e apontam para o arquivo mapeado."""
+    models_dir = str(tmp_path)
+    models = {'Croissant': _fitted_model(20), 'Cappuccino': _fitted_model(40)}
+    for name, model in models.items():
+        export_model(model, name, models_dir, keep_full=False, write_pickle=False)
+
+    stats = build_model_pack(models_dir)
+    assert stats['products'] == 2, stats
+
+    pack = ModelPack(pack_path(models_dir), check_interval=0)
+    for name, model in models.items():
+        packed = pack.load(name, expected_version=get_model_version(name, models_dir))
+        np.testing.assert_allclose(_forecast(packed), _forecast(model))
+        # Arrays sao visoes somente leitura do mmap, nao copias privadas
+        assert not packed.params['k'].flags.writeable and not packed.params['k'].flags.owndata
+    assert pack.load('Croissant') is pack.load('Croissant')
+    assert pack.load('Pao Frances') is None
+
+
+def test_stale_entries_and_atomic_swap(tmp_path):
+    """Um modelo republicado nao e servido do pacote antigo ate a reconstrucao, que e detectada."""
+    models_dir = str(tmp_path)
+    export_model(_fitted_model(20), 'Croissant', models_dir, keep_full=False, write_pickle=False)
+    build_model_pack(models_dir)
+    pack = ModelPack(pack_path(models_dir), check_interval=0)
+    old_model = pack.load('Croissant')
+
+    retrained = _fitted_model(60)
+    export_model(retrained, 'Croissant', models_dir, keep_full=False, write_pickle=False)
+    version = get_model_version('Croissant', models_dir)
+    assert pack.load('Croissant', expected_version=version) is None
+
+    build_model_pack(models_dir)
+    np.testing.assert_allclose(_forecast(pack.load('Croissant', expected_version=version)), _forecast(retrained))
+    # O modelo entregue antes da troca continua valido (mapeamento antigo)
+    assert _forecast(old_model).mean() < _forecast(retrained).mean()
+    assert pack.stats['remaps'] == 2
+
+
+def test_load_packed_model_falls_back_without_pack(tmp_path):
+    assert model_pack.load_packed_model('Croissant', str(tmp_path)) is None
+
+
+def test_load_packed_model_records_metrics(tmp_path):
+    """Cargas pelo pacote entram nas metricas do cache (namespace model_pack)."""
+    models_dir = str(tmp_path)
+    export_model(_fitted_model(20), 'Croissant', models_dir, keep_full=False, write_pickle=False)
+    build_model_pack(models_dir)
+    cache_metrics.reset()
+    try:
+        assert model_pack.load_packed_model('Croissant', models_dir) is not None
+        assert model_pack.load_packed_model('Pao Frances', models_dir) is None
+        metrics = cache_metrics.snapshot()['model_pack']
+        assert metrics['hits'] == 1 and metrics['misses'] == 1
+        assert metrics['get_latency_ms']['count'] == 2
+    finally:
+        cache_metrics.reset()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Testes da publicacao atomica de modelos e do observador de recarga.
+"""
+
+import os
+import time
+
+from model_manifest import atomic_write, load_manifest, update_manifest_entry
+from model_watcher import ModelWatcher
+from product_name_utils import get_normalized_filename
+
+
+def _publish(models_dir, name, payload):
+    atomic_write(os.path.join(models_dir, get_normalized_filename(name, 'compact')), payload)
+    update_manifest_entry(models_dir, name, source='test')
+
+
+def test_atomic_write_replaces_without_leftovers(tmp_path):
+    path = str(tmp_path / 'prophet_model_Croissant.mdl')
+    atomic_write(path, b'v1')
+    atomic_write(path, b'v2')
+    assert open(path, 'rb').read() == b'v2'
+    assert os.listdir(tmp_path) == ['prophet_model_Croissant.mdl']
+
+
+def test_watcher_refreshes_only_changed_products(tmp_path):
+    """Apenas o produto republicado e recarregado, uma unica vez."""
+    models_dir = str(tmp_path)
+    _publish(models_dir, 'Croissant', b'croissant-v1')
+    _publish(models_dir, 'Cappuccino', b'cappuccino-v1')
+
+    calls = []
+    watcher = ModelWatcher(models_dir, on_change=lambda products, _: calls.append(products) or {'warmed_products': 1})
+    assert watcher.poll()['products'] == []
+
+    version = load_manifest(models_dir)['version']
+    _publish(models_dir, 'Croissant', b'croissant-v2')
+    assert load_manifest(models_dir)['version'] == version + 1
+    change = watcher.poll()
+    assert change['products'] == ['Croissant'] and change['warmed_products'] == 1
+    assert watcher.poll()['products'] == []
+
+    _publish(models_dir, 'Pao Frances', b'pao-v1')
+    assert watcher.refresh_changed(['Pao Frances'], models_dir)['products'] == ['Pao_Frances']
+    assert calls == [['Croissant'], ['Pao_Frances']]
+
+
+def test_failed_refresh_is_retried_on_next_poll(tmp_path):
+    """Se a recarga falha, as versoes nao sao registradas e o produto volta na proxima verificacao."""
+    models_dir = str(tmp_path)
+    _publish(models_dir, 'Croissant', b'v1')
+    calls = []
+
+    def on_change(products, _):
+        calls.append(products)
+        if len(calls) == 1:
+            raise RuntimeError('cache indisponivel')
+        return {'warmed_products': 1}
+
+    watcher = ModelWatcher(models_dir, on_change=on_change)
+    _publish(models_dir, 'Croissant', b'v2')
+    assert watcher.poll() == {'products': ['Croissant'], 'error': 'cache indisponivel'}
+    assert watcher.get_status()['refreshes'] == 0
+    assert watcher.changed_products() == ['Croissant']
+
+    assert watcher.poll()['warmed_products'] == 1
+    assert watcher.poll()['products'] == []
+    assert calls == [['Croissant'], ['Croissant']] and watcher.get_status()['refreshes'] == 1
+
+
+def test_background_thread_detects_new_models(tmp_path):
+    models_dir = str(tmp_path)
+    _publish(models_dir, 'Croissant', b'v1')
+    calls = []
+    watcher = ModelWatcher(models_dir, interval=0.05, on_change=lambda products, _: calls.append(products))
+    assert watcher.start()
+    try:
+        _publish(models_dir, 'Croissant', b'v2')
+        deadline = time.time() + 5
+        while not calls and time.time() < deadline:
+            time.sleep(0.05)
+    finally:
+        watcher.stop(timeout=2)
+    assert calls == [['Croissant']]
+    assert watcher.get_status()['refreshes'] == 1 and not watcher.get_status()['running']
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Testes da transferencia de hiperparametros entre produtos parecidos.
+"""
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import ParameterGrid
+
+import model_trainer
+from model_trainer import PARAM_GRID, train_product_model
+from product_clustering import series_profile, cluster_products, neighbor_grid, resolve_transfer_mode
+
+
+def _series(mean, days=120, seed=0, intermittent=False):
+    rng = np.random.default_rng(seed)
+    ds = pd.date_range('2025-01-01', periods=days, freq='D')
+    if intermittent:
+        y = rng.poisson(0.5, days) * (1 + (ds.dayofweek >= 5))
+    else:
+        y = mean + 0.2 * mean * np.sin(2 * np.pi * ds.dayofweek / 7) + rng.poisson(2, days)
+    return pd.DataFrame({'ds': ds, 'y': np.round(y)})
+
+
+def test_similar_products_share_cluster():
+    """Paes de escala parecida ficam juntos; o item intermitente fica em outro grupo."""
+    profiles = {
+        'Pao Frances': series_profile(_series(40, seed=1)),
+        'Pao Integral': series_profile(_series(45, seed=2)),
+        'Torta de Morango': series_profile(_series(0, seed=3, intermittent=True)),
+    }
+    assert profiles['Torta de Morango']['zero_share'] > 0.3
+
+    clusters = cluster_products(profiles)
+    assert len(clusters) == 2
+    paes = next(c for c in clusters if 'Pao Frances' in [c['representative']] + c['members'])
+    assert sorted([paes['representative']] + paes['members']) == ['Pao Frances', 'Pao Integral']
+    assert clusters == cluster_products(dict(reversed(list(profiles.items()))))
+
+
+def test_neighbor_grid_steps_one_parameter():
+    """Refinamento: parametros vencedores e vizinhos a um passo em cada eixo."""
+    best = {'changepoint_prior_scale': 0.01, 'seasonality_prior_scale': 0.1,
+            'holidays_prior_scale': 1.0, 'changepoint_range': 0.95}
+    candidates = list(ParameterGrid(neighbor_grid(best, PARAM_GRID)))
+    assert candidates[0] == best
+    assert len(candidates) == 1 + 2 + 1 + 2 + 1
+    for candidate in candidates[1:]:
+        assert sum(candidate[k] != best[k] for k in best) == 1
+    assert resolve_transfer_mode('REUSE') == 'reuse'
+
+
+def test_reuse_skips_search(tmp_path, monkeypatch):
+    """Membro em modo 'reuse' treina com os parametros do representante, sem busca."""
+    def no_search(*args, **kwargs):
+        raise AssertionError('a busca nao deveria rodar')
+
+    monkeypatch.setattr(model_trainer, 'search_hyperparameters', no_search)
+    winner = {'changepoint_prior_scale': 0.1, 'seasonality_prior_scale': 1.0,
+              'holidays_prior_scale': 1.0, 'changepoint_range': 0.9}
+    result = train_product_model('Pao Integral', {
+        'data': _series(45, days=90),
+        'models_dir': str(tmp_path),
+        'seasonalities': {'yearly': False, 'weekly': True, 'daily': False},
+        'holidays': None,
+        'cv_parallel': None,
+        'param_grid': PARAM_GRID,
+        'transfer': {'mode': 'reuse', 'from': 'Pao Frances', 'cluster': 0, 'parameters': winner}
+    })
+    assert result['parameters'] == winner
+    assert result['search']['strategy'] == 'transfer' and result['search']['fits'] == 0
+    assert result['search']['transfer_from'] == 'Pao Frances'
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Testes do particionamento do dataset de vendas por produto.
+"""
+
+import pandas as pd
+
+from sales_partition import ProductPartition
+from training_pool import run_product_jobs
+
+
+def _sales():
+    return pd.DataFrame({
+        'ds': pd.date_range('2025-01-01', periods=7),
+        'item_name': ['Croissant', 'Cappuccino', 'Croissant', None, 'Suco Natural', 'Cappuccino', 'Croissant'],
+        'y': [1, 2, 3, 4, 5, 6, 7]
+    })
+
+
+def test_partition_matches_mask_selection():
+    """Cada fatia equivale a df[df.item_name == produto], com indice e ordem originais."""
+    df = _sales()
+    partition = ProductPartition(df, columns=['ds', 'y'])
+
+    assert partition.products == ['Cappuccino', 'Croissant', 'Suco Natural']
+    for product_name in partition.products:
+        expected = df[df['item_name'] == product_name][['ds', 'y']]
+        pd.testing.assert_frame_equal(partition.get(product_name), expected)
+    assert partition.get('Inexistente').empty
+    assert len(partition.slice_for('Croissant')) == 3
+
+
+def _rows_job(product_name, payload):
+    data = payload['data']
+    return {'rows': len(data), 'total': int(data['y'].sum()), 'index': [int(i) for i in data.index]}
+
+
+def test_partition_slices_resolved_in_workers():
+    """Os jobs recebem apenas offsets; a fatia e resolvida no worker."""
+    partition = ProductPartition(_sales(), columns=['ds', 'y'])
+    jobs = [(name, {'data': partition.slice_for(name)}) for name in partition.products]
+
+    for workers in (1, 2):
+        results = run_product_jobs(_rows_job, jobs, workers=workers, partition=partition)
+        by_product = {r['product_name']: r for r in results}
+        assert by_product['Croissant']['total'] == 11
+        assert by_product['Croissant']['index'] == [0, 2, 6]
+        assert by_product['Suco Natural']['rows'] == 1
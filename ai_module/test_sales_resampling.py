@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Testes da pre-agregacao das vendas antes do ajuste.
+"""
+
+import pandas as pd
+
+from sales_resampling import resample_sales, resolve_resolution, is_intraday
+
+
+def _sales():
+    return pd.DataFrame({
+        'ds': ['2025-09-30 08:00', '2025-09-30 16:00', '2025-10-03 12:00', '2025-09-30 12:00'],
+        'item_name': ['Croissant', 'Croissant', 'Croissant', 'Cappuccino'],
+        'y': [10, 8, 5, 6]
+    })
+
+
+def test_daily_buckets_with_gap_filling():
+    """Registros intradiarios viram totais diarios; dias sem venda entram com zero."""
+    daily = resample_sales(_sales(), 'D')
+    croissant = daily[daily['item_name'] == 'Croissant']
+    assert list(croissant['y']) == [18, 0, 0, 5]
+    assert list(daily[daily['item_name'] == 'Cappuccino']['y']) == [6]
+
+    sparse = resample_sales(_sales(), 'D', fill_gaps=False)
+    assert list(sparse[sparse['item_name'] == 'Croissant']['y']) == [18, 5]
+
+
+def test_resolution_options():
+    """'raw' mantem os registros originais; resolucoes horarias sao intradiarias."""
+    assert resolve_resolution('raw') is None
+    assert resample_sales(_sales(), None) is not None and len(resample_sales(_sales(), None)) == 4
+    assert is_intraday(None) and is_intraday('h')
+    assert not is_intraday('D') and not is_intraday('W')
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Testes do governador de recursos do treino.
+"""
+
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import pytest
+
+import training_governor
+from training_governor import TrainingGovernor, training_environment
+
+
+def _state(pid):
+    try:
+        with open(f'/proc/{pid}/stat', 'r') as f:
+            return f.read().rsplit(')', 1)[1].split()[0]
+    except FileNotFoundError:
+        return None
+
+
+def _stopped(pid, expected, timeout=5.0):
+    """Aguarda o estado do processo (sinais sao entregues de forma assincrona)."""
+    deadline = time.time() + timeout
+    while True:
+        with open(f'/proc/{pid}/stat', 'r') as f:
+            stopped = f.read().rsplit(')', 1)[1].split()[0] == 'T'
+        if stopped == expected or time.time() > deadline:
+            return stopped
+        time.sleep(0.01)
+
+
+def test_environment_caps_workers_threads_and_memory():
+    env = training_environment({'AI_TRAINING_WORKERS': '64'}, share=0.5, memory_mb=3000)
+    cpus = [int(cpu) for cpu in env['AI_TRAINING_CPUS'].split(',')]
+    assert int(env['AI_TRAINING_WORKERS']) == len(cpus) <= max(1, (os.cpu_count() or 1) // 2), env
+    assert env['OMP_NUM_THREADS'] == env['OPENBLAS_NUM_THREADS'] == str(training_governor.TRAINING_THREADS)
+    per_process = 3000 / (len(cpus) + 1)
+    assert float(env['AI_TRAINING_PROCESS_MEMORY_MB']) == float(env['AI_TRAINING_MAX_MEMORY_MB']) == per_process
+
+    # Limites menores ja configurados sao mantidos
+    env = training_environment({'AI_TRAINING_WORKERS': '1', 'AI_TRAINING_MAX_MEMORY_MB': '10'}, memory_mb=3000)
+    assert env['AI_TRAINING_WORKERS'] == '1' and env['AI_TRAINING_MAX_MEMORY_MB'] == '10.0'
+
+
+def test_limits_are_applied_by_the_training_process():
+    env = training_environment(share=0.5)
+    env['AI_TRAINING_NICE'] = '7'
+    script = "import os, training_governor; training_governor.apply_training_limits(); print(os.nice(0))"
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, env=env,
+                            cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout
+    assert output.split()[-1] == str(max(7, os.nice(0)))
+
+
+def test_pauses_training_while_slo_is_breached():
+    now = [1000.0]
+    latencies = [[]]
+    process = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'],
+                               **TrainingGovernor.popen_kwargs())
+    governor = TrainingGovernor(slo_ms=100, min_samples=5, min_pause_s=2, max_pause_s=10, min_run_s=1,
+                                latency_source=lambda since: latencies[0], clock=lambda: now[0]).attach(process)
+    try:
+        now[0] += 1
+        latencies[0] = [0.05] * 20
+        assert not governor.tick()['paused']
+
+        # p99 acima do SLO: o grupo de processos do treino e suspenso
+        latencies[0] = [0.05] * 18 + [0.4] * 2
+        stats = governor.tick()
+        assert stats['paused'] and stats['serving_p99_ms'] == 400 and _stopped(process.pid, True), stats
+
+        # Retoma apos a pausa minima quando as predicoes voltam ao SLO
+        now[0] += 1
+        latencies[0] = [0.05] * 20
+        assert governor.tick()['paused']
+        now[0] += 1
+        assert not governor.tick()['paused'] and not _stopped(process.pid, False)
+
+        # Violacao continua: pausa no maximo max_pause_s e volta a rodar (treino desacelerado)
+        now[0] += 1
+        latencies[0] = [0.4] * 20
+        assert governor.tick()['paused']
+        now[0] += 10
+        stats = governor.tick()
+        assert not stats['paused'] and stats['forced_resumes'] == 1 and stats['pauses'] == 2
+        assert stats['paused_s'] == 12.0
+
+        governor.tick()
+        governor.release()
+        assert not governor.paused and not _stopped(process.pid, False)
+    finally:
+        process.kill()
+        process.wait()
+
+
+def test_latencies_come_from_a_sliding_window():
+    now = [1000.0]
+    windows = []
+    governor = TrainingGovernor(window_s=60, min_run_s=1, clock=lambda: now[0],
+                                latency_source=lambda since: windows.append(since.timestamp()) or [])
+    governor.attach(subprocess.Popen([sys.executable, '-c', 'pass']))
+    governor.process.wait()
+    now[0] += 10
+    governor.tick()
+    now[0] += 290
+    governor.tick()
+    # Logo apos a mudanca de estado a janela comeca nela; depois, nos ultimos 60 s
+    assert windows == [1000.0, 1240.0]
+
+
+def test_terminate_resumes_and_stops_paused_training():
+    process = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'],
+                               **TrainingGovernor.popen_kwargs())
+    governor = TrainingGovernor(min_samples=1, min_run_s=0, slo_ms=1,
+                                latency_source=lambda since: [1.0]).attach(process)
+    try:
+        assert governor.tick()['paused'] and _stopped(process.pid, True)
+        governor.terminate()
+        assert process.wait(timeout=5) == -signal.SIGTERM and not governor.paused
+    finally:
+        process.kill()
+        process.wait()
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason='PR_SET_PDEATHSIG apenas no Linux')
+def test_paused_training_dies_with_its_parent():
+    """Se o servico morre com o treino pausado, o subprocesso nao fica parado para sempre."""
+    script = (
+        "import os, signal, subprocess, sys\n"
+        "from training_governor import TrainingGovernor\n"
+        "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'],\n"
+        "                         stdout=subprocess.DEVNULL, **TrainingGovernor.popen_kwargs())\n"
+        "os.killpg(child.pid, signal.SIGSTOP)\n"
+        "print(child.pid, flush=True)\n"
+        "os._exit(0)\n"
+    )
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout
+    pid = int(output)
+    deadline = time.time() + 5
+    while _state(pid) not in (None, 'Z', 'X') and time.time() < deadline:
+        time.sleep(0.02)
+    assert _state(pid) in (None, 'Z', 'X')
+
+
+def test_predict_endpoint_records_serving_latency():
+    """/api/ai/predict passa pelo performance_monitor, fonte das latencias do governador."""
+    from ai_service import app
+    from monitoring_system import metrics
+
+    assert app.view_functions[next(rule.endpoint for rule in app.url_map.iter_rules()
+                                   if rule.rule == '/api/ai/predict')].__name__ == 'predict_demand'
+    before = len(metrics.recent_durations(['/api/ai/predict']))
+    app.test_client().post('/api/ai/predict', json={'product_name': 'Produto Inexistente', 'days_ahead': 3})
+    assert len(metrics.recent_durations(['/api/ai/predict'])) == before + 1
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Testes da fila de jobs de retreinamento.
+"""
+
+import threading
+
+import pandas as pd
+
+from training_jobs import TrainingJobQueue
+
+
+def _rows(product, n=2):
+    return pd.DataFrame({'ds': pd.date_range('2025-01-01', periods=n), 'item_name': product, 'y': [1] * n})
+
+
+def test_queue_coalesces_and_limits_concurrency():
+    """Pedidos durante um job em espera sao agrupados; apenas um job roda por vez."""
+    release = threading.Event()
+    started = threading.Event()
+    seen = []
+    refreshed = []
+
+    def runner(job, new_data_path, on_progress):
+        started.set()
+        release.wait(10)
+        data = pd.read_csv(new_data_path)
+        seen.append(sorted(data['item_name'].unique()))
+        on_progress({'planned': ['Croissant'], 'skipped': [],
+                     'products': {'Croissant': {'status': 'success', 'duration_s': 0.1}}})
+        return {'succeeded': 1, 'products': [{'product_name': 'Croissant', 'status': 'success'}]}
+
+    queue = TrainingJobQueue(data_file='unused.csv', models_dir='unused', max_concurrent=1, runner=runner,
+                             on_models_updated=lambda products, models_dir: refreshed.append(products) or {})
+
+    first, coalesced = queue.submit(_rows('Croissant'))
+    assert not coalesced
+    assert started.wait(10)
+
+    second, coalesced = queue.submit(_rows('Cappuccino'))
+    third, coalesced_third = queue.submit(_rows('Suco Natural'))
+    assert not coalesced and coalesced_third and third['id'] == second['id']
+    assert queue.get_stats() == {'queued': 1, 'running': 1, 'max_concurrent': 1}
+
+    release.set()
+    assert queue.wait_idle(10)
+
+    assert seen == [['Croissant'], ['Cappuccino', 'Suco Natural']]
+    job = queue.get_job(second['id'])
+    assert job['status'] == 'completed' and job['requests'] == 2
+    assert job['progress']['completed'] == 1 and job['progress']['total'] == 1
+    assert refreshed == [['Croissant'], ['Croissant']]
+
+
+def test_failed_job_is_reported():
+    """Falhas do retreino ficam registradas no job."""
+    def runner(job, new_data_path, on_progress):
+        raise RuntimeError('model_retrainer terminou com codigo 1')
+
+    queue = TrainingJobQueue(max_concurrent=1, runner=runner, on_models_updated=None)
+    job, _ = queue.submit(_rows('Croissant'))
+    assert queue.wait_idle(10)
+    job = queue.get_job(job['id'])
+    assert job['status'] == 'failed' and 'codigo 1' in job['error']
+    assert job['finished_at'] is not None
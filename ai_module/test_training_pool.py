@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Testes do pool de treinamento paralelo por produto.
+"""
+
+import numpy as np
+
+from training_pool import run_product_jobs, build_training_report, resolve_workers
+
+
+def _fake_job(product_name, payload):
+    if payload.get('fail'):
+        raise ValueError(f"dados invalidos para {product_name}")
+    return {'sample': float(np.random.rand()), 'rows': payload['rows']}
+
+
+def test_parallel_jobs_report_failures():
+    """Falhas ficam isoladas no produto; os resultados saem em ordem fixa."""
+    jobs = [
+        ('Suco Natural', {'rows': 3}),
+        ('Croissant', {'rows': 5}),
+        ('Cappuccino', {'fail': True}),
+    ]
+    results = run_product_jobs(_fake_job, jobs, workers=2)
+
+    assert [r['product_name'] for r in results] == ['Cappuccino', 'Croissant', 'Suco Natural']
+    assert results[0]['status'] == 'failed' and 'ValueError' in results[0]['error']
+    assert results[1]['status'] == 'success' and results[1]['rows'] == 5
+
+    report = build_training_report(results, 'test', 2, 1.0)
+    assert report['succeeded'] == 2 and report['failed_products'] == ['Cappuccino']
+    assert all('traceback' not in r for r in report['products'])
+
+
+def test_parallel_jobs_are_deterministic():
+    """A semente por produto nao depende do worker nem do modo de execucao."""
+    jobs = [('Croissant', {'rows': 1}), ('Cappuccino', {'rows': 1})]
+    sequential = run_product_jobs(_fake_job, jobs, workers=1)
+    parallel = run_product_jobs(_fake_job, jobs, workers=2)
+    assert [r['sample'] for r in sequential] == [r['sample'] for r in parallel]
+    assert resolve_workers(8, n_jobs=3) == 3
+
+
+def _square(x):
+    return x * x
+
+
+def test_shared_pool_is_reused():
+    """O pool de CV e criado uma vez e reaproveitado ate o shutdown."""
+    from training_pool import get_shared_pool, shutdown_shared_pool, resolve_parallel_mode
+
+    try:
+        pool = get_shared_pool(2)
+        assert get_shared_pool(2) is pool
+        assert list(pool.map(_square, [1, 2, 3])) == [1, 4, 9]
+    finally:
+        shutdown_shared_pool()
+    assert get_shared_pool(1) is not pool
+    shutdown_shared_pool()
+
+    assert resolve_parallel_mode('auto', n_jobs=2, workers=8) == 'folds'
+    assert resolve_parallel_mode('auto', n_jobs=10, workers=8) == 'products'
+    assert resolve_parallel_mode('folds', n_jobs=10, workers=1) == 'products'
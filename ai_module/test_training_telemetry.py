@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Testes da telemetria de treino por produto.
+"""
+
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from model_retrainer import retrain_prophet_models
+from training_pool import load_training_report
+from training_telemetry import TrainingTelemetry, load_telemetry, summarize_telemetry
+
+
+def test_stage_timings_and_summary():
+    """Etapas acumulam tempo; o resumo ordena os produtos pelo custo."""
+    telemetry = TrainingTelemetry('Croissant')
+    with telemetry.stage('fit'):
+        time.sleep(0.05)
+    with telemetry.stage('fit'):
+        sum(i * i for i in range(200000))
+    telemetry.record(stan_iterations=42, search_fits=None)
+    stats = telemetry.finish()
+
+    assert stats['stages']['fit']['wall_s'] >= 0.05
+    assert stats['stages']['fit']['cpu_s'] > 0
+    assert stats['stan_iterations'] == 42 and 'search_fits' not in stats
+    assert stats['peak_rss_mb'] is None or stats['peak_rss_mb'] > 0
+
+    cheap = dict(stats, product_name='Cappuccino', wall_time_s=0.001)
+    summary = summarize_telemetry([{'telemetry': cheap}, {'telemetry': stats}, {'status': 'skipped'}])
+    assert summary['products'] == 2
+    assert summary['stan_iterations'] == 84
+    assert [p['product_name'] for p in summary['costliest_products']] == ['Croissant', 'Cappuccino']
+
+
+def test_retrain_writes_telemetry():
+    """O retreino grava a telemetria ao lado dos parametros e agrega no relatorio."""
+    ds = pd.date_range('2025-01-01', periods=60, freq='D')
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'ds': ds, 'item_name': 'Croissant', 'y': 10 + np.arange(60) % 7 + rng.poisson(2, 60)})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        models_dir = os.path.join(tmp, 'models')
+        data_path = os.path.join(tmp, 'sales.csv')
+        df.to_csv(data_path, index=False)
+        retrain_prophet_models(data_path, models_dir, workers=1)
+
+        telemetry = load_telemetry(models_dir, 'Croissant')
+        assert os.path.exists(os.path.join(models_dir, 'prophet_telemetry_Croissant.json'))
+        assert set(telemetry['stages']) == {'load_previous', 'fit', 'save'}
+        assert telemetry['stan_iterations'] > 0
+
+        report = load_training_report(models_dir)
+        assert report['telemetry']['products'] == 1
+        assert report['telemetry']['costliest_products'][0]['product_name'] == 'Croissant'
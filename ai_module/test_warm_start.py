@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Testes do warm start dos ajustes Prophet.
+"""
+
+import numpy as np
+import pandas as pd
+from prophet import Prophet
+
+from warm_start import fit_prophet, summarize_fit_stats
+
+
+def _history(days):
+    rng = np.random.default_rng(0)
+    ds = pd.date_range('2025-01-01', periods=days, freq='D')
+    y = 20 + 5 * np.sin(np.arange(days) * 2 * np.pi / 7) + rng.normal(0, 1, days)
+    return pd.DataFrame({'ds': ds, 'y': y})
+
+
+def test_warm_start_with_compatible_model():
+    """Modelo anterior com a mesma estrutura aquece o ajuste."""
+    df = _history(150)
+    previous, cold = fit_prophet(lambda: Prophet(yearly_seasonality=False), df.head(140))
+    assert cold['mode'] == 'cold' and cold['cold_reason'] == 'sem modelo anterior'
+
+    model, warm = fit_prophet(lambda: Prophet(yearly_seasonality=False), df, previous)
+    assert warm['mode'] == 'warm'
+    assert warm['iterations'] is not None and warm['fit_time_s'] >= 0
+    assert model.history['ds'].max() == df['ds'].max()
+
+    summary = summarize_fit_stats([{'fit': cold}, {'fit': warm}])
+    assert summary['warm']['count'] == 1 and summary['cold']['count'] == 1
+
+
+def test_structure_change_falls_back_to_cold_start():
+    """Mudanca de estrutura (novo regressor) volta para o ajuste a frio."""
+    df = _history(150)
+    previous, _ = fit_prophet(lambda: Prophet(yearly_seasonality=False), df)
+
+    def build_with_regressor():
+        model = Prophet(yearly_seasonality=False)
+        model.add_regressor('promocao')
+        return model
+
+    df['promocao'] = (df.index % 10 == 0).astype(int)
+    _, stats = fit_prophet(build_with_regressor, df, previous)
+    assert stats['mode'] == 'cold' and stats['cold_reason'] == 'estrutura do modelo mudou'
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Governador de recursos do treino executado no mesmo host do servico.
+O retreino (model_retrainer em subprocesso, ver training_jobs) disputa CPU
+e memoria com os workers do Flask; sem limites, os ajustes do Stan e os
+pools de validacao cruzada elevam o p99 de /api/ai/predict. O governador:
+
+    - limita o treino a uma fracao das CPUs (AI_TRAINING_CPU_SHARE): numero
+      de workers/pool e afinidade com as ultimas CPUs do host, deixando as
+      primeiras para o servico
+    - limita as threads de BLAS/OpenMP/Stan por processo (AI_TRAINING_THREADS)
+    - limita a memoria total do treino (AI_TRAINING_MEMORY_MB), dividida
+      entre o processo principal e os workers
+    - reduz a prioridade do treino (AI_TRAINING_NICE)
+    - pausa o grupo de processos do treino (SIGSTOP/SIGCONT) enquanto o p99
+      dos endpoints de predicao nos ultimos AI_SERVING_SLO_WINDOW_S segundos
+      estiver acima do SLO (AI_SERVING_LATENCY_SLO_MS); pausas longas sao
+      interrompidas apos AI_TRAINING_MAX_PAUSE_S, de modo que sob violacao
+      continua o treino apenas desacelera e sempre termina
+
+As latencias vem das metricas do proprio processo (monitoring_system): com
+varios workers do servidor, apenas as requisicoes atendidas pelo worker
+dono da fila de treino sao consideradas.
+
+Um treino pausado nao pode ficar parado se o servico terminar: no Linux o
+subprocesso e seus workers recebem SIGKILL quando o processo pai termina
+(exit_with_parent), e no encerramento normal do servico os treinos ainda
+em andamento sao retomados e terminados (atexit).
+
+Os limites chegam ao subprocesso pelo ambiente (training_environment) e sao
+aplicados por ele mesmo no inicio (apply_training_limits), antes de criar
+pools; execucoes manuais do trainer/retrainer sem essas variaveis seguem
+sem limites.
+"""
+
+import atexit
+import logging
+import os
+import signal
+import sys
+import time
+import weakref
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+GOVERNOR_ENABLED = os.getenv('AI_TRAINING_GOVERNOR', 'true').lower() == 'true'
+# Fracao das CPUs do host disponivel para o treino (ao menos 1 CPU)
+CPU_SHARE = float(os.getenv('AI_TRAINING_CPU_SHARE', 0.5))
+# Threads de BLAS/OpenMP/Stan por processo de treino
+TRAINING_THREADS = int(os.getenv('AI_TRAINING_THREADS', 1))
+# Memoria total do treino em MB (0 = sem limite)
+TRAINING_MEMORY_MB = float(os.getenv('AI_TRAINING_MEMORY_MB', 0))
+TRAINING_NICE = int(os.getenv('AI_TRAINING_NICE', 10))
+
+LATENCY_SLO_MS = float(os.getenv('AI_SERVING_LATENCY_SLO_MS', 500))
+SLO_ENDPOINTS = [e for e in os.getenv('AI_SERVING_SLO_ENDPOINTS',
+                                      '/api/ai/predict,/api/ai/predict-all').split(',') if e]
+SLO_QUANTILE = 0.99
+# Janela deslizante (s) das requisicoes usadas no p99
+SLO_WINDOW_S = float(os.getenv('AI_SERVING_SLO_WINDOW_S', 60))
+# Minimo de requisicoes na janela para considerar o SLO violado
+MIN_SAMPLES = int(os.getenv('AI_SERVING_SLO_MIN_SAMPLES', 10))
+# Retoma quando o p99 volta abaixo de RESUME_RATIO x SLO
+RESUME_RATIO = 0.8
+MIN_PAUSE_S = float(os.getenv('AI_TRAINING_MIN_PAUSE_S', 5))
+MAX_PAUSE_S = float(os.getenv('AI_TRAINING_MAX_PAUSE_S', 30))
+# Tempo minimo rodando entre duas pausas
+MIN_RUN_S = float(os.getenv('AI_TRAINING_MIN_RUN_S', 5))
+
+THREAD_VARIABLES = ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS', 'NUMEXPR_NUM_THREADS',
+                    'VECLIB_MAXIMUM_THREADS', 'STAN_NUM_THREADS')
+# prctl(PR_SET_PDEATHSIG) do Linux
+_PR_SET_PDEATHSIG = 1
+
+
+def _load_prctl():
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        import ctypes
+        return ctypes.CDLL(None, use_errno=True).prctl
+    except (OSError, AttributeError):
+        return None
+
+
+def _die_with_parent(prctl, parent_pid: int):
+    if prctl(_PR_SET_PDEATHSIG, signal.SIGKILL, 0, 0, 0) == 0 and os.getppid() != parent_pid:
+        # O pai terminou antes do prctl
+        os._exit(1)
+
+
+def exit_with_parent() -> bool:
+    """
+    Linux: o processo atual recebe SIGKILL quando o processo pai termina,
+    mesmo pausado por SIGSTOP. Chamado pelos workers do pool de treino
+    (AI_TRAINING_EXIT_WITH_PARENT); nos demais sistemas nao faz nada.
+    """
+    prctl = _load_prctl()
+    if prctl is None:
+        return False
+    _die_with_parent(prctl, os.getppid())
+    return True
+
+
+def _available_cpus() -> List[int]:
+    try:
+        return sorted(os.sched_getaffinity(0))
+    except AttributeError:
+        # Windows/macOS: sem afinidade; apenas o numero de CPUs
+        return list(range(os.cpu_count() or 1))
+
+
+def training_cpus(share: Optional[float] = None) -> List[int]:
+    """CPUs do treino: as ultimas `share` x CPUs disponiveis (ao menos uma)."""
+    cpus = _available_cpus()
+    share = CPU_SHARE if share is None else share
+    count = min(len(cpus), max(1, int(len(cpus) * share)))
+    return cpus[len(cpus) - count:]
+
+
+def training_environment(base_env: Optional[Dict[str, str]] = None, share: Optional[float] = None,
+                         memory_mb: Optional[float] = None) -> Dict[str, str]:
+    """
+    Ambiente do subprocesso de treino: workers limitados as CPUs do treino,
+    threads por processo, CPUs, prioridade e limite de memoria por processo.
+    Valores menores ja configurados (AI_TRAINING_WORKERS,
+    AI_TRAINING_MAX_MEMORY_MB) sao mantidos.
+    """
+    env = dict(os.environ if base_env is None else base_env)
+    if not GOVERNOR_ENABLED:
+        return env
+    cpus = training_cpus(share)
+    workers = int(env.get('AI_TRAINING_WORKERS') or 0)
+    workers = len(cpus) if workers <= 0 else min(workers, len(cpus))
+    env['AI_TRAINING_WORKERS'] = str(workers)
+    for name in THREAD_VARIABLES:
+        env[name] = str(TRAINING_THREADS)
+    env['AI_TRAINING_CPUS'] = ','.join(map(str, cpus))
+    env['AI_TRAINING_NICE'] = str(TRAINING_NICE)
+    env['AI_TRAINING_EXIT_WITH_PARENT'] = 'true'
+
+    memory_mb = TRAINING_MEMORY_MB if memory_mb is None else memory_mb
+    if memory_mb:
+        # Processo principal + workers, cada um com sua parte do total
+        per_process = memory_mb / (workers + 1)
+        configured = float(env.get('AI_TRAINING_MAX_MEMORY_MB') or 0)
+        env['AI_TRAINING_MAX_MEMORY_MB'] = str(min(configured, per_process) if configured else per_process)
+        env['AI_TRAINING_PROCESS_MEMORY_MB'] = str(per_process)
+    return env
+
+
+def apply_training_limits() -> Dict[str, Any]:
+    """
+    Aplica ao processo atual (e aos filhos criados depois) a prioridade, as
+    CPUs e o limite de memoria recebidos de training_environment.
+    """
+    applied = {}
+    nice = os.getenv('AI_TRAINING_NICE')
+    if nice:
+        try:
+            applied['nice'] = os.nice(max(0, int(nice) - os.nice(0)))
+        except (AttributeError, OSError) as e:
+            logger.warning(f"Prioridade do treino nao aplicada: {e}")
+    cpus = os.getenv('AI_TRAINING_CPUS')
+    if cpus:
+        try:
+            os.sched_setaffinity(0, {int(cpu) for cpu in cpus.split(',')})
+            applied['cpus'] = sorted(os.sched_getaffinity(0))
+        except (AttributeError, ValueError, OSError) as e:
+            logger.warning(f"Afinidade de CPU do treino nao aplicada: {e}")
+    memory_mb = float(os.getenv('AI_TRAINING_PROCESS_MEMORY_MB') or 0)
+    if memory_mb:
+        try:
+            import resource
+            limit = int(memory_mb * 1024 * 1024)
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+            applied['memory_mb'] = memory_mb
+        except (ImportError, ValueError, OSError) as e:
+            # Windows nao possui o modulo resource; o treino segue sem limite
+            logger.warning(f"Limite de memoria do treino nao aplicado: {e}")
+    if applied:
+        print(f"Limites do treino: {applied}")
+    return applied
+
+
+def _quantile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _serving_latencies(since: datetime) -> List[float]:
+    from monitoring_system import metrics
+    return metrics.recent_durations(SLO_ENDPOINTS, since)
+
+
+# Governadores com subprocesso em andamento (encerrados no atexit)
+_active_governors: 'weakref.WeakSet[TrainingGovernor]' = weakref.WeakSet()
+
+
+class TrainingGovernor:
+    """
+    Controla um subprocesso de treino em andamento: pausa seu grupo de
+    processos enquanto o p99 das requisicoes de predicao na janela
+    deslizante (limitada a ultima mudanca de estado) estiver acima do SLO.
+    Chamado periodicamente (tick) pelo laco que acompanha o subprocesso.
+    """
+
+    def __init__(self, slo_ms: Optional[float] = None, min_samples: int = MIN_SAMPLES,
+                 min_pause_s: float = MIN_PAUSE_S, max_pause_s: float = MAX_PAUSE_S,
+                 min_run_s: float = MIN_RUN_S, window_s: float = SLO_WINDOW_S,
+                 latency_source: Callable[[datetime], List[float]] = _serving_latencies,
+                 clock: Callable[[], float] = time.time):
+        self.slo_ms = LATENCY_SLO_MS if slo_ms is None else slo_ms
+        self.min_samples = min_samples
+        self.min_pause_s = min_pause_s
+        self.max_pause_s = max_pause_s
+        self.min_run_s = min_run_s
+        self.window_s = window_s
+        self.latency_source = latency_source
+        self.clock = clock
+        self.process = None
+        self.paused = False
+        self.pauses = 0
+        self.forced_resumes = 0
+        self.paused_s = 0.0
+        self.last_p99_ms = None
+        self._since = clock()
+
+    @staticmethod
+    def popen_kwargs() -> Dict[str, Any]:
+        """
+        Argumentos do Popen: ambiente limitado, sessao propria (para sinalizar
+        o grupo inteiro) e, no Linux, termino do subprocesso junto com o pai.
+        O sinal vem quando a thread que chamou o Popen termina: ela deve
+        acompanhar o subprocesso ate o fim (como run_retrainer_subprocess).
+        """
+        kwargs = {'env': training_environment()}
+        if GOVERNOR_ENABLED and os.name != 'nt':
+            kwargs['start_new_session'] = True
+            prctl = _load_prctl()
+            if prctl is not None:
+                kwargs['preexec_fn'] = lambda parent_pid=os.getpid(): _die_with_parent(prctl, parent_pid)
+        return kwargs
+
+    def attach(self, process) -> 'TrainingGovernor':
+        self.process = process
+        self._since = self.clock()
+        _active_governors.add(self)
+        return self
+
+    def _signal(self, sig) -> bool:
+        if self.process is None or self.process.poll() is not None:
+            return False
+        try:
+            os.killpg(os.getpgid(self.process.pid), sig)
+            return True
+        except (AttributeError, ProcessLookupError, PermissionError) as e:
+            logger.warning(f"Nao foi possivel sinalizar o treino: {e}")
+            return False
+
+    def _set_paused(self, paused: bool, now: float, reason: str):
+        if not hasattr(signal, 'SIGSTOP') or not self._signal(signal.SIGSTOP if paused else signal.SIGCONT):
+            return
+        if paused:
+            self.pauses += 1
+        else:
+            self.paused_s += now - self._since
+        self.paused = paused
+        self._since = now
+        logger.info(f"Treino {'pausado' if paused else 'retomado'}: {reason}")
+
+    def tick(self) -> Dict[str, Any]:
+        """Avalia o SLO com as requisicoes desde a ultima mudanca de estado e pausa/retoma o treino."""
+        if not GOVERNOR_ENABLED or self.process is None:
+            return self.stats()
+        now = self.clock()
+        elapsed = now - self._since
+        latencies = self.latency_source(datetime.fromtimestamp(max(self._since, now - self.window_s)))
+        p99 = _quantile(latencies, SLO_QUANTILE)
+        self.last_p99_ms = round(p99 * 1000, 2) if p99 is not None else None
+
+        if not self.paused:
+            if elapsed >= self.min_run_s and len(latencies) >= self.min_samples and p99 * 1000 > self.slo_ms:
+                self._set_paused(True, now, f"p99 {self.last_p99_ms} ms acima do SLO de {self.slo_ms:g} ms")
+        elif elapsed >= self.max_pause_s:
+            # Sob violacao continua o treino avanca em ciclos (desacelera em vez de parar)
+            self.forced_resumes += 1
+            self._set_paused(False, now, f"pausa maxima de {self.max_pause_s:g}s")
+        elif elapsed >= self.min_pause_s and (p99 is None or p99 * 1000 <= self.slo_ms * RESUME_RATIO):
+            self._set_paused(False, now, f"p99 {self.last_p99_ms} ms dentro do SLO")
+        return self.stats()
+
+    def release(self):
+        """Retoma o treino se estiver pausado (fim do acompanhamento ou erro)."""
+        _active_governors.discard(self)
+        if self.paused:
+            self._set_paused(False, self.clock(), 'fim do acompanhamento')
+
+    def terminate(self):
+        """Retoma e termina o grupo de processos do treino (encerramento do servico)."""
+        self.release()
+        if hasattr(signal, 'SIGTERM') and self._signal(signal.SIGTERM):
+            logger.info('Treino terminado no encerramento do servico')
+
+    def stats(self) -> Dict[str, Any]:
+        paused_s = self.paused_s + (self.clock() - self._since if self.paused else 0.0)
+        return {
+            'paused': self.paused,
+            'pauses': self.pauses,
+            'forced_resumes': self.forced_resumes,
+            'paused_s': round(paused_s, 1),
+            'serving_p99_ms': self.last_p99_ms,
+            'slo_ms': self.slo_ms
+        }
+
+
+@atexit.register
+def _terminate_active():
+    for governor in list(_active_governors):
+        governor.terminate()
+
+
+def governor_config() -> Dict[str, Any]:
+    """Configuracao efetiva do governador (exposta nas estatisticas da fila de treino)."""
+    cpus = training_cpus()
+    return {
+        'enabled': GOVERNOR_ENABLED,
+        'training_cpus': cpus,
+        'host_cpus': len(_available_cpus()),
+        'threads_per_process': TRAINING_THREADS,
+        'memory_mb': TRAINING_MEMORY_MB or None,
+        'nice': TRAINING_NICE,
+        'slo_ms': LATENCY_SLO_MS,
+        'slo_endpoints': SLO_ENDPOINTS,
+        'slo_window_s': SLO_WINDOW_S,
+        'max_pause_s': MAX_PAUSE_S
+    }
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fila de jobs de retreinamento do servico.
+Pedidos de retreino que chegam enquanto um job ainda aguarda na fila sao
+agrupados nele; no maximo AI_TRAINING_MAX_CONCURRENT jobs rodam ao mesmo
+tempo. Cada job executa o model_retrainer em um subprocesso, com CPU,
+threads, memoria e prioridade limitados e pausado quando o p99 das
+predicoes viola o SLO (training_governor), acompanha o progresso por
+produto e, ao terminar, invalida o cache dos modelos novos e
+re-materializa suas predicoes.
+"""
+
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from model_manifest import MODELS_DIR, DATA_FILE
+from training_governor import TrainingGovernor
+
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+RETRAINER_SCRIPT = os.path.join(SCRIPT_DIR, 'model_retrainer.py')
+STATUS_POLL_INTERVAL = 1.0
+
+
+def run_retrainer_subprocess(job: Dict[str, Any], new_data_path: str,
+                             on_progress: Callable[[Dict[str, Any]], None]) -> Optional[Dict[str, Any]]:
+    """
+    Executa o model_retrainer em um subprocesso, repassando o arquivo de
+    status. O governador de recursos acompanha o subprocesso a cada leitura
+    do status; suas estatisticas ficam em job['governor'].
+    """
+    status_path = os.path.join(job['work_dir'], 'status.json')
+    governor = TrainingGovernor()
+    process = subprocess.Popen(
+        [sys.executable, RETRAINER_SCRIPT, job['data_file'], job['models_dir'], new_data_path,
+         '--status-file', status_path],
+        close_fds=os.name != 'nt',
+        **governor.popen_kwargs()
+    )
+    governor.attach(process)
+
+    status = {}
+    try:
+        while True:
+            finished = process.poll() is not None
+            try:
+                with open(status_path, 'r', encoding='utf-8') as f:
+                    status = json.load(f)
+                on_progress(status)
+            except (OSError, ValueError):
+                pass
+            if finished:
+                break
+            job['governor'] = governor.tick()
+            time.sleep(STATUS_POLL_INTERVAL)
+    finally:
+        governor.release()
+        job['governor'] = governor.stats()
+
+    if process.returncode != 0 or status.get('status') == 'failed':
+        raise RuntimeError(status.get('error') or f"model_retrainer terminou com codigo {process.returncode}")
+    return status.get('report')
+
+
+def refresh_product_caches(products: List[str], models_dir: str = MODELS_DIR) -> Dict[str, Any]:
+    """Invalida o cache dos produtos retreinados e re-materializa suas predicoes."""
+    from redis_cache import ModelCache
+    from cache_warmup import run_warm_up
+
+    invalidated = sum(ModelCache.invalidate_model(product) for product in products)
+    warm_up = run_warm_up(models_dir=models_dir, products=products) if products else {}
+    return {
+        'invalidated_keys': invalidated,
+        'warmed_products': warm_up.get('completed', 0),
+        'warm_up_status': warm_up.get('status')
+    }
+
+
+class TrainingJobQueue:
+    """Fila de jobs de retreino com agrupamento de pedidos e limite de concorrencia."""
+
+    def __init__(self, data_file: str = DATA_FILE, models_dir: str = MODELS_DIR,
+                 max_concurrent: Optional[int] = None, history_size: int = 20,
+                 runner: Callable = run_retrainer_subprocess,
+                 on_models_updated: Optional[Callable[[List[str], str], Dict[str, Any]]] = refresh_product_caches):
+        self.data_file = data_file
+        self.models_dir = models_dir
+        self.max_concurrent = max(1, int(max_concurrent or os.getenv('AI_TRAINING_MAX_CONCURRENT', 1)))
+        self.history_size = history_size
+        self.runner = runner
+        self.on_models_updated = on_models_updated
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._pending_data: Dict[str, List[pd.DataFrame]] = {}
+        self._queue = deque()
+        self._running = 0
+        self._condition = threading.Condition()
+        self._workers: List[threading.Thread] = []
+
+    def submit(self, new_data: pd.DataFrame) -> Tuple[Dict[str, Any], bool]:
+        """
+        Enfileira um retreino com `new_data`. Se ja houver um job aguardando,
+        os dados sao agrupados nele. Retorna (job, agrupado).
+        """
+        with self._condition:
+            self._ensure_workers()
+            for job_id in self._queue:
+                job = self._jobs[job_id]
+                self._pending_data[job_id].append(new_data)
+                job['requests'] += 1
+                job['rows'] += len(new_data)
+                return self._snapshot(job), True
+
+            job_id = uuid.uuid4().hex[:12]
+            job = {
+                'id': job_id,
+                'status': 'queued',
+                'created_at': datetime.now().isoformat(),
+                'started_at': None,
+                'finished_at': None,
+                'requests': 1,
+                'rows': len(new_data),
+                'progress': {'total': None, 'completed': 0, 'failed': 0, 'skipped': 0, 'products': {}},
+                'report': None,
+                'cache': None,
+                'governor': None,
+                'error': None
+            }
+            self._jobs[job_id] = job
+            self._pending_data[job_id] = [new_data]
+            self._queue.append(job_id)
+            self._trim_history()
+            self._condition.notify()
+            return self._snapshot(job), False
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._condition:
+            job = self._jobs.get(job_id)
+            return self._snapshot(job) if job else None
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        with self._condition:
+            jobs = sorted(self._jobs.values(), key=lambda j: j['created_at'], reverse=True)
+            return [self._snapshot(job) for job in jobs]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                'queued': len(self._queue),
+                'running': self._running,
+                'max_concurrent': self.max_concurrent
+            }
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Aguarda ate nao haver jobs na fila nem em execucao."""
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._queue and not self._running, timeout=timeout)
+
+    def _snapshot(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        snapshot = json.loads(json.dumps(
+            {k: v for k, v in job.items() if k not in ('work_dir', 'data_file', 'models_dir')}, default=str
+        ))
+        if job['started_at'] and job['status'] == 'running':
+            snapshot['elapsed_s'] = round(time.time() - datetime.fromisoformat(job['started_at']).timestamp(), 1)
+        return snapshot
+
+    def _trim_history(self):
+        finished = [j for j in self._jobs.values() if j['status'] in ('completed', 'failed')]
+        finished.sort(key=lambda j: j['created_at'])
+        for job in finished[:max(0, len(self._jobs) - self.history_size)]:
+            self._jobs.pop(job['id'], None)
+
+    def _ensure_workers(self):
+        while len(self._workers) < self.max_concurrent:
+            worker = threading.Thread(target=self._worker_loop, name=f'training-job-{len(self._workers)}', daemon=True)
+            self._workers.append(worker)
+            worker.start()
+
+    def _worker_loop(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._queue)
+                job_id = self._queue.popleft()
+                job = self._jobs[job_id]
+                frames = self._pending_data.pop(job_id)
+                job['status'] = 'running'
+                job['started_at'] = datetime.now().isoformat()
+                self._running += 1
+            try:
+                self._run_job(job, frames)
+            finally:
+                with self._condition:
+                    self._running -= 1
+                    self._condition.notify_all()
+
+    def _update_progress(self, job: Dict[str, Any], status: Dict[str, Any]):
+        products = status.get('products', {})
+        with self._condition:
+            progress = job['progress']
+            if status.get('planned') is not None:
+                progress['total'] = len(status['planned'])
+            progress['skipped'] = len(status.get('skipped', []))
+            progress['completed'] = sum(1 for r in products.values() if r.get('status') == 'success')
+            progress['failed'] = sum(1 for r in products.values() if r.get('status') == 'failed')
+            progress['products'] = {
+                name: {k: r.get(k) for k in ('status', 'duration_s', 'error') if r.get(k) is not None}
+                for name, r in products.items()
+            }
+
+    def _run_job(self, job: Dict[str, Any], frames: List[pd.DataFrame]):
+        start = time.perf_counter()
+        with tempfile.TemporaryDirectory(prefix=f"retrain_{job['id']}_") as work_dir:
+            job['work_dir'] = work_dir
+            job['data_file'] = self.data_file
+            job['models_dir'] = self.models_dir
+            new_data_path = os.path.join(work_dir, 'new_sales_data.csv')
+            pd.concat(frames, ignore_index=True).to_csv(new_data_path, index=False)
+
+            try:
+                logger.info(f" Job de retreino {job['id']} iniciado ({job['requests']} pedido(s), {job['rows']} linhas)")
+                report = self.runner(job, new_data_path, lambda status: self._update_progress(job, status))
+                retrained = [r['product_name'] for r in (report or {}).get('products', [])
+                             if r.get('status') == 'success']
+                cache = None
+                if self.on_models_updated and retrained:
+                    try:
+                        cache = self.on_models_updated(retrained, self.models_dir)
+                    except Exception as e:
+                        logger.warning(f"Erro ao atualizar o cache apos o retreino: {e}")
+                        cache = {'error': str(e)}
+                with self._condition:
+                    job['report'] = {k: v for k, v in (report or {}).items() if k != 'products'}
+                    job['cache'] = cache
+                    job['status'] = 'completed'
+            except Exception as e:
+                logger.error(f"Job de retreino {job['id']} falhou: {e}")
+                with self._condition:
+                    job['status'] = 'failed'
+                    job['error'] = str(e)
+            finally:
+                with self._condition:
+                    job['finished_at'] = datetime.now().isoformat()
+                    job['duration_s'] = round(time.perf_counter() - start, 3)
+                    job.pop('work_dir', None)
+                logger.info(f" Job de retreino {job['id']} finalizado: {job['status']}")
+
+
+# Fila global usada pelo ai_service
+training_queue = TrainingJobQueue()
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Execucao paralela do treinamento por produto.
+Cada produto e um job independente distribuido em um pool de processos, com
+numero de workers e limite de memoria por job configuraveis. Falhas ficam
+isoladas no relatorio do produto e nao interrompem os demais.
+"""
+
+import atexit
+import json
+import os
+import random
+import threading
+import time
+import traceback
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from product_name_utils import normalize_product_name
+from sales_partition import PartitionSlice, ProductPartition
+
+REPORT_FILENAME = 'training_report.json'
+
+# Frame particionado disponivel no processo worker (ver run_product_jobs)
+_worker_partition: Optional[ProductPartition] = None
+
+# Pool de processos compartilhado pelas dobras de validacao cruzada
+_shared_pool = None
+_shared_pool_pid = None
+_shared_pool_lock = threading.Lock()
+
+
+def resolve_workers(workers: Optional[int] = None, n_jobs: Optional[int] = None) -> int:
+    """Workers efetivos: argumento, AI_TRAINING_WORKERS ou numero de CPUs (0 = CPUs)."""
+    if workers is None:
+        workers = int(os.getenv('AI_TRAINING_WORKERS', 0))
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    if n_jobs is not None:
+        workers = min(workers, max(1, n_jobs))
+    return workers
+
+
+def resolve_max_memory_mb(max_memory_mb: Optional[float] = None) -> float:
+    """Limite de memoria por job em MB (AI_TRAINING_MAX_MEMORY_MB, 0 = sem limite)."""
+    if max_memory_mb is None:
+        max_memory_mb = float(os.getenv('AI_TRAINING_MAX_MEMORY_MB', 0))
+    return max(0.0, float(max_memory_mb))
+
+
+def resolve_parallel_mode(parallel_mode: Optional[str], n_jobs: int, workers: int) -> str:
+    """
+    'products' distribui produtos entre os workers; 'folds' treina os produtos
+    em sequencia e distribui as dobras de CV no pool compartilhado. Em 'auto'
+    (AI_TRAINING_PARALLEL_MODE) usa 'folds' quando ha menos produtos que workers.
+    """
+    parallel_mode = parallel_mode or os.getenv('AI_TRAINING_PARALLEL_MODE', 'auto')
+    if parallel_mode not in ('auto', 'products', 'folds'):
+        raise ValueError(f"Modo de paralelismo desconhecido: {parallel_mode}")
+    if workers <= 1:
+        return 'products'
+    if parallel_mode == 'auto':
+        return 'folds' if n_jobs < workers else 'products'
+    return parallel_mode
+
+
+def product_seed(product_name: str) -> int:
+    """Semente estavel por produto, independente da ordem de execucao."""
+    return zlib.crc32(normalize_product_name(product_name).encode('utf-8'))
+
+
+def _init_worker(max_memory_mb: float, partition=None):
+    """
+    Aplica o limite de memoria (espaco de enderecamento) no processo worker,
+    registra o frame particionado compartilhado pelos jobs e, no treino da
+    fila do servico, encerra o worker junto com o processo principal.
+    """
+    global _worker_partition
+    _worker_partition = partition
+    if os.getenv('AI_TRAINING_EXIT_WITH_PARENT') == 'true':
+        # Treino da fila do servico: o worker nao sobrevive (pausado) ao processo principal
+        from training_governor import exit_with_parent
+        exit_with_parent()
+    if not max_memory_mb:
+        return
+    try:
+        import resource
+        limit = int(max_memory_mb * 1024 * 1024)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ImportError, ValueError, OSError) as e:
+        # Windows nao possui o modulo resource; o treino segue sem limite
+        print(f"Aviso: limite de memoria por job nao aplicado: {e}")
+
+
+def _resolve_payload(payload: Any) -> Any:
+    """Troca a referencia PartitionSlice em payload['data'] pela fatia do frame do worker."""
+    if isinstance(payload, dict) and isinstance(payload.get('data'), PartitionSlice):
+        return dict(payload, data=_worker_partition.resolve(payload['data']))
+    return payload
+
+
+def _run_job(job_fn: Callable, product_name: str, payload: Any) -> Dict[str, Any]:
+    """Executa um job isolando excecoes no resultado do produto."""
+    seed = product_seed(product_name)
+    random.seed(seed)
+    np.random.seed(seed)
+
+    start = time.perf_counter()
+    result = {'product_name': product_name, 'pid': os.getpid()}
+    try:
+        result.update(job_fn(product_name, _resolve_payload(payload)) or {})
+        result['status'] = 'success'
+    except MemoryError:
+        result['status'] = 'failed'
+        result['error'] = 'MemoryError: limite de memoria do job excedido'
+    except Exception as e:
+        result['status'] = 'failed'
+        result['error'] = f"{type(e).__name__}: {e}"
+        result['traceback'] = traceback.format_exc()
+    result['duration_s'] = round(time.perf_counter() - start, 3)
+    return result
+
+
+def run_product_jobs(job_fn: Callable, jobs: List[Tuple[str, Any]], workers: Optional[int] = None,
+                     max_memory_mb: Optional[float] = None,
+                     on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+                     partition: Optional[ProductPartition] = None) -> List[Dict[str, Any]]:
+    """
+    Executa `job_fn(product_name, payload)` para cada job.
+
+    Com um unico worker os jobs rodam no proprio processo (sem limite de
+    memoria). `on_result` e chamado no processo principal a cada produto
+    concluido. Com `partition`, os payloads podem trazer em 'data' apenas um
+    PartitionSlice: o frame particionado e entregue uma vez a cada worker, e
+    nao a cada job, que recebe so os offsets do seu produto. Com fork (Linux)
+    os workers herdam o frame sem copia; com spawn (Windows/macOS) cada worker
+    recebe uma copia serializada na inicializacao. Os resultados sao
+    devolvidos em ordem alfabetica de produto, independente da ordem de
+    conclusao.
+    """
+    global _worker_partition
+    workers = resolve_workers(workers, len(jobs))
+    max_memory_mb = resolve_max_memory_mb(max_memory_mb)
+    results = []
+
+    if workers <= 1:
+        _worker_partition = partition
+        try:
+            for product_name, payload in jobs:
+                results.append(_run_job(job_fn, product_name, payload))
+                if on_result:
+                    on_result(results[-1])
+        finally:
+            _worker_partition = None
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(max_memory_mb, partition)) as executor:
+            futures = {
+                executor.submit(_run_job, job_fn, product_name, payload): product_name
+                for product_name, payload in jobs
+            }
+            for future in as_completed(futures):
+                product_name = futures[future]
+                try:
+                    results.append(future.result())
+                except BrokenProcessPool:
+                    # O worker morreu (OOM killer, sinal); o pool nao aceita mais jobs
+                    results.append({
+                        'product_name': product_name,
+                        'status': 'failed',
+                        'error': 'Worker encerrado durante o treino (possivel limite de memoria)'
+                    })
+                except Exception as e:
+                    results.append({
+                        'product_name': product_name,
+                        'status': 'failed',
+                        'error': f"{type(e).__name__}: {e}"
+                    })
+                if on_result:
+                    on_result(results[-1])
+
+    return sorted(results, key=lambda r: normalize_product_name(r['product_name']))
+
+
+def get_shared_pool(workers: Optional[int] = None, max_memory_mb: Optional[float] = None) -> ProcessPoolExecutor:
+    """
+    Pool de processos de longa duracao para tarefas de validacao cruzada.
+
+    E criado uma unica vez por processo e reaproveitado por todas as
+    configuracoes e produtos do treino, pagando o custo de inicializacao
+    dos workers apenas uma vez. Compativel com o `parallel` do Prophet
+    (possui `.map`).
+    """
+    global _shared_pool, _shared_pool_pid
+    with _shared_pool_lock:
+        if _shared_pool is None or _shared_pool_pid != os.getpid():
+            _shared_pool = ProcessPoolExecutor(
+                max_workers=resolve_workers(workers),
+                initializer=_init_worker,
+                initargs=(resolve_max_memory_mb(max_memory_mb),)
+            )
+            _shared_pool_pid = os.getpid()
+        return _shared_pool
+
+
+def shutdown_shared_pool():
+    """Encerra o pool compartilhado (chamado tambem na saida do processo)."""
+    global _shared_pool, _shared_pool_pid
+    with _shared_pool_lock:
+        if _shared_pool is not None and _shared_pool_pid == os.getpid():
+            _shared_pool.shutdown(wait=True, cancel_futures=True)
+        _shared_pool = None
+        _shared_pool_pid = None
+
+
+atexit.register(shutdown_shared_pool)
+
+
+def build_training_report(results: List[Dict[str, Any]], source: str, workers: int,
+                          wall_time_s: float) -> Dict[str, Any]:
+    """Resumo por produto (sucesso/falha) de uma execucao de treino."""
+    succeeded = [r['product_name'] for r in results if r.get('status') == 'success']
+    skipped = [r['product_name'] for r in results if r.get('status') == 'skipped']
+    failed = [r['product_name'] for r in results if r.get('status') not in ('success', 'skipped')]
+    cpu_time_s = sum(r.get('duration_s', 0) for r in results)
+    return {
+        'source': source,
+        'finished_at': datetime.now().isoformat(),
+        'workers': workers,
+        'total': len(results),
+        'succeeded': len(succeeded),
+        'skipped': len(skipped),
+        'failed': len(failed),
+        'failed_products': failed,
+        'wall_time_s': round(wall_time_s, 3),
+        'sum_job_time_s': round(cpu_time_s, 3),
+        'products': [{k: v for k, v in r.items() if k != 'traceback'} for r in results]
+    }
+
+
+def write_training_report(models_dir: str, report: Dict[str, Any]) -> str:
+    """Grava o relatorio do ultimo treino em models_dir (escrita atomica)."""
+    path = os.path.join(models_dir, REPORT_FILENAME)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_training_report(models_dir: str) -> Optional[Dict[str, Any]]:
+    """Relatorio do ultimo treino gravado em models_dir (None se ainda nao houver)."""
+    path = os.path.join(models_dir, REPORT_FILENAME)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def print_training_report(report: Dict[str, Any]):
+    """Resumo legivel no console."""
+    print(f"Treino concluido: {report['succeeded']}/{report['total']} produtos "
+          f"({report.get('skipped', 0)} inalterados) em "
+          f"{report['wall_time_s']:.1f}s com {report['workers']} worker(s) "
+          f"(soma dos jobs: {report['sum_job_time_s']:.1f}s)")
+    export = report.get('export') or {}
+    if export.get('products'):
+        print(f"Modelos enxutos: {export['full_bytes'] / 1024:.0f} KB -> {export['slim_bytes'] / 1024:.0f} KB "
+              f"(-{export['size_reduction_pct']}%), carga {export['full_load_ms']:.1f} ms -> "
+              f"{export['slim_load_ms']:.1f} ms")
+    if export.get('compact_bytes'):
+        print(f"Formato compacto: {export['compact_bytes'] / 1024:.0f} KB, carga {export['compact_load_ms']:.1f} ms")
+    engines = report.get('engines')
+    if engines and engines.get('engines'):
+        print(f"Engines: {engines['engines']} ({engines['prophet_skipped']} produto(s) sem ajuste do Prophet, "
+              f"tolerancia {engines['tolerance']:.0%} em {engines['metric']})")
+    intermittent = report.get('intermittent')
+    if intermittent and intermittent.get('products'):
+        print(f"Modelo intermitente: {intermittent['products']} produto(s) {intermittent['methods']}, "
+              f"ajuste total {intermittent['fit_us']:.0f} us")
+    baselines = report.get('baselines')
+    if baselines and baselines.get('compared'):
+        print(f"Baselines: {baselines['models_beating_baseline']}/{baselines['compared']} modelo(s) "
+              f"superam o melhor baseline (MAE, {baselines['horizon_days']} dias)")
+    pack = report.get('model_pack')
+    if pack:
+        print(f"Pacote de modelos: {pack['products']} produto(s), {pack['bytes'] / 1024:.0f} KB em {pack['path']}")
+    for result in report['products']:
+        if result.get('status') == 'success':
+            print(f"  OK    {result['product_name']} ({result.get('duration_s', 0):.1f}s)")
+        elif result.get('status') == 'skipped':
+            print(f"  --    {result['product_name']}: {result.get('reason')}")
+        else:
+            print(f"  FALHA {result['product_name']}: {result.get('error')}")
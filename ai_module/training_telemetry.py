@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Telemetria estruturada do treino por produto.
+Cada job mede tempo de parede e CPU por etapa (busca, ajuste, avaliacao,
+gravacao), iteracoes do otimizador do Stan e pico de memoria, e grava o
+resultado em prophet_telemetry_<produto>.json ao lado de
+prophet_params_<produto>.json. O relatorio da execucao agrega os produtos
+para mostrar quem domina o custo do treino.
+
+A CPU inclui os processos CmdStan filhos do job; dobras de validacao cruzada
+executadas no pool compartilhado contam apenas no tempo de parede. O pico de
+memoria e o do processo do job (VmHWM, zerado no inicio do job no Linux).
+"""
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from product_name_utils import get_normalized_filename
+
+try:
+    import resource
+except ImportError:  # Windows: sem getrusage, CPU dos filhos e pico de memoria ficam indisponiveis
+    resource = None
+
+TOP_PRODUCTS = 5
+
+
+def _maxrss_mb(usage) -> float:
+    # ru_maxrss e em KB no Linux e em bytes no macOS
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return usage.ru_maxrss / divisor
+
+
+def _reset_peak_rss():
+    """Zera o pico de RSS do processo (Linux), para medir apenas o job atual."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource is not None:
+        return _maxrss_mb(resource.getrusage(resource.RUSAGE_SELF))
+    return None
+
+
+def _cpu_seconds() -> float:
+    """CPU do processo mais a dos filhos ja finalizados (CmdStan)."""
+    cpu = time.process_time()
+    if resource is not None:
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        cpu += children.ru_utime + children.ru_stime
+    return cpu
+
+
+class TrainingTelemetry:
+    """Coleta a telemetria de um job de treino."""
+
+    def __init__(self, product_name: str):
+        self.product_name = product_name
+        self.started_at = datetime.now().isoformat()
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, Any] = {}
+        _reset_peak_rss()
+        self._start_wall = time.perf_counter()
+        self._start_cpu = _cpu_seconds()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Mede tempo de parede e CPU de uma etapa (acumula se repetida)."""
+        wall, cpu = time.perf_counter(), _cpu_seconds()
+        try:
+            yield
+        finally:
+            entry = self.stages.setdefault(name, {'wall_s': 0.0, 'cpu_s': 0.0})
+            entry['wall_s'] += time.perf_counter() - wall
+            entry['cpu_s'] += _cpu_seconds() - cpu
+
+    def record(self, **counters):
+        """Contadores do job (ex.: stan_iterations, search_fits)."""
+        self.counters.update({k: v for k, v in counters.items() if v is not None})
+
+    def finish(self) -> Dict[str, Any]:
+        peak_rss = _peak_rss_mb()
+        return {
+            'product_name': self.product_name,
+            'pid': os.getpid(),
+            'started_at': self.started_at,
+            'finished_at': datetime.now().isoformat(),
+            'wall_time_s': round(time.perf_counter() - self._start_wall, 3),
+            'cpu_time_s': round(_cpu_seconds() - self._start_cpu, 3),
+            'peak_rss_mb': round(peak_rss, 1) if peak_rss is not None else None,
+            'stages': {name: {k: round(v, 3) for k, v in entry.items()} for name, entry in self.stages.items()},
+            **self.counters
+        }
+
+
+def telemetry_path(models_dir: str, product_name: str) -> str:
+    return os.path.join(models_dir, get_normalized_filename(product_name, 'telemetry'))
+
+
+def write_telemetry(models_dir: str, telemetry: Dict[str, Any]) -> str:
+    """Grava a telemetria do produto ao lado de prophet_params_*.json."""
+    path = telemetry_path(models_dir, telemetry['product_name'])
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(telemetry, f, indent=4, ensure_ascii=False, default=str)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_telemetry(models_dir: str, product_name: str) -> Optional[Dict[str, Any]]:
+    path = telemetry_path(models_dir, product_name)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def summarize_telemetry(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Agrega a telemetria dos produtos treinados: totais por etapa, CPU, memoria e produtos mais caros."""
+    entries = [r['telemetry'] for r in results if r.get('telemetry')]
+    stages: Dict[str, Dict[str, float]] = {}
+    for entry in entries:
+        for name, stage in entry.get('stages', {}).items():
+            total = stages.setdefault(name, {'wall_s': 0.0, 'cpu_s': 0.0})
+            total['wall_s'] += stage['wall_s']
+            total['cpu_s'] += stage['cpu_s']
+
+    peaks = [e['peak_rss_mb'] for e in entries if e.get('peak_rss_mb') is not None]
+    iterations = [e['stan_iterations'] for e in entries if e.get('stan_iterations') is not None]
+    costliest = sorted(entries, key=lambda e: e['wall_time_s'], reverse=True)[:TOP_PRODUCTS]
+    return {
+        'products': len(entries),
+        'wall_time_s': round(sum(e['wall_time_s'] for e in entries), 3),
+        'cpu_time_s': round(sum(e['cpu_time_s'] for e in entries), 3),
+        'peak_rss_mb': max(peaks) if peaks else None,
+        'stan_iterations': sum(iterations) if iterations else None,
+        'stages': {name: {k: round(v, 3) for k, v in total.items()} for name, total in stages.items()},
+        'costliest_products': [
+            {'product_name': e['product_name'], 'wall_time_s': e['wall_time_s'], 'cpu_time_s': e['cpu_time_s']}
+            for e in costliest
+        ]
+    }
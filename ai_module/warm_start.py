@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Warm start dos ajustes Prophet.
+Inicializa o otimizador do Stan com os parametros do modelo anterior do
+mesmo produto quando a estrutura do modelo nao mudou; caso contrario (ou se
+o ajuste aquecido falhar) faz o ajuste a frio. Ambos os caminhos reportam
+tempo de ajuste e numero de iteracoes do otimizador.
+"""
+
+import logging
+import os
+import pickle
+import re
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+import model_format
+
+logger = logging.getLogger(__name__)
+
+# Linhas de progresso do L-BFGS ("  99  878.27 ...") e do Newton ("Iteration  3. ...")
+_ITERATION_LINE = re.compile(r'^\s*(?:Iteration\s+)?(\d+)(?:\.|\s+-?[\d.]+(?:e[-+]?\d+)?\s)')
+
+
+def load_previous_model(model_path: str):
+    """Modelo salvo anteriormente, compacto ou pickle (None se nao existir ou nao puder ser lido)."""
+    if not os.path.exists(model_path):
+        return None
+    try:
+        with open(model_path, 'rb') as f:
+            payload = f.read()
+        if model_format.is_compact(payload):
+            return model_format.from_bytes(payload)
+        return pickle.loads(payload)
+    except Exception as e:
+        logger.warning(f"Modelo anterior ilegivel em {model_path}: {e}")
+        return None
+
+
+def stan_init(model) -> Dict[str, Any]:
+    """Parametros do ajuste anterior no formato de `init` do Stan."""
+    params = model.params
+    return {
+        'k': float(params['k'][0][0]),
+        'm': float(params['m'][0][0]),
+        'sigma_obs': float(params['sigma_obs'][0][0]),
+        'delta': np.asarray(params['delta'][0], dtype=float),
+        'beta': np.asarray(params['beta'][0], dtype=float),
+    }
+
+
+def _structure(model) -> Tuple:
+    """
+    Configuracao que define a estrutura do modelo. As sazonalidades
+    automaticas so sao resolvidas no fit; a compatibilidade final das
+    dimensoes e conferida depois do ajuste.
+    """
+    regressors = tuple(sorted(
+        (name, props['mode'], props['standardize']) for name, props in model.extra_regressors.items()
+    ))
+    holidays = None
+    if model.holidays is not None:
+        holidays = tuple(sorted(model.holidays['holiday'].unique()))
+    return (
+        model.growth, model.n_changepoints, model.seasonality_mode,
+        str(model.yearly_seasonality), str(model.weekly_seasonality), str(model.daily_seasonality),
+        regressors, holidays
+    )
+
+
+def incompatibility_reason(previous_model, new_model) -> Optional[str]:
+    """Motivo para nao aquecer o ajuste (None se a estrutura e compativel)."""
+    if previous_model is None:
+        return 'sem modelo anterior'
+    if getattr(previous_model, 'params', None) is None or not previous_model.params:
+        return 'modelo anterior sem parametros ajustados'
+    if getattr(previous_model, 'mcmc_samples', 0):
+        return 'modelo anterior ajustado com MCMC'
+    if _structure(previous_model) != _structure(new_model):
+        return 'estrutura do modelo mudou'
+    if len(previous_model.params['delta'][0]) != new_model.n_changepoints:
+        return 'numero de changepoints mudou'
+    return None
+
+
+def optimizer_iterations(model) -> Optional[int]:
+    """Numero de iteracoes do otimizador, lido do log do CmdStan do ultimo ajuste."""
+    try:
+        stdout_files = model.stan_backend.stan_fit.runset.stdout_files
+    except AttributeError:
+        return None
+
+    iterations = None
+    for path in stdout_files:
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    match = _ITERATION_LINE.match(line)
+                    if match:
+                        iterations = int(match.group(1))
+        except OSError:
+            continue
+    return iterations
+
+
+def _timed_fit(model, df, **fit_kwargs) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    model.fit(df, **fit_kwargs)
+    return model, time.perf_counter() - start
+
+
+def fit_prophet(build_model: Callable[[], Any], df, previous_model=None,
+                warm_start: bool = True) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Ajusta um modelo novo criado por `build_model()`.
+
+    Com `warm_start` e um `previous_model` compativel, o otimizador parte dos
+    parametros anteriores; se o ajuste aquecido falhar, um modelo novo e
+    ajustado a frio (um objeto Prophet so pode ser ajustado uma vez).
+
+    Returns:
+        (modelo ajustado, {'mode', 'fit_time_s', 'iterations', 'cold_reason'})
+    """
+    model = build_model()
+    reason = incompatibility_reason(previous_model, model) if warm_start else 'warm start desativado'
+
+    if reason is None:
+        try:
+            model, elapsed = _timed_fit(model, df, init=stan_init(previous_model))
+            if model.params['beta'].shape != previous_model.params['beta'].shape or \
+                    model.params['delta'].shape != previous_model.params['delta'].shape:
+                # O Prophet descarta inits com dimensoes diferentes: na pratica, ajuste a frio
+                return model, {
+                    'mode': 'cold',
+                    'fit_time_s': round(elapsed, 3),
+                    'iterations': optimizer_iterations(model),
+                    'cold_reason': 'dimensoes dos parametros mudaram'
+                }
+            return model, {
+                'mode': 'warm',
+                'fit_time_s': round(elapsed, 3),
+                'iterations': optimizer_iterations(model),
+                'cold_reason': None
+            }
+        except Exception as e:
+            reason = f"falha no ajuste aquecido: {e}"
+            logger.warning(f"Warm start falhou, ajustando a frio: {e}")
+            model = build_model()
+
+    model, elapsed = _timed_fit(model, df)
+    return model, {
+        'mode': 'cold',
+        'fit_time_s': round(elapsed, 3),
+        'iterations': optimizer_iterations(model),
+        'cold_reason': reason
+    }
+
+
+def summarize_fit_stats(results) -> Dict[str, Any]:
+    """Tempo medio de ajuste e iteracoes medias por caminho (warm/cold)."""
+    summary = {}
+    for mode in ('warm', 'cold'):
+        stats = [r['fit'] for r in results if r.get('fit', {}).get('mode') == mode]
+        iterations = [s['iterations'] for s in stats if s.get('iterations') is not None]
+        summary[mode] = {
+            'count': len(stats),
+            'avg_fit_time_s': round(sum(s['fit_time_s'] for s in stats) / len(stats), 3) if stats else None,
+            'avg_iterations': round(sum(iterations) / len(iterations), 1) if iterations else None
+        }
+    return summary